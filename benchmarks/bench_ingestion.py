@@ -0,0 +1,81 @@
+"""시트 값 적재 방식(INGESTION_ENGINE=python | arrow)을 같은 데이터로 비교하는 벤치마크
+
+조회부터 컬럼 타입 최적화, 타임스탬프 변환, 검증까지(get_new_orders)의 시간과
+연락처 정규화/수량 추출 시간, 결과 DataFrame의 메모리 사용량을 출력한다.
+
+사용 예:
+    python benchmarks/bench_ingestion.py --rows 100000
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from bench_pipeline import generate_rows
+from config.config import Config
+from handlers.fake_sheet_backend import FakeSheetBackend
+from handlers.order_processor import OrderProcessor
+from handlers.sheet_handler import GoogleSheetHandler
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def run(engine: str, rows, projected: bool, runs: int):
+    os.environ['INGESTION_ENGINE'] = engine
+    os.environ['PROJECTED_FETCH'] = 'true' if projected else 'false'
+    config = Config()
+    backend = FakeSheetBackend()
+    backend.add_spreadsheet(config.SPREADSHEET_NAME, rows)
+
+    fetch, phones, quantities = [], [], []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as state_dir:
+            os.environ['TANGERINE_STATE_DIR'] = state_dir
+            handler = GoogleSheetHandler(Config(), backend=backend)
+            handler.scheduler.sleep = lambda seconds: None
+            df, seconds = timed(handler.get_new_orders)
+        fetch.append(seconds)
+        phones.append(timed(OrderProcessor.format_phone_numbers, df['받으실분 연락처 (핸드폰번호)'])[1])
+        quantities.append(timed(OrderProcessor.get_quantities, df)[1])
+
+    memory = df.memory_usage(deep=True).sum() / 1024 / 1024
+    print(f"{engine:>6} projected={str(projected).lower():<5} "
+          f"get_new_orders={min(fetch):.3f}s phones={min(phones):.3f}s "
+          f"quantities={min(quantities):.3f}s memory={memory:.1f}MB new_orders={len(df)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시트 값 적재 방식 비교 벤치마크')
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--confirmed', type=int, default=0, help="'확인' 처리된 주문 수")
+    parser.add_argument('--runs', type=int, default=3, help='반복 횟수 (가장 빠른 값 출력)')
+    args = parser.parse_args()
+
+    # 전체 조회 경로를 측정 (워터마크/스냅샷 캐시 없이 매번 같은 범위를 적재)
+    os.environ['FETCH_MODE'] = 'full'
+    os.environ['SNAPSHOT_CACHE_ENABLED'] = 'false'
+    os.environ.pop('SPREADSHEET_ID', None)
+    os.environ.pop('SPREADSHEET_SOURCES', None)
+    os.environ.setdefault('DEFAULT_SENDER_NAME', '기본 발송인')
+    os.environ.setdefault('DEFAULT_SENDER_ADDRESS', '제주시 기본로 1')
+    os.environ.setdefault('DEFAULT_SENDER_PHONE', '01000000000')
+    # 행별 검증 경고 등 로그 출력이 측정을 방해하지 않도록 끔
+    logging.disable(logging.WARNING)
+
+    rows = generate_rows(args.rows, args.confirmed)
+    print(f"rows={args.rows} confirmed={args.confirmed} runs={args.runs}")
+    for projected in (False, True):
+        for engine in ('python', 'arrow'):
+            run(engine, rows, projected, args.runs)
+
+
+if __name__ == '__main__':
+    main()
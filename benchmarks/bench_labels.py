@@ -0,0 +1,87 @@
+"""라벨 렌더링 벤치마크: 행마다 Series를 만드는 iterrows 방식과 컬럼 기반 렌더링 비교
+
+받는사람 블록을 iterrows로 렌더링하는 기존 방식(참고 구현)과 LabelFormatter의 컬럼 기반
+렌더링 결과가 바이트 단위로 같은지 확인하고, 각각의 시간과 format_labels 전체 시간을 출력한다.
+
+사용 예:
+    python benchmarks/bench_labels.py --sizes 10000 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import pandas as pd
+from gspread.utils import numericise_all
+
+from bench_pipeline import generate_rows
+from config.config import Config
+from formatters.label_formatter import LabelFormatter
+from handlers.order_processor import OrderProcessor
+from handlers.sheet_handler import GoogleSheetHandler
+
+
+def make_orders(count: int) -> pd.DataFrame:
+    """get_all_records와 같은 규칙으로 변환한 새 주문 DataFrame"""
+    rows = generate_rows(count, 0)
+    df = pd.DataFrame([numericise_all(row) for row in rows[1:]], columns=rows[0])
+    df['타임스탬프'] = GoogleSheetHandler._parse_korean_timestamps(df['타임스탬프'])[0]
+    return df
+
+
+def render_recipients_iterrows(df: pd.DataFrame, product_types: pd.Series) -> list:
+    """행마다 pd.Series를 만들어 받는사람 블록을 렌더링하던 방식 (비교용 참고 구현)"""
+    blocks = []
+    for position, (_, row) in enumerate(df.iterrows()):
+        recipient_address = row.get('받으실분 주소 (도로명 주소로 부탁드려요)', '')
+        recipient_name = row.get('받으실분 성함', '')
+        recipient_phone = OrderProcessor.format_phone_number(str(row.get('받으실분 연락처 (핸드폰번호)', '')))
+        block = f"받는사람\n{recipient_address} {recipient_name} {recipient_phone}\n주문상품\n"
+        product = product_types.iloc[position]
+        if pd.notna(product):
+            block += f"{product} / {OrderProcessor.get_quantity(row)}박스\n\n"
+        blocks.append(block)
+    return blocks
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def run(count: int, formatter: LabelFormatter):
+    df = make_orders(count)
+    product_types = formatter.catalog.classify(df['상품 선택'])
+    quantities = OrderProcessor.get_quantities(df)
+
+    legacy, legacy_seconds = timed(render_recipients_iterrows, df, product_types)
+    columns, columns_seconds = timed(OrderProcessor.order_columns, df, product_types, quantities)
+    columnar, render_seconds = timed(formatter._render_recipients, columns)
+    if ''.join(columnar) != ''.join(legacy):
+        raise AssertionError('columnar rendering differs from the iterrows reference')
+
+    _, total_seconds = timed(formatter.format_labels, df)
+    columnar_seconds = columns_seconds + render_seconds
+    print(f"orders={count:>7,} iterrows={legacy_seconds:.3f}s "
+          f"columnar={columnar_seconds:.3f}s (columns {columns_seconds:.3f}s + render {render_seconds:.3f}s) "
+          f"speedup={legacy_seconds / columnar_seconds:.1f}x format_labels={total_seconds:.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='라벨 렌더링 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    args = parser.parse_args()
+
+    os.environ.setdefault('DEFAULT_SENDER_NAME', '기본 발송인')
+    os.environ.setdefault('DEFAULT_SENDER_ADDRESS', '제주시 기본로 1')
+    os.environ.setdefault('DEFAULT_SENDER_PHONE', '01000000000')
+    formatter = LabelFormatter(Config())
+    for count in args.sizes:
+        run(count, formatter)
+
+
+if __name__ == '__main__':
+    main()
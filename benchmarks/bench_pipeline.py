@@ -0,0 +1,97 @@
+"""FakeSheetBackend로 주문 처리 전체 과정을 네트워크 없이 측정하는 벤치마크
+
+사용 예:
+    python benchmarks/bench_pipeline.py --rows 5000 --latency 0.05 --quota-error-rate 0.05
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from config.config import Config
+from handlers.fake_sheet_backend import FakeSheetBackend
+
+HEADER = [
+    '타임스탬프', '비고', '보내는분 성함', '보내는분 주소 (도로명 주소로 부탁드려요)',
+    '보내는분 연락처 (핸드폰번호)', '받으실분 성함', '받으실분 주소 (도로명 주소로 부탁드려요)',
+    '받으실분 연락처 (핸드폰번호)', '상품 선택', '5kg 수량', '10kg 수량',
+]
+
+
+def generate_rows(count: int, confirmed: int):
+    """confirmed개는 '확인' 처리된 주문, 나머지는 새 주문인 시트 값 생성"""
+    rows = [HEADER]
+    for i in range(count):
+        day = i % 28 + 1
+        hour = i % 12 + 1
+        remark = '확인' if i < confirmed else ''
+        sender = i % 50
+        rows.append([
+            f'2024. 12. {day}. 오후 {hour}:{i % 60:02d}:00', remark,
+            f'보내는분{sender}', f'제주시 중앙로 {sender}', f'010{sender:08d}',
+            f'받는분{i}', f'서울시 종로 {i}', f'010{i:08d}',
+            '5kg' if i % 2 else '10kg', str(i % 3 + 1) if i % 2 else '', '' if i % 2 else str(i % 2 + 1),
+        ])
+    return rows
+
+
+def run(args):
+    from main import OrderManagementSystem
+
+    backend = FakeSheetBackend(latency=args.latency, quota_error_rate=args.quota_error_rate, seed=args.seed)
+    backend.add_spreadsheet(Config().SPREADSHEET_NAME, generate_rows(args.rows, args.confirmed))
+
+    system = OrderManagementSystem(backend=backend)
+    if args.no_throttle:
+        system.scheduler.sleep = lambda seconds: None
+
+    timings = []
+    for _ in range(args.runs):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            system.process_new_orders()
+        timings.append(time.perf_counter() - started)
+    system.close()
+
+    print(f"rows={args.rows} confirmed={args.confirmed} latency={args.latency}s "
+          f"quota_error_rate={args.quota_error_rate}")
+    for i, seconds in enumerate(timings, 1):
+        print(f"run {i}: {seconds:.3f}s")
+    print("backend calls:", dict(sorted(backend.call_counts.items())))
+    for name, metrics in sorted(system.scheduler.metrics.items()):
+        print(f"  {name}: calls={metrics.calls} retries={metrics.retries} "
+              f"failures={metrics.failures} throttled={metrics.throttled_seconds:.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='오프라인 주문 처리 벤치마크')
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--confirmed', type=int, default=None,
+                        help="'확인' 처리된 주문 수 (기본: 전체의 절반)")
+    parser.add_argument('--latency', type=float, default=0.0, help='API 호출당 지연(초)')
+    parser.add_argument('--quota-error-rate', type=float, default=0.0, help='429 오류 발생 확률')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--runs', type=int, default=2, help='반복 실행 횟수 (두 번째부터는 증분 조회)')
+    parser.add_argument('--no-throttle', action='store_true', help='쿼터 대기/백오프 없이 실행')
+    args = parser.parse_args()
+    if args.confirmed is None:
+        args.confirmed = args.rows // 2
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        # 실제 상태 파일(.tangerine)을 건드리지 않도록 임시 디렉토리 사용
+        os.environ['TANGERINE_STATE_DIR'] = state_dir
+        os.environ.pop('SPREADSHEET_ID', None)
+        os.environ.pop('SPREADSHEET_SOURCES', None)
+        os.environ.setdefault('DEFAULT_SENDER_NAME', '기본 발송인')
+        os.environ.setdefault('DEFAULT_SENDER_ADDRESS', '제주시 기본로 1')
+        os.environ.setdefault('DEFAULT_SENDER_PHONE', '01000000000')
+        run(args)
+
+
+if __name__ == '__main__':
+    main()
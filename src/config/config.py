@@ -1,6 +1,8 @@
+import copy
+import json
 import os
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, List
 try:
     from dotenv import load_dotenv
 except ModuleNotFoundError:  # pragma: no cover - allow running without package
@@ -28,6 +30,16 @@ class Config:
         self.CREDENTIALS_FILE = credentials_file
         self.CREDENTIALS_JSON = os.getenv('GOOGLE_CREDENTIALS_JSON')  # 선택적 JSON 문자열
         self.SPREADSHEET_NAME = "감귤 주문서(응답)"
+        # 설정되어 있으면 이름 검색 없이 키로 바로 연다
+        self.SPREADSHEET_ID = os.getenv('SPREADSHEET_ID')
+
+        # 함께 처리할 주문서 목록 (시즌/판매 채널별 주문서, 쉼표로 구분)
+        sources = os.getenv('SPREADSHEET_SOURCES', '')
+        self.SPREADSHEET_SOURCES = [
+            name.strip() for name in sources.split(',') if name.strip()
+        ] or [self.SPREADSHEET_NAME]
+        # 주문서를 동시에 처리할 최대 스레드 수
+        self.MAX_SOURCE_WORKERS = int(os.getenv('MAX_SOURCE_WORKERS', '4'))
 
         # 환경 변수에서 DEFAULT_SENDER 정보 로드
         self.DEFAULT_SENDER = {
@@ -36,11 +48,70 @@ class Config:
             'phone': os.getenv('DEFAULT_SENDER_PHONE', '')
         }
 
+        # 실행 간 상태(워터마크 등) 저장 위치
+        state_dir = os.getenv('TANGERINE_STATE_DIR', '.tangerine')
+        if not os.path.isabs(state_dir):
+            state_dir = os.path.join(self.ROOT_DIR, state_dir)
+        self.STATE_DIR = state_dir
+        self.STATE_FILE = os.path.join(state_dir, 'state.json')
+
+        # 주문 조회 방식: 'incremental' (워터마크 이후 범위만 조회) | 'full' (전체 조회)
+        #               | 'stream' (새 주문을 STREAM_CHUNK_SIZE 행씩 나눠 조회, 대용량 시트용)
+        self.FETCH_MODE = os.getenv('FETCH_MODE', 'incremental')
+        self.STREAM_CHUNK_SIZE = int(os.getenv('STREAM_CHUNK_SIZE', '1000'))
+
+        # 시트 값 적재 방식: 'python' (get_all_records와 같은 규칙, 숫자 셀은 int로 변환)
+        #                 | 'arrow' (pyarrow Table로 바로 적재, Arrow 문자열 dtype. pyarrow 필요)
+        self.INGESTION_ENGINE = os.getenv('INGESTION_ENGINE', 'python')
+
+        # 필수 컬럼(REQUIRED_COLUMNS)만 컬럼별 범위로 조회할지 여부
+        self.PROJECTED_FETCH = os.getenv('PROJECTED_FETCH', 'true').lower() == 'true'
+
+        # 시트 스냅샷 캐시 (리비전이 바뀌지 않았으면 데이터 조회 생략)
+        self.SNAPSHOT_CACHE_ENABLED = os.getenv('SNAPSHOT_CACHE_ENABLED', 'true').lower() == 'true'
+        self.SNAPSHOT_CACHE_DIR = os.path.join(state_dir, 'snapshots')
+        self.SNAPSHOT_MAX_ENTRIES = int(os.getenv('SNAPSHOT_MAX_ENTRIES', '5'))
+        self.SNAPSHOT_MAX_BYTES = int(os.getenv('SNAPSHOT_MAX_BYTES', str(50 * 1024 * 1024)))
+        self.SNAPSHOT_MAX_AGE_SECONDS = int(os.getenv('SNAPSHOT_MAX_AGE_SECONDS', str(7 * 24 * 3600)))
+
+        # Google Sheets API 쿼터 (사용자당 분당 요청 수) 및 재시도 횟수
+        self.SHEETS_READ_QUOTA_PER_MINUTE = int(os.getenv('SHEETS_READ_QUOTA_PER_MINUTE', '60'))
+        self.SHEETS_WRITE_QUOTA_PER_MINUTE = int(os.getenv('SHEETS_WRITE_QUOTA_PER_MINUTE', '60'))
+        self.SHEETS_MAX_RETRIES = int(os.getenv('SHEETS_MAX_RETRIES', '5'))
+
+        # 시트 핸들러: 'sync' (gspread) | 'async' (aiohttp, 요청 동시 전송)
+        self.SHEET_HANDLER = os.getenv('SHEET_HANDLER', 'sync')
+        self.ASYNC_MAX_CONNECTIONS = int(os.getenv('ASYNC_MAX_CONNECTIONS', '8'))
+
+        # '확인' 표시 시 batch_update 한 번에 보낼 최대 범위 수
+        self.CONFIRM_BATCH_SIZE = int(os.getenv('CONFIRM_BATCH_SIZE', '100'))
+
         self.PRODUCT_PRICES = {
             '5kg': 20000,
             '10kg': 35000
         }
 
+        # 상품 카탈로그: PRODUCT_CATALOG_FILE(JSON)이 있으면 그 상품 목록을, 없으면 PRODUCT_PRICES를 사용
+        # 항목 형식: {"name": "한라봉", "price": 45000, "patterns": ["한라봉"], "quantity_columns": ["한라봉 수량"]}
+        # (patterns 생략 시 name으로 검색, quantity_columns 생략 시 '5kg 수량'/'10kg 수량'에서 박스 수를 읽음)
+        catalog_file = os.getenv('PRODUCT_CATALOG_FILE')
+        if catalog_file:
+            if not os.path.isabs(catalog_file):
+                catalog_file = os.path.join(self.ROOT_DIR, catalog_file)
+            self.PRODUCT_CATALOG = self._load_product_catalog(catalog_file)
+            self.PRODUCT_PRICES = {product['name']: product['price'] for product in self.PRODUCT_CATALOG}
+        else:
+            self.PRODUCT_CATALOG = [
+                {'name': name, 'price': price} for name, price in self.PRODUCT_PRICES.items()
+            ]
+
+        # 라벨 레이아웃: LABEL_TEMPLATE_FILE(JSON)에 적은 섹션만 기본 레이아웃을 대체
+        # 형식: {"섹션 이름": "str.format 형식 템플릿"} (label_template.json.example 참고)
+        template_file = os.getenv('LABEL_TEMPLATE_FILE')
+        if template_file and not os.path.isabs(template_file):
+            template_file = os.path.join(self.ROOT_DIR, template_file)
+        self.LABEL_TEMPLATE = self._load_label_template(template_file) if template_file else {}
+
         # 필수 컬럼 정의
         self.REQUIRED_COLUMNS = [
             '타임스탬프',
@@ -55,6 +126,11 @@ class Config:
             '5kg 수량',
             '10kg 수량'
         ]
+        # 상품별 수량 컬럼도 필수 컬럼으로 조회
+        for product in self.PRODUCT_CATALOG:
+            for column in product.get('quantity_columns', ()):
+                if column not in self.REQUIRED_COLUMNS:
+                    self.REQUIRED_COLUMNS.append(column)
 
         # DEFAULT_SENDER 값 검증
         if not all(self.DEFAULT_SENDER.values()):
@@ -62,4 +138,45 @@ class Config:
                 "DEFAULT_SENDER 설정이 없습니다.\n"
                 "1. .env.example을 .env로 복사\n"
                 "2. .env 파일에 실제 정보를 입력하세요"
-            )
\ No newline at end of file
+            )
+
+    @staticmethod
+    def _load_product_catalog(path: str) -> List[Dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                catalog = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"상품 카탈로그 파일을 읽을 수 없습니다 ({path}): {str(e)}")
+
+        if not isinstance(catalog, list) or not catalog or not all(
+            isinstance(product, dict) and 'name' in product and 'price' in product for product in catalog
+        ):
+            raise ValueError(f"상품 카탈로그는 name과 price를 가진 항목의 목록이어야 합니다: {path}")
+        for product in catalog:
+            columns = product.get('quantity_columns', [])
+            if not isinstance(columns, list) or not all(isinstance(column, str) for column in columns):
+                raise ValueError(f"quantity_columns는 컬럼 이름의 목록이어야 합니다 ({product['name']}): {path}")
+        return catalog
+
+    @staticmethod
+    def _load_label_template(path: str) -> Dict[str, str]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                template = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"라벨 템플릿 파일을 읽을 수 없습니다 ({path}): {str(e)}")
+
+        if not isinstance(template, dict) or not all(
+            isinstance(key, str) and isinstance(value, str) for key, value in template.items()
+        ):
+            raise ValueError(f"라벨 템플릿은 섹션 이름과 템플릿 문자열의 객체여야 합니다: {path}")
+        return template
+
+    def for_source(self, spreadsheet_name: str) -> 'Config':
+        """주문서 하나를 처리할 설정 복사본"""
+        source_config = copy.copy(self)
+        source_config.SPREADSHEET_NAME = spreadsheet_name
+        if spreadsheet_name != self.SPREADSHEET_NAME:
+            # SPREADSHEET_ID는 기본 주문서에만 해당
+            source_config.SPREADSHEET_ID = None
+        return source_config
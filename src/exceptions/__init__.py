@@ -1,3 +1,3 @@
-from .exceptions import OrderProcessingError, SpreadsheetError, DataParsingError
+from .exceptions import OrderProcessingError, SpreadsheetError, DataParsingError, SheetsApiError
 
-__all__ = ['OrderProcessingError', 'SpreadsheetError', 'DataParsingError']
+__all__ = ['OrderProcessingError', 'SpreadsheetError', 'DataParsingError', 'SheetsApiError']
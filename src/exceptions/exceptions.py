@@ -8,4 +8,11 @@ class SpreadsheetError(OrderProcessingError):
 
 class DataParsingError(OrderProcessingError):
     """데이터 파싱 관련 예외"""
-    pass
\ No newline at end of file
+    pass
+
+class SheetsApiError(SpreadsheetError):
+    """Google Sheets/Drive API 오류 응답"""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(f"[{code}] {message}")
+        self.code = code
@@ -1,108 +1,204 @@
-from typing import List, Tuple
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple
+import numpy as np
 import pandas as pd
 from config.config import Config
+from formatters.label_template import LabelTemplate
 from handlers.order_processor import OrderProcessor
+from handlers.product_catalog import ProductCatalog
+from models.order_summary import OrderSummary
+from utils.address import canonical_keys, normalize_text
 
 class LabelFormatter:
     def __init__(self, config: Config):
         self.config = config
-        self.total_5kg = 0
-        self.total_10kg = 0
+        self.catalog = ProductCatalog.from_config(config)
+        self.template = LabelTemplate.from_config(config)
 
     def format_labels(self, df: pd.DataFrame) -> str:
-        if df.empty:
-            return "새로운 주문이 없습니다."
-
-        # 주문 처리 전 합계 초기화
-        self.total_5kg = 0
-        self.total_10kg = 0
-        
-        formatted_labels = []
-        df = df.sort_values('타임스탬프')
-        
-        # 날짜별 그룹화 및 라벨 생성
-        for date, date_group in df.groupby(df['타임스탬프'].dt.date):
-            formatted_labels.append(f"=== {date} ===\n")
-            
-            # 보내는 사람별 그룹화
-            sender_grouped = date_group.groupby([
-                '보내는분 성함', 
-                '보내는분 주소 (도로명 주소로 부탁드려요)', 
-                '보내는분 연락처 (핸드폰번호)'
-            ])
-            
-            # 보내는 사람별 처리
-            first_sender = True
-            for sender_info, sender_group in sender_grouped:
-                if not first_sender:
-                    formatted_labels.append("\n")
-                
-                formatted_labels.extend(self._format_sender_group(sender_info, sender_group))
-                first_sender = False
-            
-            formatted_labels.append("="*39 + "\n\n")
-
-        # 마지막에 총 주문 요약 추가
-        formatted_labels.extend([
-            "="*50 + "\n",
-            "주문 요약\n",
-            "-"*20 + "\n",
-            f"5kg 주문: {self.total_5kg}박스 ({self.total_5kg * self.config.PRODUCT_PRICES['5kg']:,}원)\n",
-            f"10kg 주문: {self.total_10kg}박스 ({self.total_10kg * self.config.PRODUCT_PRICES['10kg']:,}원)\n",
-            "-"*20 + "\n",
-            f"총 주문금액: {(self.total_5kg * self.config.PRODUCT_PRICES['5kg']) + (self.total_10kg * self.config.PRODUCT_PRICES['10kg']):,}원\n"
-        ])
-
-        return "".join(formatted_labels)
-
-    def _format_sender_group(self, sender_info: Tuple, sender_group: pd.DataFrame) -> List[str]:
-        sender_name, sender_address, sender_phone = sender_info
-        labels = ["보내는사람\n"]
-        
-        if self._is_valid_sender(sender_name, sender_address, sender_phone):
-            labels.append(
-                f"{sender_address} {sender_name} "
-                f"{OrderProcessor.format_phone_number(str(sender_phone))}\n\n"
-            )
-        else:
-            labels.append(
-                f"{self.config.DEFAULT_SENDER['address']} "
-                f"{self.config.DEFAULT_SENDER['name']} "
-                f"{self.config.DEFAULT_SENDER['phone']}\n\n"
-            )
-        
-        for _, row in sender_group.iterrows():
-            labels.extend(self._format_recipient(row))
-        
-        return labels
+        return "".join(self.format_labels_iter(df))
+
+    def write_labels(self, df: pd.DataFrame, out: TextIO) -> int:
+        """라벨을 만들어지는 대로 out(표준 출력 또는 파일)에 기록하고 기록한 글자 수 반환
+
+        전체 라벨을 하나의 문자열로 합치지 않으므로 대량 주문도 라벨 텍스트를 두 번 들고 있지 않는다.
+        """
+        return self.write_label_chunks([df], out)
+
+    def write_label_chunks(self, chunks: Iterable[pd.DataFrame], out: TextIO) -> int:
+        """format_chunks_iter의 라벨을 만들어지는 대로 out에 기록하고 기록한 글자 수 반환"""
+        written = 0
+        for chunk in self.format_chunks_iter(chunks):
+            out.write(chunk)
+            written += len(chunk)
+        out.flush()
+        return written
+
+    def format_labels_iter(self, df: pd.DataFrame) -> Iterator[str]:
+        """날짜 머리글, 발송인 그룹, 날짜 구분선, 주문 요약 단위로 라벨 텍스트를 차례로 반환
+
+        이어 붙이면 format_labels와 같은 텍스트다. 합계는 렌더링 전에 주문 전체에서 한 번에
+        집계해 두고 요약은 마지막에 반환한다. 인스턴스 상태를 바꾸지 않으므로 여러 스레드에서
+        같은 LabelFormatter를 함께 사용할 수 있다.
+        """
+        return self.format_chunks_iter([df])
+
+    def format_chunks_iter(self, chunks: Iterable[pd.DataFrame]) -> Iterator[str]:
+        """주문 청크(예: GoogleSheetHandler.iter_new_orders)마다 라벨을 렌더링하고
+        요약은 모든 청크의 합계로 마지막에 한 번 반환
+
+        한 번에 청크 하나만 렌더링하므로 메모리 사용량이 새 주문 수가 아닌 청크 크기에 비례한다.
+        날짜/발송인 그룹은 청크 안에서만 묶으므로, 청크 경계를 넘는 같은 그룹은 다음 청크에서
+        날짜 머리글부터 다시 시작한다. 청크가 하나면 format_labels_iter와 같다.
+        """
+        summary = OrderSummary()
+        empty = True
+        for df in chunks:
+            if df.empty:
+                continue
+            empty = False
+            df = df.sort_values('타임스탬프', kind='stable')
+
+            # 상품 분류와 수량은 컬럼 단위로 한 번에 계산해 합계와 라벨에 함께 사용
+            product_types, quantities = self._classify(df)
+            summary = summary + self.catalog.summarize(product_types, quantities)
+            yield from self._format_groups(df, product_types, quantities)
+
+        if empty:
+            yield self.template.empty()
+            return
+        # 마지막에 총 주문 요약 추가 (카탈로그의 상품별 수량과 금액)
+        yield self.format_summary(summary)
+
+    def _format_groups(self, df: pd.DataFrame, product_types: pd.Series,
+                       quantities: pd.Series) -> Iterator[str]:
+        """타임스탬프 순으로 정렬된 주문의 날짜 머리글, 발송인 그룹, 날짜 구분선"""
+        # 컬럼 값을 한 번에 꺼내 받는사람 블록을 전부 렌더링
+        columns = OrderProcessor.order_columns(df, product_types, quantities)
+        recipients = self._render_recipients(columns)
+        sender_keys = self._sender_keys(df, columns['sender_phone'])
+
+        # (날짜, 발송인) 순서로 한 번 정렬하고 그룹 경계만 따라가며 연속 구간 단위로 출력
+        order, spans = self._group_spans(df['타임스탬프'], sender_keys)
+        ordered_recipients = [recipients[position] for position in order]
+        for date, groups in spans:
+            yield self.template.date_header(date=date)
 
-    def _format_recipient(self, row: pd.Series) -> List[str]:
-        labels = ["받는사람\n"]
+            for i, (start, end) in enumerate(groups):
+                first = order[start]  # 그룹의 첫 주문에 입력된 표기로 출력
+                sender_info = (
+                    columns['sender_name'][first],
+                    columns['sender_address'][first],
+                    columns['sender_phone'][first],
+                )
+                labels = self._format_sender_group(sender_info, ordered_recipients[start:end])
+                yield ("" if i == 0 else self.template.sender_separator()) + "".join(labels)
 
-        # 안전한 컬럼 접근 with 기본값
-        recipient_address = row.get('받으실분 주소 (도로명 주소로 부탁드려요)', '')
-        recipient_name = row.get('받으실분 성함', '')
-        recipient_phone = row.get('받으실분 연락처 (핸드폰번호)', '')
+            yield self.template.date_footer()
 
-        labels.append(
-            f"{recipient_address} "
-            f"{recipient_name} "
-            f"{OrderProcessor.format_phone_number(str(recipient_phone))}\n"
+    def summarize(self, df: pd.DataFrame) -> OrderSummary:
+        """주문 묶음의 상품별 박스 수와 금액 (렌더링과 별개로 컬럼 단위 집계)"""
+        return self.catalog.summarize(*self._classify(df))
+
+    def format_summary(self, summary: OrderSummary) -> str:
+        lines = [self.template.summary_header()]
+        for product in summary.products:
+            lines.append(self.template.summary_line(
+                product=product.name, quantity=product.quantity,
+                price=product.price, revenue=product.revenue,
+            ))
+        lines.append(self.template.summary_footer(
+            total_quantity=summary.total_quantity, total_revenue=summary.total_revenue,
+        ))
+        return "".join(lines)
+
+    def _classify(self, df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+        """(상품 분류, 수량)"""
+        product_types = self.catalog.classify(
+            df['상품 선택'] if '상품 선택' in df.columns else pd.Series('', index=df.index)
         )
+        return product_types, self.catalog.extract_quantities(df, product_types)[0]
+
+    @staticmethod
+    def _sender_keys(df: pd.DataFrame, sender_phones: List) -> pd.DataFrame:
+        """발송인 그룹화 키 (이름/주소는 정규화, 연락처는 숫자만)"""
+        def column(name: str) -> pd.Series:
+            return df[name] if name in df.columns else pd.Series('', index=df.index, dtype=object)
+
+        phones = pd.Series(sender_phones, index=df.index, dtype=object)
+        return pd.DataFrame({
+            'name': canonical_keys(column('보내는분 성함'), normalize_text),
+            'address': canonical_keys(column('보내는분 주소 (도로명 주소로 부탁드려요)')),
+            'phone': phones.astype(str).str.replace(r'\D', '', regex=True),
+        }, index=df.index)
+
+    @staticmethod
+    def _group_spans(timestamps: pd.Series,
+                     sender_keys: pd.DataFrame) -> Tuple[np.ndarray, List[Tuple[date, List[Tuple[int, int]]]]]:
+        """날짜와 발송인 키를 합친 복합 키로 한 번만 정렬해 그룹 경계를 구함
 
-        labels.append("주문상품\n")
-        quantity = OrderProcessor.get_quantity(row)
+        (정렬된 행 위치, [(날짜, [(시작, 끝), ...]), ...])를 반환하며 시작/끝은 정렬된 위치 기준이다.
+        키는 각각 정렬된 코드로 바꿔 안정 정렬하므로 그룹 순서는 날짜 → 발송인 키 순이고,
+        그룹 안에서는 입력 순서(타임스탬프 순)가 유지된다. 타임스탬프가 없는 주문은 제외한다.
+        """
+        day_codes, days = pd.factorize(timestamps.dt.normalize(), sort=True)
+        codes = [day_codes] + [
+            pd.factorize(sender_keys[column], sort=True)[0] for column in sender_keys.columns
+        ]
+        order = np.lexsort(codes[::-1])  # lexsort는 마지막 키가 1순위이므로 역순으로 전달
+        order = order[day_codes[order] >= 0]
+        if not len(order):
+            return order, []
 
-        product_selection = str(row.get('상품 선택', ''))
-        if '5kg' in product_selection:
-            self.total_5kg += quantity
-            labels.append(f"5kg / {quantity}박스\n\n")
-        elif '10kg' in product_selection:
-            self.total_10kg += quantity
-            labels.append(f"10kg / {quantity}박스\n\n")
+        sorted_codes = np.vstack([code[order] for code in codes])
+        changed = (sorted_codes[:, 1:] != sorted_codes[:, :-1]).any(axis=0)
+        starts = np.flatnonzero(np.r_[True, changed])
+        ends = np.r_[starts[1:], len(order)]
 
+        spans = []
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            day = days[day_codes[order[start]]].date()
+            if not spans or spans[-1][0] != day:
+                spans.append((day, []))
+            spans[-1][1].append((start, end))
+        return order, spans
+
+    def _format_sender_group(self, sender_info: Tuple, recipients: List[str]) -> List[str]:
+        sender_name, sender_address, sender_phone = sender_info
+        if not self._is_valid_sender(sender_name, sender_address, sender_phone):
+            sender_name = self.config.DEFAULT_SENDER['name']
+            sender_address = self.config.DEFAULT_SENDER['address']
+            sender_phone = self.config.DEFAULT_SENDER['phone']
+
+        labels = [self.template.sender(
+            sender_name=sender_name, sender_address=sender_address, sender_phone=sender_phone,
+        )]
+        labels.extend(recipients)
         return labels
 
+    def _render_recipients(self, columns: Dict[str, list]) -> List[str]:
+        """주문별 받는사람 블록(기본 레이아웃은 '받는사람'/'주문상품')을 컬럼 값 목록에서 한 번에 렌더링
+
+        행마다 Series나 레코드 객체를 만들지 않고, 이미 정규화된 연락처와 추출된 수량 목록을
+        나란히 순회하며 컴파일된 템플릿을 호출한다. 상품 분류가 없는 주문은 product_line이 ''다.
+        """
+        recipient = self.template.recipient
+        product_line = self.template.product_line
+        return [
+            recipient(
+                recipient_address=address, recipient_name=name, recipient_phone=phone,
+                product_line=product_line(product=product, quantity=quantity) if product is not None else '',
+                product='' if product is None else product, quantity=quantity,
+            )
+            for address, name, phone, product, quantity in zip(
+                columns['recipient_address'],
+                columns['recipient_name'],
+                columns['recipient_phone'],
+                columns['product_type'],
+                columns['quantity'],
+            )
+        ]
+
     @staticmethod
     def _is_valid_sender(name: str, address: str, phone: str) -> bool:
         return all(
@@ -0,0 +1,91 @@
+from string import Formatter
+from typing import Callable, Dict, Optional
+
+from config.config import Config
+
+# 기본 라벨 레이아웃 (섹션 이름 → str.format 형식 템플릿)
+DEFAULT_LAYOUT = {
+    'empty': "새로운 주문이 없습니다.",
+    'date_header': "=== {date} ===\n",
+    'sender_separator': "\n",
+    'sender': "보내는사람\n{sender_address} {sender_name} {sender_phone}\n\n",
+    'recipient': "받는사람\n{recipient_address} {recipient_name} {recipient_phone}\n주문상품\n{product_line}",
+    'product_line': "{product} / {quantity}박스\n\n",
+    'date_footer': "=" * 39 + "\n\n",
+    'summary_header': "=" * 50 + "\n" + "주문 요약\n" + "-" * 20 + "\n",
+    'summary_line': "{product} 주문: {quantity}박스 ({revenue:,}원)\n",
+    'summary_footer': "-" * 20 + "\n" + "총 주문금액: {total_revenue:,}원\n",
+}
+
+# 섹션별로 쓸 수 있는 자리표시자
+SECTION_FIELDS = {
+    'empty': (),
+    'date_header': ('date',),
+    'sender_separator': (),
+    'sender': ('sender_name', 'sender_address', 'sender_phone'),
+    # product_line은 상품 분류가 있는 주문만 렌더링되고 없으면 ''
+    'recipient': ('recipient_name', 'recipient_address', 'recipient_phone',
+                  'product_line', 'product', 'quantity'),
+    'product_line': ('product', 'quantity'),
+    'date_footer': (),
+    'summary_header': (),
+    'summary_line': ('product', 'quantity', 'price', 'revenue'),
+    'summary_footer': ('total_quantity', 'total_revenue'),
+}
+
+
+def compile_section(section: str, text: str) -> Callable[..., str]:
+    """템플릿 문자열 하나를 키워드 인자로 호출하는 렌더링 함수로 컴파일
+
+    템플릿은 로드할 때 한 번만 파싱해 리터럴과 format() 호출을 이어 붙이는 식으로 바꾸므로
+    라벨마다 템플릿을 다시 해석하지 않는다. 자리표시자는 SECTION_FIELDS에 있는 이름만 허용하고
+    리터럴과 서식 지정자는 repr()로 넣기 때문에 템플릿 파일의 내용이 코드로 실행되지 않는다.
+    """
+    fields = SECTION_FIELDS[section]
+    pieces = []
+    try:
+        parsed = list(Formatter().parse(text))
+    except ValueError as e:
+        raise ValueError(f"Invalid label template section '{section}': {str(e)}")
+
+    for literal, field, spec, conversion in parsed:
+        if literal:
+            pieces.append(repr(literal))
+        if field is None:
+            continue
+        if field not in fields:
+            raise ValueError(
+                f"Unknown placeholder '{{{field}}}' in label template section '{section}' "
+                f"(allowed: {', '.join(fields) or 'none'})"
+            )
+        if conversion or '{' in spec:
+            raise ValueError(f"Unsupported placeholder '{{{field}}}' in label template section '{section}'")
+        pieces.append(f"format({field}, {spec!r})")
+
+    params = ', '.join(['*'] + [f"{field}=''" for field in fields]) if fields else ''
+    source = f"lambda {params}: " + (' + '.join(pieces) or "''")
+    code = compile(source, f"<label template: {section}>", 'eval')
+    return eval(code, {'__builtins__': {}, 'format': format})
+
+
+class LabelTemplate:
+    """섹션별로 컴파일된 라벨 레이아웃
+
+    LABEL_TEMPLATE_FILE(JSON)에 섹션 이름과 템플릿을 적으면 해당 섹션만 기본 레이아웃을 대체한다.
+    예: {"recipient": "{recipient_name} {recipient_phone} {recipient_address} {product} {quantity}\\n"}
+    """
+
+    def __init__(self, layout: Optional[Dict[str, str]] = None):
+        layout = layout or {}
+        unknown = sorted(set(layout) - set(SECTION_FIELDS))
+        if unknown:
+            raise ValueError(f"Unknown label template sections: {', '.join(unknown)}")
+
+        # 섹션마다 self.<섹션 이름>(**값)으로 호출하는 렌더링 함수
+        self.layout = {**DEFAULT_LAYOUT, **layout}
+        for section in SECTION_FIELDS:
+            setattr(self, section, compile_section(section, self.layout[section]))
+
+    @classmethod
+    def from_config(cls, config: Config) -> 'LabelTemplate':
+        return cls(config.LABEL_TEMPLATE)
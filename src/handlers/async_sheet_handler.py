@@ -0,0 +1,259 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from gspread.utils import absolute_range_name, rowcol_to_a1
+
+try:
+    import aiohttp
+except ModuleNotFoundError:  # pragma: no cover - 선택 의존성
+    aiohttp = None
+
+from config.config import Config
+from exceptions.exceptions import SpreadsheetError, DataParsingError, SheetsApiError
+from handlers.request_scheduler import RequestScheduler
+from handlers.sheet_handler import GoogleSheetHandler
+
+SHEETS_API_URL = 'https://sheets.googleapis.com/v4/spreadsheets'
+DRIVE_API_URL = 'https://www.googleapis.com/drive/v3/files'
+
+
+class AsyncGoogleSheetHandler(GoogleSheetHandler):
+    """asyncio 기반 시트 핸들러
+
+    GoogleSheetHandler와 같은 공개 메서드(get_new_orders, mark_orders_as_confirmed)를
+    제공한다. Sheets/Drive REST API를 aiohttp 세션 하나로 호출해 연결을 재사용하고,
+    서로 의존하지 않는 요청(리비전, 헤더 행, 워터마크 셀)은 동시에 보낸다.
+    '확인' 표시 배치는 순서가 중요하므로 행 번호 순서대로 하나씩 보낸다.
+    """
+
+    def __init__(self, config: Config, scheduler: Optional[RequestScheduler] = None):
+        if aiohttp is None:
+            raise SpreadsheetError("aiohttp is required for the async sheet handler (pip install aiohttp)")
+        if config.FETCH_MODE == 'stream':
+            # iter_new_orders는 gspread 워크시트로 청크를 읽으므로 async 핸들러에서는 쓸 수 없음
+            raise SpreadsheetError("FETCH_MODE=stream is not supported by the async sheet handler")
+        super().__init__(config, scheduler)
+        self.worksheet_title = None
+        self._loop = asyncio.new_event_loop()
+        self._session = None
+
+    def close(self):
+        if self._session is not None and not self._session.closed:
+            self._loop.run_until_complete(self._session.close())
+        self._loop.close()
+
+    def _run(self, coroutine):
+        return self._loop.run_until_complete(coroutine)
+
+    # --- HTTP ---
+
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.config.ASYNC_MAX_CONNECTIONS),
+                timeout=aiohttp.ClientTimeout(total=60),
+            )
+        return self._session
+
+    def _access_token(self) -> str:
+        # oauth2client는 만료된 토큰을 자동으로 갱신한다
+        return self.credentials.get_access_token().access_token
+
+    async def _request(self, kind: str, name: str, method: str, url: str, **kwargs) -> Dict:
+        async def send():
+            session = await self._get_session()
+            headers = {'Authorization': f"Bearer {self._access_token()}"}
+            try:
+                async with session.request(method, url, headers=headers, **kwargs) as response:
+                    body = await response.json(content_type=None)
+                    if response.status >= 400:
+                        error = body.get('error', {}) if isinstance(body, dict) else {}
+                        raise SheetsApiError(response.status, error.get('message', response.reason))
+                    return body or {}
+            except aiohttp.ClientConnectionError as e:
+                raise ConnectionError(str(e)) from e
+
+        return await self.scheduler.call_async(kind, name, send)
+
+    async def _batch_get(self, ranges: List[str]) -> List[List[List]]:
+        if not ranges:
+            return []
+        params = [('ranges', absolute_range_name(self.worksheet_title, a1)) for a1 in ranges]
+        params += [('majorDimension', 'ROWS'), ('valueRenderOption', 'FORMATTED_VALUE')]
+        body = await self._request(
+            'read', 'batch_get', 'GET',
+            f"{SHEETS_API_URL}/{self.spreadsheet_id}/values:batchGet", params=params,
+        )
+        return [value_range.get('values', []) for value_range in body.get('valueRanges', [])]
+
+    async def _batch_update(self, payload: List[Dict]) -> bool:
+        data = [
+            {'range': absolute_range_name(self.worksheet_title, item['range']), 'values': item['values']}
+            for item in payload
+        ]
+        try:
+            await self._request(
+                'write', 'batch_update', 'POST',
+                f"{SHEETS_API_URL}/{self.spreadsheet_id}/values:batchUpdate",
+                json={'valueInputOption': 'RAW', 'data': data},
+            )
+            return True
+        except Exception as e:
+            self.logger.warning(f"범위 {[item['range'] for item in payload]} 업데이트 실패: {str(e)}")
+            return False
+
+    async def _get_revision_async(self) -> Optional[str]:
+        if not self.snapshot_cache:
+            return None
+        try:
+            body = await self._request(
+                'read', 'get_lastUpdateTime', 'GET', f"{DRIVE_API_URL}/{self.spreadsheet_id}",
+                params={'fields': 'modifiedTime', 'supportsAllDrives': 'true'},
+            )
+            return body.get('modifiedTime')
+        except Exception as e:
+            self.logger.warning(f"스프레드시트 리비전 조회 실패, 스냅샷 캐시를 건너뜁니다: {str(e)}")
+            return None
+
+    # --- 스프레드시트 찾기 ---
+
+    async def _resolve_spreadsheet(self, refresh: bool = False) -> Tuple[str, str]:
+        """스프레드시트 키와 주문 워크시트 제목 조회 (저장된 값이 있으면 API 호출 없음)"""
+        name = self.config.SPREADSHEET_NAME
+        cached = self.state_store.get_item('spreadsheets', name, {})
+
+        key = self.config.SPREADSHEET_ID or (None if refresh else cached.get('key'))
+        if key and not refresh and cached.get('key') == key and cached.get('worksheet_title'):
+            return key, cached['worksheet_title']
+
+        if not key:
+            escaped = name.replace('\\', '\\\\').replace("'", "\\'")
+            query = (
+                f"name = '{escaped}' "
+                "and mimeType = 'application/vnd.google-apps.spreadsheet' and trashed = false"
+            )
+            body = await self._request('read', 'open', 'GET', DRIVE_API_URL, params={
+                'q': query, 'fields': 'files(id,name)',
+                'supportsAllDrives': 'true', 'includeItemsFromAllDrives': 'true',
+            })
+            files = [f for f in body.get('files', []) if f.get('name') == name]
+            if not files:
+                raise SpreadsheetError(f"Spreadsheet not found: {name}")
+            key = files[0]['id']
+
+        body = await self._request(
+            'read', 'sheet1', 'GET', f"{SHEETS_API_URL}/{key}",
+            params={'fields': 'sheets.properties(sheetId,title,index)'},
+        )
+        sheets = sorted(body.get('sheets', []), key=lambda sheet: sheet['properties'].get('index', 0))
+        if not sheets:
+            raise SpreadsheetError(f"Spreadsheet has no worksheets: {name}")
+        worksheet = sheets[0]['properties']
+
+        self.state_store.set_item('spreadsheets', name, {
+            'key': key,
+            'worksheet_id': worksheet['sheetId'],
+            'worksheet_title': worksheet['title'],
+        })
+        return key, worksheet['title']
+
+    # --- 공개 메서드 ---
+
+    async def _read_header_and_revision(self, watermark: Optional[int], header: List[str]):
+        """리비전, 헤더 행, 워터마크 행의 '비고' 셀을 동시에 조회"""
+        ranges = ['1:1']
+        if watermark and '비고' in header:
+            ranges.append(rowcol_to_a1(watermark, header.index('비고') + 1))
+        return await asyncio.gather(self._get_revision_async(), self._batch_get(ranges))
+
+    async def get_new_orders_async(self) -> pd.DataFrame:
+        try:
+            self.logger.info(f"스프레드시트 '{self.config.SPREADSHEET_NAME}' 열기")
+            self.spreadsheet_id, self.worksheet_title = await self._resolve_spreadsheet()
+
+            saved_header = self.state_store.get_item('headers', self.config.SPREADSHEET_NAME, [])
+            watermark = self._load_watermark() if self.config.FETCH_MODE == 'incremental' else None
+
+            try:
+                revision, first_ranges = await self._read_header_and_revision(watermark, saved_header)
+            except SheetsApiError as e:
+                # 저장된 키가 더 이상 유효하지 않으면 제목으로 다시 찾음
+                if e.code not in (403, 404) or self.config.SPREADSHEET_ID:
+                    raise
+                self.logger.warning(f"저장된 스프레드시트 키를 사용할 수 없습니다: {str(e)}")
+                self.spreadsheet_id, self.worksheet_title = await self._resolve_spreadsheet(refresh=True)
+                revision, first_ranges = await self._read_header_and_revision(watermark, saved_header)
+
+            snapshot = self._load_snapshot(revision)
+            if snapshot is not None:
+                return snapshot
+
+            header_range = first_ranges[0]
+            remark_range = first_ranges[1] if len(first_ranges) > 1 else []
+            header = list(header_range[0]) if header_range else []
+            if header != saved_header:
+                if watermark:
+                    self.logger.warning("헤더가 변경되어 워터마크를 폐기하고 전체 조회합니다")
+                    self._clear_watermark()
+                self._save_header(header)
+                watermark = None
+            elif watermark:
+                remark = remark_range[0][0] if remark_range and remark_range[0] else ''
+                if remark != '확인':
+                    self.logger.warning(
+                        f"워터마크 행({watermark}행)의 '비고'가 '확인'이 아닙니다 (수동 편집 감지). 전체 조회합니다"
+                    )
+                    self._clear_watermark()
+                    watermark = None
+
+            first_row = watermark + 1 if watermark else 2
+            names, ranges = self._data_ranges(header, first_row)
+            # 워터마크 이전의 격리 행도 같은 요청으로 다시 조회
+            retry_rows = self._quarantined_before(first_row)
+            value_ranges = await self._batch_get(ranges + self._row_ranges(header, retry_rows))
+            rows = self._ranges_to_rows(value_ranges[:len(ranges)])
+            self.header = header
+            if watermark:
+                self.logger.info(f"워터마크 {watermark}행 이후 {len(rows)}개 행만 조회")
+            df = self._records_to_frame(names, rows, first_row)
+            if retry_rows:
+                df = pd.concat([self._rows_to_frame(names, retry_rows, value_ranges[len(ranges):]), df])
+            return self._extract_new_orders(df, revision)
+
+        except (SpreadsheetError, DataParsingError) as e:
+            self.logger.error(f"주문 조회 중 에러: {str(e)}", exc_info=True)
+            raise
+        except Exception as e:
+            self.logger.error(f"예상치 못한 에러 발생: {str(e)}", exc_info=True)
+            raise SpreadsheetError(f"Failed to get new orders: {str(e)}")
+
+    async def mark_orders_as_confirmed_async(self) -> Dict[str, bool]:
+        try:
+            if not self.spreadsheet_id or not self.new_order_rows:
+                self.logger.info("처리할 행이 없습니다")
+                return {}
+
+            header = self.header
+            if not header:
+                header_range = (await self._batch_get(['1:1']))[0]
+                header = list(header_range[0]) if header_range else []
+            batches = self._confirmation_batches(header)
+
+            # 배치는 행 번호 순서대로 하나씩 보내고 첫 실패에서 중단 (동기 핸들러와 같은 이유)
+            outcomes = []
+            for payload in batches:
+                outcomes.append(await self._batch_update(payload))
+                if not outcomes[-1]:
+                    break
+            return self._record_confirmation(batches, outcomes)
+
+        except Exception as e:
+            self.logger.error(f"주문 확인 처리 실패: {str(e)}", exc_info=True)
+            raise SpreadsheetError(f"Failed to mark orders as confirmed: {str(e)}")
+
+    def get_new_orders(self) -> pd.DataFrame:
+        return self._run(self.get_new_orders_async())
+
+    def mark_orders_as_confirmed(self) -> Dict[str, bool]:
+        return self._run(self.mark_orders_as_confirmed_async())
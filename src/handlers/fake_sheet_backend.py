@@ -0,0 +1,201 @@
+import csv
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import requests
+from gspread.exceptions import APIError, SpreadsheetNotFound, WorksheetNotFound
+from gspread.utils import a1_range_to_grid_range, numericise_all
+
+
+def _api_error(status: int, message: str) -> APIError:
+    """실제 API 응답과 같은 형태의 gspread APIError 생성"""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(
+        {'error': {'code': status, 'message': message, 'status': 'RESOURCE_EXHAUSTED'}}
+    ).encode('utf-8')
+    return APIError(response)
+
+
+class FakeWorksheet:
+    """메모리에 값을 두고 gspread.Worksheet의 읽기/쓰기 연산을 흉내내는 워크시트"""
+
+    def __init__(self, spreadsheet: 'FakeSpreadsheet', title: str, values: List[List[Any]],
+                 worksheet_id: int = 0):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = worksheet_id
+        self.values = [list(row) for row in values]
+
+    @property
+    def backend(self) -> 'FakeSheetBackend':
+        return self.spreadsheet.backend
+
+    @property
+    def row_count(self) -> int:
+        """시트 행 수 (gspread처럼 워크시트 메타데이터 값이라 API 호출로 세지 않음)"""
+        with self.backend.lock:
+            return len(self.values)
+
+    def _cells(self, a1: str) -> List[List[Any]]:
+        """A1 범위를 Sheets API처럼 잘라 반환 (뒤쪽 빈 셀과 빈 행 제거)"""
+        grid = a1_range_to_grid_range(a1.split('!')[-1])
+        with self.backend.lock:
+            rows = self.values[grid.get('startRowIndex', 0):grid.get('endRowIndex')]
+            result = []
+            for row in rows:
+                cells = list(row[grid.get('startColumnIndex', 0):grid.get('endColumnIndex')])
+                while cells and cells[-1] == '':
+                    cells.pop()
+                result.append(cells)
+        while result and not result[-1]:
+            result.pop()
+        return result
+
+    def _write(self, row: int, col: int, value: Any):
+        """1부터 시작하는 행/열 위치에 값 기록 (필요하면 시트 확장)"""
+        while len(self.values) < row:
+            self.values.append([])
+        cells = self.values[row - 1]
+        while len(cells) < col:
+            cells.append('')
+        cells[col - 1] = value
+
+    def get_all_values(self) -> List[List[Any]]:
+        self.backend._call('read', 'get_all_values')
+        with self.backend.lock:
+            return [list(row) for row in self.values]
+
+    def get_all_records(self) -> List[Dict[str, Any]]:
+        self.backend._call('read', 'get_all_records')
+        with self.backend.lock:
+            if not self.values:
+                return []
+            header = list(self.values[0])
+            width = len(header)
+            return [
+                dict(zip(header, numericise_all(list(row[:width]) + [''] * (width - len(row)))))
+                for row in self.values[1:]
+            ]
+
+    def row_values(self, row: int) -> List[Any]:
+        self.backend._call('read', 'row_values')
+        return (self._cells(f"{row}:{row}") or [[]])[0]
+
+    def batch_get(self, ranges: List[str]) -> List[List[List[Any]]]:
+        self.backend._call('read', 'batch_get')
+        return [self._cells(a1) for a1 in ranges]
+
+    def update_cell(self, row: int, col: int, value: Any):
+        self.backend._call('write', 'update_cell')
+        with self.backend.lock:
+            self._write(row, col, value)
+        self.spreadsheet._touch()
+
+    def batch_update(self, data: List[Dict[str, Any]]):
+        self.backend._call('write', 'batch_update')
+        with self.backend.lock:
+            for item in data:
+                grid = a1_range_to_grid_range(item['range'].split('!')[-1])
+                for r, row_values in enumerate(item['values']):
+                    for c, value in enumerate(row_values):
+                        self._write(grid.get('startRowIndex', 0) + r + 1,
+                                    grid.get('startColumnIndex', 0) + c + 1, value)
+        self.spreadsheet._touch()
+
+
+class FakeSpreadsheet:
+    """gspread.Spreadsheet를 흉내내는 스프레드시트 (수정할 때마다 수정 시각 갱신)"""
+
+    def __init__(self, backend: 'FakeSheetBackend', title: str, key: str, values: List[List[Any]]):
+        self.backend = backend
+        self.title = title
+        self.id = key
+        self.worksheets = [FakeWorksheet(self, '설문지 응답 시트1', values)]
+        self.modified_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def _touch(self):
+        with self.backend.lock:
+            self.modified_at += timedelta(seconds=1)
+
+    @property
+    def sheet1(self) -> FakeWorksheet:
+        self.backend._call('read', 'fetch_sheet_metadata')
+        return self.worksheets[0]
+
+    def get_worksheet_by_id(self, worksheet_id: int) -> FakeWorksheet:
+        self.backend._call('read', 'fetch_sheet_metadata')
+        for worksheet in self.worksheets:
+            if worksheet.id == worksheet_id:
+                return worksheet
+        raise WorksheetNotFound(f"worksheet id {worksheet_id} not found")
+
+    def get_lastUpdateTime(self) -> str:
+        self.backend._call('read', 'get_file_drive_metadata')
+        return self.modified_at.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+
+
+class FakeSheetBackend:
+    """네트워크 없이 동작하는 메모리/CSV 기반 시트 백엔드 (벤치마크, 장애 주입 테스트용)
+
+    latency로 호출마다 지연을 넣고, quota_error_rate 확률이나 fail_next()로 지정한 만큼
+    429 같은 API 오류를 발생시킨다. 호출 횟수는 call_counts에 메서드 이름별로 쌓인다.
+    """
+
+    def __init__(self, latency: float = 0.0, quota_error_rate: float = 0.0,
+                 error_status: int = 429, seed: Optional[int] = None):
+        self.latency = latency
+        self.quota_error_rate = quota_error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.spreadsheets: Dict[str, FakeSpreadsheet] = {}
+        self.call_counts: Dict[str, int] = {}
+        self.lock = threading.RLock()
+        self._scheduled_failures = 0
+
+    @classmethod
+    def from_csv(cls, path: str, title: str, **kwargs) -> 'FakeSheetBackend':
+        """CSV 파일(첫 행은 헤더)로 스프레드시트 하나를 만든 백엔드"""
+        backend = cls(**kwargs)
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            backend.add_spreadsheet(title, list(csv.reader(f)))
+        return backend
+
+    def add_spreadsheet(self, title: str, values: List[List[Any]], key: Optional[str] = None) -> FakeSpreadsheet:
+        key = key or f"fake-{len(self.spreadsheets) + 1}"
+        spreadsheet = FakeSpreadsheet(self, title, key, values)
+        self.spreadsheets[key] = spreadsheet
+        return spreadsheet
+
+    def fail_next(self, count: int = 1):
+        """다음 count번의 호출을 API 오류로 실패시킴"""
+        with self.lock:
+            self._scheduled_failures += count
+
+    def _call(self, kind: str, name: str):
+        with self.lock:
+            self.call_counts[name] = self.call_counts.get(name, 0) + 1
+            fail = self._scheduled_failures > 0 or self.random.random() < self.quota_error_rate
+            if self._scheduled_failures > 0:
+                self._scheduled_failures -= 1
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise _api_error(self.error_status, f"Quota exceeded for {kind} requests ({name})")
+
+    def open(self, title: str) -> FakeSpreadsheet:
+        self._call('read', 'open')
+        for spreadsheet in self.spreadsheets.values():
+            if spreadsheet.title == title:
+                return spreadsheet
+        raise SpreadsheetNotFound(title)
+
+    def open_by_key(self, key: str) -> FakeSpreadsheet:
+        self._call('read', 'open_by_key')
+        if key not in self.spreadsheets:
+            raise SpreadsheetNotFound(key)
+        return self.spreadsheets[key]
@@ -1,6 +1,14 @@
 import logging
+import re
+from typing import Dict, Optional, Sequence, Tuple
 import pandas as pd
 from config.config import Config
+from utils.arrow import as_text, is_arrow_string
+
+# 정수로 떨어지는 실수 표기 (예: '8.0')
+INTEGRAL_FLOAT_PATTERN = r'^(-?\d+)\.0$'
+# 수량 컬럼 (앞 컬럼이 비어 있을 때만 다음 컬럼 사용). 상품별 컬럼은 카탈로그의 quantity_columns
+QUANTITY_COLUMNS = ('5kg 수량', '10kg 수량')
 
 class OrderProcessor:
     def __init__(self, config: Config):
@@ -35,16 +43,42 @@ class OrderProcessor:
             
         return phone
 
+    @staticmethod
+    def format_phone_numbers(phones: pd.Series) -> pd.Series:
+        """format_phone_number와 같은 규칙을 컬럼 전체에 한 번에 적용
+
+        Arrow 문자열 컬럼이면 변환 없이 Arrow compute 커널로 처리하고 결과도 Arrow 문자열이다.
+        """
+        text = as_text(phones)
+        blank = phones.isna() | (text.str.strip() == '')
+
+        digits = text.str.replace(r'\D', '', regex=True)
+        # 앞자리 0이 빠진 휴대폰 번호 보정 (예: 숫자로 저장된 1012345678)
+        missing_zero = (digits.str.len() == 10) & digits.str.startswith('10')
+        digits = digits.where(~missing_zero, '0' + digits)
+
+        mobile = (digits.str.len() == 11) & digits.str.startswith('010')
+        formatted = digits.str[:3] + '-' + digits.str[3:7] + '-' + digits.str[7:]
+
+        # 휴대폰 번호가 아니면 원래 값 그대로 반환
+        result = (phones if is_arrow_string(phones) else phones.astype(object)).where(~mobile, formatted)
+        return result.mask(blank, '')
+
+    @staticmethod
+    def _quantity_text(value) -> str:
+        # 빈 셀이 섞인 컬럼은 실수형이 되므로 8.0은 '80'이 아닌 '8'로 처리
+        return re.sub(INTEGRAL_FLOAT_PATTERN, r'\1', str(value))
+
     @staticmethod
     def get_quantity(row: pd.Series, logger=None) -> int:
         try:
             if pd.notna(row['5kg 수량']) and str(row['5kg 수량']).strip():
-                qty = str(row['5kg 수량'])
+                qty = OrderProcessor._quantity_text(row['5kg 수량'])
                 if any(char.isdigit() for char in qty):
                     return int(''.join(filter(str.isdigit, qty)))
             
             elif pd.notna(row['10kg 수량']) and str(row['10kg 수량']).strip():
-                qty = str(row['10kg 수량'])
+                qty = OrderProcessor._quantity_text(row['10kg 수량'])
                 if any(char.isdigit() for char in qty):
                     return int(''.join(filter(str.isdigit, qty)))
             
@@ -53,3 +87,61 @@ class OrderProcessor:
             if logger:
                 logger.error(f"Error processing quantity: {e}")
             return 1
+
+    @staticmethod
+    def get_quantities(df: pd.DataFrame) -> pd.Series:
+        """get_quantity와 같은 규칙으로 전체 주문의 수량을 한 번에 계산
+
+        '5kg 수량'이 비어 있지 않으면 그 값의 숫자를, 아니면 '10kg 수량'의 숫자를 사용하고
+        값에 숫자가 없거나 둘 다 비어 있으면 1로 한다.
+        """
+        return OrderProcessor.extract_quantities(df)[0]
+
+    @staticmethod
+    def extract_quantities(df: pd.DataFrame,
+                           columns: Sequence[str] = QUANTITY_COLUMNS) -> Tuple[pd.Series, pd.Series]:
+        """columns 중 처음으로 값이 있는 컬럼에서 (수량, 값이 있지만 숫자가 없어 기본값 1을 쓴 행 마스크) 반환"""
+        quantities = pd.Series(1, index=df.index, dtype='int64')
+        unparsed = pd.Series(False, index=df.index)
+        taken = pd.Series(False, index=df.index)
+
+        for column in columns:
+            if column not in df.columns:
+                continue
+            values = df[column]
+            # Arrow 정규식의 \D는 ASCII 숫자만 인식하므로 전각 숫자('３')를 먼저 ASCII로 정규화
+            text = as_text(values).str.normalize('NFKC').str.replace(INTEGRAL_FLOAT_PATTERN, r'\1', regex=True)
+
+            present = ~taken & values.notna() & (text.str.strip() != '')
+            digits = text.str.replace(r'\D', '', regex=True)
+            use = present & (digits != '')
+            quantities[use] = digits[use].astype('int64')
+            unparsed |= present & (digits == '')
+            taken |= present
+
+        return quantities, unparsed
+
+    @staticmethod
+    def order_columns(df: pd.DataFrame, product_types: Optional[pd.Series] = None,
+                      quantities: Optional[pd.Series] = None) -> Dict[str, list]:
+        """라벨 렌더링에 쓰는 정규화된 주문 필드별 값 목록 (행 순서 유지)
+
+        연락처 정규화와 수량 추출은 행마다 하지 않고 컬럼 단위로 한 번만 계산한다.
+        이미 계산한 상품 분류(ProductCatalog.classify)와 수량이 있으면 그대로 사용한다.
+        """
+        def column(name: str) -> pd.Series:
+            return df[name] if name in df.columns else pd.Series('', index=df.index, dtype=object)
+
+        return {
+            'sender_name': column('보내는분 성함').tolist(),
+            'sender_address': column('보내는분 주소 (도로명 주소로 부탁드려요)').tolist(),
+            'sender_phone': OrderProcessor.format_phone_numbers(
+                column('보내는분 연락처 (핸드폰번호)').astype(str)).tolist(),
+            'recipient_name': column('받으실분 성함').tolist(),
+            'recipient_address': column('받으실분 주소 (도로명 주소로 부탁드려요)').tolist(),
+            'recipient_phone': OrderProcessor.format_phone_numbers(
+                column('받으실분 연락처 (핸드폰번호)').astype(str)).tolist(),
+            'product_type': product_types.astype(object).where(product_types.notna(), None).tolist()
+            if product_types is not None else [None] * len(df),
+            'quantity': (quantities if quantities is not None else OrderProcessor.get_quantities(df)).tolist(),
+        }
@@ -0,0 +1,86 @@
+from typing import Iterator, Tuple, Union
+
+import pandas as pd
+
+from config.config import Config
+from handlers.order_processor import OrderProcessor
+from handlers.product_catalog import ProductCatalog
+
+SENDER_COLUMNS = (
+    '보내는분 성함',
+    '보내는분 주소 (도로명 주소로 부탁드려요)',
+    '보내는분 연락처 (핸드폰번호)',
+)
+RECIPIENT_COLUMNS = (
+    '받으실분 성함',
+    '받으실분 주소 (도로명 주소로 부탁드려요)',
+    '받으실분 연락처 (핸드폰번호)',
+)
+
+
+class OrderValidator:
+    """주문 행 전체를 규칙별로 한 번에 검사해 행별 검증 오류(validation_error)를 만든다
+
+    한 행에 여러 규칙이 걸리면 메시지를 '; '로 이어 붙이고, 통과한 행은 None이다.
+    발송인 정보는 비어 있으면 기본 발송인을 쓰므로 필수 항목이 아니다.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.catalog = ProductCatalog.from_config(config)
+
+    def validate(self, df: pd.DataFrame) -> pd.Series:
+        errors = pd.Series('', index=df.index, dtype=object)
+        for invalid, message in self._rules(df):
+            if invalid.any():
+                errors[invalid] = errors[invalid] + message[invalid] + '; '
+        errors = errors.str[:-2]
+        return errors.where(errors != '', None)
+
+    @staticmethod
+    def _column(df: pd.DataFrame, name: str) -> pd.Series:
+        return df[name] if name in df.columns else pd.Series('', index=df.index, dtype=object)
+
+    @staticmethod
+    def _blank(values: pd.Series) -> pd.Series:
+        return values.isna() | (values.astype(str).str.strip() == '')
+
+    @staticmethod
+    def _message(text: Union[str, pd.Series], index: pd.Index) -> pd.Series:
+        if isinstance(text, pd.Series):
+            return text
+        return pd.Series(text, index=index, dtype=object)
+
+    @staticmethod
+    def _invalid_phones(values: pd.Series) -> pd.Series:
+        """정규화 후에도 국내 전화번호 형태(0으로 시작하는 9~11자리)가 아닌 값"""
+        normalized = OrderProcessor.format_phone_numbers(values.astype(str)).astype(str)
+        digits = normalized.str.replace(r'\D', '', regex=True)
+        return ~digits.str.fullmatch(r'0\d{8,10}')
+
+    def _rules(self, df: pd.DataFrame) -> Iterator[Tuple[pd.Series, pd.Series]]:
+        index = df.index
+
+        # 타임스탬프 (변환 실패 시 NaT)
+        yield self._column(df, '타임스탬프').isna(), self._message('타임스탬프 형식 오류', index)
+
+        # 필수 항목
+        for column in RECIPIENT_COLUMNS + ('상품 선택',):
+            yield self._blank(self._column(df, column)), self._message(f"{column} 누락", index)
+
+        # 연락처 형식 (비어 있으면 위의 필수 항목 또는 기본 발송인으로 처리)
+        for column in (RECIPIENT_COLUMNS[2], SENDER_COLUMNS[2]):
+            values = self._column(df, column)
+            invalid = ~self._blank(values) & self._invalid_phones(values)
+            yield invalid, f"{column} 형식 오류: " + values.astype(str)
+
+        # 수량 (상품별 수량 컬럼)
+        products = self._column(df, '상품 선택')
+        product_types = self.catalog.classify(products)
+        quantities, unparsed = self.catalog.extract_quantities(df, product_types)
+        yield unparsed | (quantities <= 0), self._message('수량을 알 수 없음', index)
+
+        # 상품 (카탈로그 상품 또는 '비상품')
+        known = product_types.notna() | products.astype(str).str.contains('비상품')
+        unknown = ~self._blank(products) & ~known
+        yield unknown, '유효하지 않은 상품 타입: "' + products.astype(str) + '"'
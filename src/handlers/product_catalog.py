@@ -0,0 +1,112 @@
+import re
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config.config import Config
+from handlers.order_processor import QUANTITY_COLUMNS, OrderProcessor
+from models.order_summary import OrderSummary, ProductTotal
+
+
+@dataclass(frozen=True)
+class Product:
+    """판매 상품 하나 (name은 라벨과 합계에 표시되는 이름)"""
+    name: str
+    price: int
+    patterns: Tuple[str, ...] = ()
+    # 박스 수를 읽을 컬럼 (앞 컬럼이 비어 있으면 다음 컬럼, 없으면 '5kg 수량'/'10kg 수량')
+    quantity_columns: Tuple[str, ...] = ()
+
+    @property
+    def regex(self) -> str:
+        """'상품 선택' 문자열에서 이 상품을 찾는 정규식 (patterns가 없으면 name을 그대로 검색)"""
+        return '|'.join(f"(?:{pattern})" for pattern in self.patterns) or re.escape(self.name)
+
+
+class ProductCatalog:
+    """'상품 선택' 값을 카탈로그 상품으로 분류하고 상품별 수량/금액 합계를 계산
+
+    모든 상품의 패턴을 정규식 하나로 컴파일해 컬럼 전체를 한 번에 분류한다.
+    여러 상품의 패턴에 걸리는 값은 카탈로그에서 앞에 있는 상품으로 분류된다.
+    """
+
+    def __init__(self, products: Sequence[Product]):
+        if not products:
+            raise ValueError("Product catalog is empty")
+        self.products = tuple(products)
+        self.names = [product.name for product in self.products]
+        self.prices = pd.Series([product.price for product in self.products], index=self.names)
+
+        # 분기마다 '.*?'로 시작해 문자열 어디서든 찾고, 분기는 앞에서부터 시도되므로 카탈로그 순서가 우선순위가 됨
+        self._groups = [f"p{i}" for i in range(len(self.products))]
+        self._matcher = re.compile(
+            '|'.join(f"(?P<{group}>.*?(?:{product.regex}))"
+                     for group, product in zip(self._groups, self.products)),
+            re.DOTALL,
+        )
+
+    @classmethod
+    def from_config(cls, config: Config) -> 'ProductCatalog':
+        return cls([
+            Product(item['name'], int(item['price']), tuple(item.get('patterns', ())),
+                    tuple(item.get('quantity_columns', ())))
+            for item in config.PRODUCT_CATALOG
+        ])
+
+    def match(self, selection: str) -> Optional[Product]:
+        """값 하나를 분류 (해당 상품이 없으면 None)"""
+        found = self._matcher.match(str(selection))
+        if not found:
+            return None
+        for group, product in zip(self._groups, self.products):
+            if found.group(group) is not None:
+                return product
+        return None
+
+    def classify(self, selections: pd.Series) -> pd.Series:
+        """컬럼 전체를 상품 이름으로 분류 (카탈로그 순서의 category, 해당 상품이 없으면 NaN)"""
+        found = selections.astype(str).str.extract(self._matcher)[self._groups].notna().to_numpy()
+        codes = np.where(found.any(axis=1), found.argmax(axis=1), -1)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=self.names),
+            index=selections.index,
+        )
+
+    def extract_quantities(self, df: pd.DataFrame, product_types: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """상품마다 자기 수량 컬럼에서 (수량, 값이 있지만 숫자가 없어 기본값 1을 쓴 행 마스크) 계산
+
+        분류되지 않은 행은 기본 수량 컬럼을 사용한다.
+        """
+        groups = {QUANTITY_COLUMNS: []}
+        for product in self.products:
+            groups.setdefault(product.quantity_columns or QUANTITY_COLUMNS, []).append(product.name)
+        if len(groups) == 1:
+            return OrderProcessor.extract_quantities(df)
+
+        quantities = pd.Series(1, index=df.index, dtype='int64')
+        unparsed = pd.Series(False, index=df.index)
+        for columns, names in groups.items():
+            rows = product_types.isin(names).to_numpy()
+            if columns == QUANTITY_COLUMNS:
+                rows = rows | product_types.isna().to_numpy()
+            if rows.any():
+                group_quantities, group_unparsed = OrderProcessor.extract_quantities(df[rows], columns)
+                quantities[rows] = group_quantities.to_numpy()
+                unparsed[rows] = group_unparsed.to_numpy()
+        return quantities, unparsed
+
+    def totals(self, product_types: pd.Series, quantities: pd.Series) -> pd.DataFrame:
+        """상품별 수량과 금액 (카탈로그 순서, 주문이 없는 상품은 0)"""
+        product_types = product_types.astype(pd.CategoricalDtype(self.names))
+        quantity = quantities.groupby(product_types, observed=False).sum().reindex(self.names, fill_value=0)
+        return pd.DataFrame({'quantity': quantity, 'revenue': quantity * self.prices})
+
+    def summarize(self, product_types: pd.Series, quantities: pd.Series) -> OrderSummary:
+        """totals를 한 번에 집계해 바뀌지 않는 OrderSummary로 반환"""
+        totals = self.totals(product_types, quantities)
+        return OrderSummary(tuple(
+            ProductTotal(name, int(quantity), int(price))
+            for name, quantity, price in zip(self.names, totals['quantity'].tolist(), self.prices.tolist())
+        ))
@@ -0,0 +1,172 @@
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from utils.logger import get_logger
+
+try:
+    from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout
+    _TRANSIENT_NETWORK_ERRORS = (ConnectionError, TimeoutError, RequestsConnectionError, Timeout)
+except ModuleNotFoundError:  # pragma: no cover - requests는 gspread 의존성
+    _TRANSIENT_NETWORK_ERRORS = (ConnectionError, TimeoutError)
+
+# 재시도할 HTTP 상태 코드 (쿼터 초과 + 서버 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """gspread APIError 등에서 HTTP 상태 코드 추출"""
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    if status is None:
+        status = getattr(error, 'code', None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, _TRANSIENT_NETWORK_ERRORS):
+        return True
+    return _status_code(error) in RETRYABLE_STATUS_CODES
+
+
+class TokenBucket:
+    """분당 쿼터에 맞춘 토큰 버킷"""
+
+    def __init__(self, per_minute: int, clock: Callable[[], float] = time.monotonic):
+        self.capacity = max(1, per_minute)
+        self.rate = self.capacity / 60.0  # 초당 충전량
+        self.tokens = float(self.capacity)
+        self.clock = clock
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 대기해야 할 시간(초)을 반환"""
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+@dataclass
+class CallMetrics:
+    calls: int = 0
+    failures: int = 0
+    retries: int = 0
+    total_seconds: float = 0.0
+    throttled_seconds: float = 0.0
+
+
+class RequestScheduler:
+    """모든 Google Sheets API 호출을 통과시키는 쿼터 인식 스케줄러
+
+    읽기/쓰기 쿼터별 토큰 버킷으로 호출 속도를 맞추고, 429와 5xx 응답은
+    지터가 섞인 지수 백오프로 재시도하며, 호출 이름별 지표를 모은다.
+    """
+
+    def __init__(self, read_per_minute: int = 60, write_per_minute: int = 60,
+                 max_retries: int = 5, base_delay: float = 1.0, max_delay: float = 64.0,
+                 sleep: Callable[[float], None] = time.sleep,
+                 clock: Callable[[], float] = time.monotonic):
+        self.buckets = {
+            'read': TokenBucket(read_per_minute, clock),
+            'write': TokenBucket(write_per_minute, clock),
+        }
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self.clock = clock
+        self.metrics: Dict[str, CallMetrics] = {}
+        self.lock = threading.Lock()
+        self.logger = get_logger(__name__)
+
+    def _record(self, name: str, **deltas):
+        with self.lock:
+            metrics = self.metrics.setdefault(name, CallMetrics())
+            for field, delta in deltas.items():
+                setattr(metrics, field, getattr(metrics, field) + delta)
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: 0 ~ min(max_delay, base * 2^attempt)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def _retry_delay(self, name: str, attempt: int, error: Exception) -> Optional[float]:
+        """재시도할 오류면 대기 시간을, 아니면 None을 반환"""
+        if not is_retryable(error) or attempt >= self.max_retries:
+            self._record(name, failures=1)
+            return None
+        delay = self._backoff(attempt)
+        self._record(name, retries=1, throttled_seconds=delay)
+        self.logger.warning(
+            f"{name}: 일시적 오류로 {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries}): {str(error)}"
+        )
+        return delay
+
+    def _throttle(self, kind: str, name: str) -> float:
+        wait = self.buckets[kind].reserve()
+        if wait > 0:
+            self.logger.debug(f"{name}: 쿼터 대기 {wait:.2f}초")
+            self._record(name, throttled_seconds=wait)
+        return wait
+
+    def call(self, kind: str, name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """kind('read' | 'write') 쿼터를 소비하며 func를 호출"""
+        attempt = 0
+        while True:
+            wait = self._throttle(kind, name)
+            if wait > 0:
+                self.sleep(wait)
+
+            started = self.clock()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._record(name, calls=1, total_seconds=self.clock() - started)
+                delay = self._retry_delay(name, attempt, e)
+                if delay is None:
+                    raise
+                attempt += 1
+                self.sleep(delay)
+                continue
+
+            self._record(name, calls=1, total_seconds=self.clock() - started)
+            return result
+
+    async def call_async(self, kind: str, name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """call의 asyncio 버전 (func는 코루틴 함수)"""
+        attempt = 0
+        while True:
+            wait = self._throttle(kind, name)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            started = self.clock()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                self._record(name, calls=1, total_seconds=self.clock() - started)
+                delay = self._retry_delay(name, attempt, e)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+
+            self._record(name, calls=1, total_seconds=self.clock() - started)
+            return result
+
+    def log_metrics(self):
+        """호출 이름별 지표를 로그로 출력"""
+        with self.lock:
+            snapshot = dict(self.metrics)
+        for name, m in sorted(snapshot.items()):
+            self.logger.info(
+                f"[API] {name}: 호출 {m.calls}회, 재시도 {m.retries}회, 실패 {m.failures}회, "
+                f"소요 {m.total_seconds:.2f}초, 대기 {m.throttled_seconds:.2f}초"
+            )
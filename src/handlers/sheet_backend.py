@@ -0,0 +1,45 @@
+from typing import Any, Dict, List, Protocol
+
+
+class WorksheetBackend(Protocol):
+    """GoogleSheetHandler가 사용하는 워크시트 연산 (gspread.Worksheet와 같은 형태)"""
+
+    id: int
+    title: str
+
+    def get_all_records(self) -> List[Dict[str, Any]]: ...
+
+    def get_all_values(self) -> List[List[Any]]: ...
+
+    def row_values(self, row: int) -> List[str]: ...
+
+    def batch_get(self, ranges: List[str]) -> List[List[List[Any]]]: ...
+
+    def update_cell(self, row: int, col: int, value: Any) -> Any: ...
+
+    def batch_update(self, data: List[Dict[str, Any]]) -> Any: ...
+
+
+class SpreadsheetBackend(Protocol):
+    """gspread.Spreadsheet와 같은 형태의 스프레드시트"""
+
+    id: str
+    title: str
+
+    @property
+    def sheet1(self) -> WorksheetBackend: ...
+
+    def get_worksheet_by_id(self, worksheet_id: int) -> WorksheetBackend: ...
+
+    def get_lastUpdateTime(self) -> str: ...
+
+
+class SheetBackend(Protocol):
+    """스프레드시트를 여는 클라이언트 (gspread.Client 또는 FakeSheetBackend)
+
+    GoogleSheetHandler(config, backend=...)로 넘기면 인증 없이 해당 백엔드를 사용한다.
+    """
+
+    def open(self, title: str) -> SpreadsheetBackend: ...
+
+    def open_by_key(self, key: str) -> SpreadsheetBackend: ...
@@ -1,22 +1,74 @@
 import gspread
+from gspread.utils import a1_to_rowcol, numericise_all, rowcol_to_a1
 from oauth2client.service_account import ServiceAccountCredentials
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import logging
 import json
 import tempfile
 import os
+from typing import Dict, Iterator, List, Optional, Tuple
 from config.config import Config
 from exceptions.exceptions import SpreadsheetError, DataParsingError
+from handlers.order_validator import OrderValidator
+from handlers.request_scheduler import RequestScheduler
+from handlers.sheet_backend import SheetBackend
+from utils.arrow import as_text, pa, rows_to_arrow_frame
+from utils.interning import StringPool
 from utils.logger import get_logger
+from utils.snapshot_cache import SnapshotCache
+from utils.state_store import JsonStateStore
+
+# 구글 폼 응답 타임스탬프 (예: '2024. 12. 5. 오후 3:45:23')
+KOREAN_TIMESTAMP_PATTERN = (
+    r'^\s*(?P<year>\d{4})\.\s*(?P<month>\d{1,2})\.\s*(?P<day>\d{1,2})\.?\s*'
+    r'(?P<meridiem>오전|오후)?\s*(?P<hour>\d{1,2}):(?P<minute>\d{2}):(?P<second>\d{2})\s*$'
+)
+
 
 class GoogleSheetHandler:
-    def __init__(self, config: Config):
+    # 값이 많이 반복되는 컬럼 (한 발송인이 여러 건 주문) → category로 변환
+    CATEGORICAL_COLUMNS = (
+        '보내는분 성함',
+        '보내는분 주소 (도로명 주소로 부탁드려요)',
+        '보내는분 연락처 (핸드폰번호)',
+        '상품 선택',
+        '비고',
+    )
+    # 모든 값이 정수거나 비어 있으면 nullable 정수(Int64)로 변환
+    QUANTITY_COLUMNS = ('5kg 수량', '10kg 수량')
+
+    def __init__(self, config: Config, scheduler: Optional[RequestScheduler] = None,
+                 backend: Optional[SheetBackend] = None):
         self.config = config
         self.logger = get_logger(__name__)
-        self._setup_credentials()
+        if self.config.INGESTION_ENGINE == 'arrow' and pa is None:
+            raise SpreadsheetError("pyarrow is required for INGESTION_ENGINE=arrow (pip install pyarrow)")
+        if backend is not None:
+            # 인증 없이 주어진 백엔드 사용 (예: 오프라인 벤치마크용 FakeSheetBackend)
+            self.credentials = None
+            self.client = backend
+        else:
+            self._setup_credentials()
         self.sheet = None  # sheet 인스턴스 변수 추가
         self.new_order_rows = []  # 처리한 행들의 실제 인덱스 저장
+        self.last_confirmation_results = {}  # 범위(A1)별 '확인' 업데이트 성공 여부
+        self.header = []  # 마지막으로 읽은 헤더 행
+        self.state_store = JsonStateStore(self.config.STATE_FILE)
+        self.snapshot_cache = SnapshotCache(
+            self.config.SNAPSHOT_CACHE_DIR,
+            max_entries=self.config.SNAPSHOT_MAX_ENTRIES,
+            max_bytes=self.config.SNAPSHOT_MAX_BYTES,
+            max_age_seconds=self.config.SNAPSHOT_MAX_AGE_SECONDS,
+        ) if self.config.SNAPSHOT_CACHE_ENABLED else None
+        self.spreadsheet_id = None
+        # 쿼터는 서비스 계정 단위이므로 여러 핸들러가 스케줄러 하나를 공유할 수 있음
+        self.scheduler = scheduler or RequestScheduler(
+            read_per_minute=self.config.SHEETS_READ_QUOTA_PER_MINUTE,
+            write_per_minute=self.config.SHEETS_WRITE_QUOTA_PER_MINUTE,
+            max_retries=self.config.SHEETS_MAX_RETRIES,
+        )
 
     def _setup_credentials(self):
         scope = ['https://spreadsheets.google.com/feeds', 'https://www.googleapis.com/auth/drive']
@@ -42,6 +94,7 @@ class GoogleSheetHandler:
                     self.config.CREDENTIALS_FILE, scope
                 )
 
+            self.credentials = credentials
             self.client = gspread.authorize(credentials)
             self.logger.info("Google Sheets API 인증 완료")
         except FileNotFoundError as e:
@@ -54,6 +107,18 @@ class GoogleSheetHandler:
             self.logger.error(f"Google Sheets API 인증 실패: {str(e)}", exc_info=True)
             raise SpreadsheetError(f"Failed to setup Google credentials: {str(e)}")
 
+    def close(self):
+        """열린 연결 정리 (동기 핸들러는 gspread가 관리하므로 할 일 없음)"""
+        pass
+
+    def _read(self, name: str, func, *args, **kwargs):
+        """읽기 쿼터를 소비하는 API 호출"""
+        return self.scheduler.call('read', name, func, *args, **kwargs)
+
+    def _write(self, name: str, func, *args, **kwargs):
+        """쓰기 쿼터를 소비하는 API 호출"""
+        return self.scheduler.call('write', name, func, *args, **kwargs)
+
     def _validate_required_columns(self, df: pd.DataFrame):
         """필수 컬럼의 존재 여부를 검증"""
         required_columns = self.config.REQUIRED_COLUMNS
@@ -65,30 +130,476 @@ class GoogleSheetHandler:
                 f"필요한 컬럼: {', '.join(required_columns)}"
             )
 
-    def get_new_orders(self) -> pd.DataFrame:
+    def _load_watermark(self) -> Optional[int]:
+        """마지막으로 '확인'된 행 번호(워터마크) 조회"""
+        return self.state_store.get_item('watermarks', self.config.SPREADSHEET_NAME)
+
+    def _save_watermark(self, row: int):
+        if row < 2:
+            return
+        self.state_store.set_item('watermarks', self.config.SPREADSHEET_NAME, row)
+        self.logger.debug(f"워터마크 저장: {row}행")
+
+    def _clear_watermark(self):
+        self.state_store.delete_item('watermarks', self.config.SPREADSHEET_NAME)
+
+    def _load_header(self) -> List[str]:
+        """저장된 헤더 조회. 없으면 시트에서 읽어 저장"""
+        header = self.state_store.get_item('headers', self.config.SPREADSHEET_NAME)
+        if not header:
+            header = self._read('row_values', self.sheet.row_values, 1)
+            self._save_header(header)
+        return header
+
+    def _save_header(self, header: List[str]):
+        if self.state_store.get_item('headers', self.config.SPREADSHEET_NAME) != header:
+            self.state_store.set_item('headers', self.config.SPREADSHEET_NAME, header)
+
+    def _data_ranges(self, header: List[str], first_row: int,
+                     last_row: Optional[int] = None) -> Tuple[List[str], List[str]]:
+        """first_row부터 last_row(없으면 시트 끝)까지 조회할 컬럼 이름과 A1 범위 목록
+
+        PROJECTED_FETCH면 필수 컬럼만 컬럼별 범위로, 아니면 전체 컬럼을 한 범위로 조회한다.
+        컬럼 순서는 get_all_records와 같도록 시트 헤더 순서를 따른다.
+        """
+        end = last_row or ''
+        if not self.config.PROJECTED_FETCH:
+            last_col = rowcol_to_a1(1, len(header)).rstrip('1')
+            return list(header), [f"A{first_row}:{last_col}{end}"]
+
+        required = set(self.config.REQUIRED_COLUMNS)
+        names, ranges = [], []
+        for idx, name in enumerate(header):
+            if name in required:
+                col = rowcol_to_a1(1, idx + 1).rstrip('1')
+                names.append(name)
+                ranges.append(f"{col}{first_row}:{col}{end}")
+        return names, ranges
+
+    def _ranges_to_rows(self, value_ranges: List[List[List]]) -> List[List]:
+        """batch_get 결과를 행 목록으로 변환 (컬럼별 범위는 행 단위로 전치)"""
+        if not self.config.PROJECTED_FETCH:
+            return value_ranges[0] if value_ranges else []
+
+        columns = [[cell[0] if cell else '' for cell in value_range] for value_range in value_ranges]
+        height = max((len(column) for column in columns), default=0)
+        return [
+            [column[i] if i < len(column) else '' for column in columns]
+            for i in range(height)
+        ]
+
+    def _records_to_frame(self, header: List[str], rows: List[List], first_row: int,
+                          pool: Optional[StringPool] = None) -> pd.DataFrame:
+        """get_all_records와 동일한 규칙으로 값 목록을 DataFrame으로 변환
+
+        인덱스는 전체 조회와 같도록 (스프레드시트 행 번호 - 2)로 맞춘다.
+        str 객체로 남는 컬럼의 중복 문자열은 pool(없으면 이번 조회용 새 풀)에서 공유한다.
+        INGESTION_ENGINE이 'arrow'면 숫자 변환 없이 pyarrow Table로 바로 적재한다.
+        """
+        if self.config.INGESTION_ENGINE == 'arrow':
+            # 문자열이 Arrow 버퍼로 복사되므로 인터닝은 필요 없음
+            return rows_to_arrow_frame(header, rows, first_row)
+        width = len(header)
+        records = [numericise_all(list(row[:width]) + [''] * (width - len(row))) for row in rows]
+        index = pd.RangeIndex(first_row - 2, first_row - 2 + len(records))
+        df = pd.DataFrame(records, columns=header, index=index)
+        if pool is not None:
+            return pool.intern_frame(df)
+        return self._intern_frame(df)
+
+    def _intern_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """조회 단위 풀로 df를 인터닝하고, 실제로 공유한 셀이 있을 때만 통계를 기록"""
+        pool = StringPool()
+        pool.intern_frame(df)
+        self._log_interning(pool)
+        return df
+
+    def _log_interning(self, pool: StringPool):
+        # Arrow 문자열 컬럼만 있으면 풀에 아무것도 들어가지 않으므로 기록하지 않음
+        if pool.unique_count:
+            self.logger.info(f"문자열 인터닝: {pool.summary()}")
+
+    def _open_sheet(self):
+        """스프레드시트와 주문 워크시트 열기
+
+        SPREADSHEET_ID가 있거나 이전 실행에서 찾은 키가 저장되어 있으면 키로 바로 열고,
+        키가 없거나 더 이상 유효하지 않으면 제목 검색(Drive)으로 찾아 키를 저장한다.
+        """
+        name = self.config.SPREADSHEET_NAME
+        if self.config.SPREADSHEET_ID:
+            spreadsheet = self._read('open_by_key', self.client.open_by_key, self.config.SPREADSHEET_ID)
+            return spreadsheet, self._read('sheet1', lambda: spreadsheet.sheet1)
+
+        cached = self.state_store.get_item('spreadsheets', name)
+        if cached:
+            try:
+                spreadsheet = self._read('open_by_key', self.client.open_by_key, cached['key'])
+                if spreadsheet.title == name:
+                    worksheet = self._read(
+                        'get_worksheet_by_id', spreadsheet.get_worksheet_by_id, cached['worksheet_id']
+                    )
+                    return spreadsheet, worksheet
+                self.logger.warning(f"저장된 키의 스프레드시트 제목이 '{spreadsheet.title}'로 바뀌었습니다")
+            except (gspread.exceptions.SpreadsheetNotFound,
+                    gspread.exceptions.WorksheetNotFound,
+                    gspread.exceptions.APIError) as e:
+                self.logger.warning(f"저장된 스프레드시트 키를 사용할 수 없습니다: {str(e)}")
+            self.logger.info("제목으로 스프레드시트를 다시 검색합니다")
+
+        spreadsheet = self._read('open', self.client.open, name)
+        worksheet = self._read('sheet1', lambda: spreadsheet.sheet1)
+
+        self.state_store.set_item('spreadsheets', name, {
+            'key': spreadsheet.id,
+            'worksheet_id': worksheet.id,
+            'worksheet_title': worksheet.title,
+        })
+        return spreadsheet, worksheet
+
+    def _get_revision(self, spreadsheet) -> Optional[str]:
+        """스프레드시트의 마지막 수정 시각(Drive 메타데이터)을 리비전으로 사용"""
+        if not self.snapshot_cache:
+            return None
         try:
-            self.logger.info(f"스프레드시트 '{self.config.SPREADSHEET_NAME}' 열기")
-            self.sheet = self.client.open(self.config.SPREADSHEET_NAME).sheet1
-            data = self.sheet.get_all_records()
-            df = pd.DataFrame(data)
-            self.logger.info(f"총 {len(df)}개의 행 로드 완료")
+            return self._read('get_lastUpdateTime', spreadsheet.get_lastUpdateTime)
+        except Exception as e:
+            self.logger.warning(f"스프레드시트 리비전 조회 실패, 스냅샷 캐시를 건너뜁니다: {str(e)}")
+            return None
+
+    def invalidate_snapshot(self):
+        """현재 스프레드시트의 스냅샷 삭제 (spreadsheet를 열기 전이면 전체 삭제)"""
+        if self.snapshot_cache:
+            self.snapshot_cache.invalidate(self.spreadsheet_id)
+
+    def _fetch_full(self) -> pd.DataFrame:
+        """시트 전체를 조회"""
+        if not self.config.PROJECTED_FETCH and self.config.INGESTION_ENGINE == 'arrow':
+            values = self._read('get_all_values', self.sheet.get_all_values)
+            self.header = list(values[0]) if values else []
+            return self._records_to_frame(self.header, values[1:], first_row=2)
+        if not self.config.PROJECTED_FETCH:
+            df = self._intern_frame(pd.DataFrame(self._read('get_all_records', self.sheet.get_all_records)))
+            self.header = list(df.columns)
+            return df
+
+        # 저장된 헤더로 필수 컬럼 범위를 정하고, 헤더 행도 함께 읽어 변경 여부 확인
+        header = self._load_header()
+        for _ in range(2):
+            names, ranges = self._data_ranges(header, first_row=2)
+            header_range, *value_ranges = self._read('batch_get', self.sheet.batch_get, ['1:1'] + ranges)
+            live_header = list(header_range[0]) if header_range else []
+            if live_header == header:
+                break
+            self.logger.warning("헤더가 변경되어 컬럼 위치를 다시 계산합니다")
+            self._save_header(live_header)
+            header = live_header
+        else:
+            raise SpreadsheetError("Sheet header changed while fetching orders")
+
+        self.header = header
+        return self._records_to_frame(names, self._ranges_to_rows(value_ranges), first_row=2)
+
+    def _fetch_incremental(self) -> Optional[pd.DataFrame]:
+        """워터마크 다음 행부터만 조회. 워터마크를 쓸 수 없으면 None 반환"""
+        row = self._load_watermark()
+        if not row:
+            self.logger.info("저장된 워터마크가 없어 전체 조회합니다")
+            return None
+
+        header = self._load_header()
+        if '비고' not in header:
+            return None
+
+        # 헤더, 워터마크 행의 '비고' 셀, 새 데이터 범위, 워터마크 이전의 격리 행을 한 번에 조회
+        names, ranges = self._data_ranges(header, first_row=row + 1)
+        retry_rows = self._quarantined_before(row + 1)
+        header_range, remark_range, *value_ranges = self._read(
+            'batch_get', self.sheet.batch_get,
+            ['1:1', rowcol_to_a1(row, header.index('비고') + 1)] + ranges
+            + self._row_ranges(header, retry_rows),
+        )
+        value_ranges, retry_ranges = value_ranges[:len(ranges)], value_ranges[len(ranges):]
+        live_header = list(header_range[0]) if header_range else []
+        remark = remark_range[0][0] if remark_range and remark_range[0] else ''
+
+        # 헤더 구조가 바뀌었거나 워터마크 행의 '확인'이 사라졌다면 시트가 수동으로 편집된 것
+        if live_header != header:
+            self.logger.warning("헤더가 변경되어 워터마크를 폐기하고 전체 조회합니다")
+            self._save_header(live_header)
+            self._clear_watermark()
+            return None
+        if remark != '확인':
+            self.logger.warning(
+                f"워터마크 행({row}행)의 '비고'가 '확인'이 아닙니다 (수동 편집 감지). 전체 조회합니다"
+            )
+            self._clear_watermark()
+            return None
+
+        self.header = header
+        rows = self._ranges_to_rows(value_ranges)
+        self.logger.info(f"워터마크 {row}행 이후 {len(rows)}개 행만 조회")
+        df = self._records_to_frame(names, rows, first_row=row + 1)
+        if retry_rows:
+            df = pd.concat([self._rows_to_frame(names, retry_rows, retry_ranges), df])
+        return df
+
+    def _load_snapshot(self, revision: Optional[str]) -> Optional[pd.DataFrame]:
+        """마지막 조회 이후 시트가 바뀌지 않았다면 스냅샷의 새 주문 반환"""
+        if not revision or not self.snapshot_cache:
+            return None
+        snapshot = self.snapshot_cache.get(self.spreadsheet_id, revision)
+        if snapshot is None:
+            return None
+        self.header = snapshot['header']
+        self.new_order_rows = list(snapshot['new_order_rows'])
+        self.logger.info(
+            f"시트 변경 없음 (리비전 {revision}), 스냅샷에서 새로운 주문 {len(snapshot['orders'])}개 로드"
+        )
+        # 스냅샷에는 검증 전 주문을 저장하므로 현재 설정(상품 카탈로그 등)으로 다시 검증
+        return self._validate_orders(snapshot['orders'])
+
+    def _compact_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """반복이 많은 컬럼은 category로, 수량 컬럼은 nullable 정수로 변환해 메모리 절약"""
+        if df.empty:
+            return df
+        before = df.memory_usage(deep=True).sum()
+
+        for column in self.CATEGORICAL_COLUMNS:
+            if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+                # 고유값이 절반 이상이면 category가 오히려 더 큼
+                if df[column].nunique(dropna=False) <= len(df) // 2:
+                    df[column] = df[column].astype('category')
 
-            # 필수 컬럼 검증
-            self._validate_required_columns(df)
+        for column in self.QUANTITY_COLUMNS:
+            if column not in df.columns or isinstance(df[column].dtype, pd.Int64Dtype):
+                continue
+            values = df[column].replace('', None)
+            numeric = pd.to_numeric(values, errors='coerce')
+            # '3박스' 같은 텍스트나 소수가 있으면 원래 값을 보존
+            if numeric.notna().sum() == values.notna().sum() and (numeric.dropna().astype(float) % 1 == 0).all():
+                df[column] = numeric.astype('Int64')
 
-            # 타임스탬프 처리
-            if '타임스탬프' in df.columns:
-                df['타임스탬프'] = df['타임스탬프'].apply(self._parse_korean_timestamp)
+        after = df.memory_usage(deep=True).sum()
+        self.logger.info(
+            f"컬럼 타입 최적화: {before / 1024:,.1f}KB → {after / 1024:,.1f}KB "
+            f"({(1 - after / before) * 100:.0f}% 절약)"
+        )
+        return df
+
+    def _prepare_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """필수 컬럼 검증 후 컬럼 타입 최적화와 타임스탬프 변환 (변환 실패는 NaT로 두고 검증 단계에서 보고)"""
+        self._validate_required_columns(df)
+        df = self._compact_dtypes(df)
+        if '타임스탬프' in df.columns:
+            df['타임스탬프'] = self._parse_korean_timestamps(df['타임스탬프'])[0]
+        return df
+
+    def _validate_orders(self, df: pd.DataFrame) -> pd.DataFrame:
+        """새 주문 전체를 한 번에 검증해 validation_error 컬럼 추가 (통과한 행은 None)"""
+        df = df.assign(validation_error=OrderValidator(self.config).validate(df))
+        invalid = df['validation_error'].dropna()
+        if len(invalid):
+            self.logger.warning(f"검증 실패 주문 {len(invalid)}개")
+            for idx, error in invalid.items():
+                self.logger.warning(f"  {idx + 2}행: {error}")
+        return df
+
+    def quarantine_invalid_orders(self, orders: pd.DataFrame) -> pd.DataFrame:
+        """검증에 실패한 주문을 상태 파일에 격리하고 유효한 주문만 반환"""
+        if 'validation_error' not in orders.columns:
+            return orders
+        invalid = orders['validation_error'].notna()
+        if not invalid.any():
+            return orders
+
+        rows = {str(idx + 2): error for idx, error in orders.loc[invalid, 'validation_error'].items()}
+        with self.state_store.lock:
+            quarantined = self.state_store.get_item('quarantine', self.config.SPREADSHEET_NAME, {})
+            quarantined.update(rows)
+            self.state_store.set_item('quarantine', self.config.SPREADSHEET_NAME, quarantined)
+
+        self.new_order_rows = [row for row in self.new_order_rows if str(row) not in rows]
+        self.logger.warning(f"검증 실패 주문 {len(rows)}개를 격리했습니다 ({', '.join(rows)}행)")
+        return orders[~invalid]
+
+    def _load_quarantine(self) -> Dict[str, str]:
+        """격리된 행 번호(문자열)별 검증 실패 사유"""
+        return self.state_store.get_item('quarantine', self.config.SPREADSHEET_NAME, {})
+
+    def _release_quarantine(self, rows):
+        """'확인'된 행을 격리 목록에서 제거"""
+        rows = {str(row) for row in rows}
+        with self.state_store.lock:
+            quarantined = self._load_quarantine()
+            if not rows & set(quarantined):
+                return
+            remaining = {row: error for row, error in quarantined.items() if row not in rows}
+            if remaining:
+                self.state_store.set_item('quarantine', self.config.SPREADSHEET_NAME, remaining)
+            else:
+                self.state_store.delete_item('quarantine', self.config.SPREADSHEET_NAME)
+        self.logger.info(f"격리 해제: {', '.join(sorted(rows & set(quarantined), key=int))}행")
+
+    def _quarantined_before(self, first_row: int) -> List[int]:
+        """first_row 이전(새 주문 조회 범위 밖)에 있는 격리 행 번호"""
+        return sorted(row for row in map(int, self._load_quarantine()) if row < first_row)
+
+    def _row_ranges(self, header: List[str], rows: List[int]) -> List[str]:
+        """rows를 한 행씩 _data_ranges와 같은 컬럼으로 조회할 A1 범위 목록"""
+        return [a1 for row in rows for a1 in self._data_ranges(header, row, row)[1]]
+
+    def _rows_to_frame(self, names: List[str], rows: List[int], value_ranges: List[List[List]],
+                       pool: Optional[StringPool] = None) -> pd.DataFrame:
+        """_row_ranges로 조회한 값을 인덱스가 (행 번호 - 2)인 DataFrame으로 변환"""
+        per_row = len(value_ranges) // len(rows) if rows else 0
+        values = []
+        for i in range(len(rows)):
+            fetched = self._ranges_to_rows(value_ranges[i * per_row:(i + 1) * per_row])
+            values.append(fetched[0] if fetched else [])
+        df = self._records_to_frame(names, values, first_row=2, pool=pool)
+        df.index = pd.Index([row - 2 for row in rows])
+        return df
+
+    def _retry_mask(self, df: pd.DataFrame, confirmed: np.ndarray) -> np.ndarray:
+        """격리 목록에 있고 아직 '확인'되지 않은 행 마스크 (그사이 '확인'된 행은 격리 목록에서 제거)"""
+        quarantined = df.index.isin([int(row) - 2 for row in self._load_quarantine()])
+        if (quarantined & confirmed).any():
+            self._release_quarantine(df.index[quarantined & confirmed] + 2)
+        return quarantined & ~confirmed
+
+    @staticmethod
+    def _confirmed_mask(df: pd.DataFrame) -> np.ndarray:
+        return (df['비고'] == '확인').to_numpy(dtype=bool, na_value=False)
 
-            # 새 주문 필터링
-            last_confirmed_idx = df[df['비고'] == '확인'].index[-1] if not df[df['비고'] == '확인'].empty else -1
-            new_orders_df = df.iloc[last_confirmed_idx + 1:]
+    def _extract_new_orders(self, df: pd.DataFrame, revision: Optional[str]) -> pd.DataFrame:
+        """조회한 행에서 마지막 '확인' 이후의 새 주문과 다시 처리할 격리 행을 추려
+        상태(워터마크, 스냅샷) 갱신"""
+        self.logger.info(f"총 {len(df)}개의 행 로드 완료")
+        df = self._prepare_frame(df)
 
-            # 처리할 행들의 실제 스프레드시트 행 번호 저장 (헤더 행 고려하여 +2)
-            self.new_order_rows = [idx + 2 for idx in new_orders_df.index]
+        # 새 주문 필터링 (인덱스 = 스프레드시트 행 번호 - 2)
+        confirmed = self._confirmed_mask(df)
+        last_confirmed_idx = df.index[confirmed].max() if confirmed.any() else -1
+        # 격리했던 행은 마지막 '확인'보다 앞에 있어도 아직 '확인'되지 않았으면 다시 처리
+        retry = self._retry_mask(df, confirmed)
+        new_orders_df = df[(df.index > last_confirmed_idx) | retry]
 
-            self.logger.info(f"새로운 주문 {len(new_orders_df)}개 발견")
-            return new_orders_df
+        # 처리할 행들의 실제 스프레드시트 행 번호 저장 (헤더 행 고려하여 +2)
+        self.new_order_rows = [idx + 2 for idx in new_orders_df.index]
+
+        # 조회 중 새로 확인된 행이 있으면 워터마크 전진
+        if last_confirmed_idx >= 0:
+            watermark = self._load_watermark()
+            if not watermark or watermark < last_confirmed_idx + 2:
+                self._save_watermark(last_confirmed_idx + 2)
+
+        if revision and self.snapshot_cache:
+            self.snapshot_cache.put(self.spreadsheet_id, revision, {
+                'header': self.header,
+                'new_order_rows': self.new_order_rows,
+                'orders': new_orders_df,
+            })
+
+        self.logger.info(f"새로운 주문 {len(new_orders_df)}개 발견")
+        return self._validate_orders(new_orders_df)
+
+    def _find_last_confirmed_row(self) -> int:
+        """'비고' 컬럼만 읽어 마지막 '확인' 행 번호를 찾음 (없으면 1 = 헤더 행)
+
+        워터마크가 있으면 워터마크 행부터만 읽고, 헤더나 워터마크 행이 바뀌었으면 2행부터 다시 읽는다.
+        API는 뒤쪽 빈 셀을 잘라 반환하므로 아직 처리하지 않은 주문의 빈 '비고'는 전송되지 않는다.
+        """
+        header = self._load_header()
+        watermark = self._load_watermark() if self.config.FETCH_MODE != 'full' else None
+        start = watermark or 2
+        for _ in range(3):
+            if '비고' not in header:
+                raise DataParsingError("스프레드시트에 필수 컬럼이 없습니다: 비고")
+            col = rowcol_to_a1(1, header.index('비고') + 1).rstrip('1')
+            header_range, remark_range = self._read(
+                'batch_get', self.sheet.batch_get, ['1:1', f"{col}{start}:{col}"]
+            )
+            live_header = list(header_range[0]) if header_range else []
+            remarks = [cell[0] if cell else '' for cell in remark_range]
+
+            if live_header != header:
+                self.logger.warning("헤더가 변경되어 '비고' 컬럼을 다시 조회합니다")
+                self._save_header(live_header)
+                self._clear_watermark()
+                header, start = live_header, 2
+                continue
+            if start != 2 and (not remarks or remarks[0] != '확인'):
+                self.logger.warning(
+                    f"워터마크 행({start}행)의 '비고'가 '확인'이 아닙니다 (수동 편집 감지). 2행부터 다시 조회합니다"
+                )
+                self._clear_watermark()
+                start = 2
+                continue
+            break
+        else:
+            raise SpreadsheetError("Sheet header changed while fetching orders")
+
+        self.header = header
+        confirmed = [i for i, remark in enumerate(remarks) if remark == '확인']
+        return start + confirmed[-1] if confirmed else 1
+
+    def iter_new_orders(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """마지막 '확인' 이후의 새 주문을 chunk_size 행씩 DataFrame으로 나눠 반환하는 제너레이터"""
+        chunk_size = max(1, chunk_size or self.config.STREAM_CHUNK_SIZE)
+        try:
+            self.logger.info(f"스프레드시트 '{self.config.SPREADSHEET_NAME}' 열기 (스트리밍 조회)")
+            spreadsheet, self.sheet = self._open_sheet()
+            self.spreadsheet_id = spreadsheet.id
+            self.new_order_rows = []
+
+            last_confirmed_row = self._find_last_confirmed_row()
+            self._save_watermark(last_confirmed_row)
+            self.logger.info(f"마지막 '확인' 행: {last_confirmed_row}행, {chunk_size}행씩 조회 시작")
+
+            # 청크 사이에도 같은 발송인/상품 문자열을 공유하도록 풀 하나를 유지
+            pool = StringPool()
+
+            # 마지막 '확인' 이전의 격리 행을 먼저 다시 읽어 아직 '확인'되지 않은 행을 반환
+            retry_rows = self._quarantined_before(last_confirmed_row + 1)
+            if retry_rows:
+                names, _ = self._data_ranges(self.header, 2)
+                value_ranges = self._read('batch_get', self.sheet.batch_get,
+                                          self._row_ranges(self.header, retry_rows))
+                retry = self._prepare_frame(self._rows_to_frame(names, retry_rows, value_ranges, pool))
+                retry = retry[self._retry_mask(retry, self._confirmed_mask(retry))]
+                if len(retry):
+                    retry = self._validate_orders(retry)
+                    self.new_order_rows.extend(idx + 2 for idx in retry.index)
+                    self.logger.info(f"격리된 주문 {len(retry)}개 다시 조회")
+                    yield retry
+
+            # 시트 크기를 모르면(row_count 없음) 빈 청크에서 종료
+            row_count = getattr(self.sheet, 'row_count', None)
+            first_row = last_confirmed_row + 1
+            blank_rows = 0  # 앞 청크 끝에서 잘린 빈 행 수
+            while row_count is None or first_row <= row_count:
+                names, ranges = self._data_ranges(self.header, first_row, first_row + chunk_size - 1)
+                rows = self._ranges_to_rows(self._read('batch_get', self.sheet.batch_get, ranges))
+                if not rows:
+                    if row_count is None:
+                        break
+                    blank_rows += chunk_size
+                    first_row += chunk_size
+                    continue
+
+                # 뒤에 데이터가 있으므로 잘린 빈 행은 중간 행 (전체 조회에서도 새 주문에 포함됨)
+                start = first_row - blank_rows
+                chunk = self._records_to_frame(names, [[]] * blank_rows + rows, start, pool)
+                chunk = self._validate_orders(self._prepare_frame(chunk))
+                self.new_order_rows.extend(idx + 2 for idx in chunk.index)
+                self.logger.debug(f"{start}~{first_row + len(rows) - 1}행 조회")
+                yield chunk
+
+                blank_rows = chunk_size - len(rows)
+                first_row += chunk_size
+
+            self._log_interning(pool)
+            self.logger.info(f"새로운 주문 {len(self.new_order_rows)}개 발견")
 
         except (SpreadsheetError, DataParsingError) as e:
             self.logger.error(f"주문 조회 중 에러: {str(e)}", exc_info=True)
@@ -97,49 +608,160 @@ class GoogleSheetHandler:
             self.logger.error(f"예상치 못한 에러 발생: {str(e)}", exc_info=True)
             raise SpreadsheetError(f"Failed to get new orders: {str(e)}")
 
-    def mark_orders_as_confirmed(self):
-        """성공적으로 처리된 주문을 '확인'으로 표시"""
+    def get_new_orders(self) -> pd.DataFrame:
+        if self.config.FETCH_MODE == 'stream':
+            # 새 주문만 모아 반환 (확인된 과거 행은 메모리에 올리지 않음).
+            # 새 주문 전체를 들고 있지 않으려면 iter_new_orders를 직접 사용 (main.py의 단일 주문서 처리)
+            chunks = list(self.iter_new_orders())
+            # 청크마다 category 값 목록이 달라 합치면 object로 돌아가므로 다시 변환
+            return self._compact_dtypes(pd.concat(chunks)) if chunks else pd.DataFrame()
+
+        try:
+            self.logger.info(f"스프레드시트 '{self.config.SPREADSHEET_NAME}' 열기")
+            spreadsheet, self.sheet = self._open_sheet()
+            self.spreadsheet_id = spreadsheet.id
+
+            revision = self._get_revision(spreadsheet)
+            snapshot = self._load_snapshot(revision)
+            if snapshot is not None:
+                return snapshot
+
+            df = None
+            if self.config.FETCH_MODE == 'incremental':
+                df = self._fetch_incremental()
+            if df is None:
+                df = self._fetch_full()
+            return self._extract_new_orders(df, revision)
+
+        except (SpreadsheetError, DataParsingError) as e:
+            self.logger.error(f"주문 조회 중 에러: {str(e)}", exc_info=True)
+            raise
+        except Exception as e:
+            self.logger.error(f"예상치 못한 에러 발생: {str(e)}", exc_info=True)
+            raise SpreadsheetError(f"Failed to get new orders: {str(e)}")
+
+    def mark_orders_as_confirmed(self) -> Dict[str, bool]:
+        """성공적으로 처리된 주문을 '확인'으로 표시 (행 순서대로 배치 전송, 첫 실패에서 중단)"""
         try:
             if not self.sheet or not self.new_order_rows:
                 self.logger.info("처리할 행이 없습니다")
-                return  # 처리할 행이 없으면 종료
+                return {}  # 처리할 행이 없으면 종료
 
-            # '비고' 컬럼 찾기
-            비고_col = None
-            for idx, col in enumerate(self.sheet.row_values(1)):
-                if col == '비고':
-                    비고_col = idx + 1
-                    break
-
-            if not 비고_col:
-                self.logger.error("'비고' 컬럼을 찾을 수 없습니다")
-                raise SpreadsheetError("Could not find '비고' column")
+            header = self.header or self._read('row_values', self.sheet.row_values, 1)
+            batches = self._confirmation_batches(header)
 
-            # 모든 새 주문 행을 '확인'으로 업데이트
-            self.logger.info(f"{len(self.new_order_rows)}개 행을 '확인'으로 업데이트 시작")
-            for row_num in self.new_order_rows:
-                self.sheet.update_cell(row_num, 비고_col, '확인')
-                self.logger.debug(f"행 {row_num} 업데이트 완료")
+            outcomes = []
+            for payload in batches:
+                try:
+                    self._write('batch_update', self.sheet.batch_update, payload)
+                    outcomes.append(True)
+                except Exception as e:
+                    self.logger.warning(f"범위 {[item['range'] for item in payload]} 업데이트 실패: {str(e)}")
+                    outcomes.append(False)
+                    break
 
-            self.logger.info(f"{len(self.new_order_rows)}개 행 업데이트 완료")
+            return self._record_confirmation(batches, outcomes)
 
         except Exception as e:
             self.logger.error(f"주문 확인 처리 실패: {str(e)}", exc_info=True)
             raise SpreadsheetError(f"Failed to mark orders as confirmed: {str(e)}")
 
+    def _confirmation_batches(self, header: List[str]) -> List[List[Dict]]:
+        """new_order_rows를 '비고' 컬럼의 연속 범위로 묶어 batch_update 요청 단위로 나눔"""
+        if '비고' not in header:
+            self.logger.error("'비고' 컬럼을 찾을 수 없습니다")
+            raise SpreadsheetError("Could not find '비고' column")
+        비고_col = header.index('비고') + 1
+
+        row_ranges = self._coalesce_rows(self.new_order_rows)
+        self.logger.info(
+            f"{len(self.new_order_rows)}개 행({len(row_ranges)}개 범위)을 '확인'으로 업데이트 시작"
+        )
+
+        payload = [
+            {
+                'range': f"{rowcol_to_a1(start, 비고_col)}:{rowcol_to_a1(end, 비고_col)}",
+                'values': [['확인']] * (end - start + 1),
+            }
+            for start, end in row_ranges
+        ]
+        batch_size = max(1, self.config.CONFIRM_BATCH_SIZE)
+        return [payload[i:i + batch_size] for i in range(0, len(payload), batch_size)]
+
+    def _record_confirmation(self, batches: List[List[Dict]], outcomes: List[bool]) -> Dict[str, bool]:
+        """요청 단위 성공 여부를 범위별 결과로 기록하고 실패한 행만 재시도 대상으로 남김
+
+        outcomes가 batches보다 짧으면 첫 실패 이후 보내지 않은 배치이므로 실패로 기록한다.
+        """
+        if len(outcomes) < len(batches):
+            self.logger.warning(f"앞선 실패로 {len(batches) - len(outcomes)}개 배치를 보내지 않았습니다")
+            outcomes = list(outcomes) + [False] * (len(batches) - len(outcomes))
+
+        results = {}
+        failed_rows = []
+        confirmed_rows = []
+        for payload, succeeded in zip(batches, outcomes):
+            for item in payload:
+                results[item['range']] = succeeded
+                start, end = (a1_to_rowcol(cell)[0] for cell in item['range'].split(':'))
+                (confirmed_rows if succeeded else failed_rows).extend(range(start, end + 1))
+                self.logger.debug(f"범위 {item['range']} 업데이트 {'완료' if succeeded else '실패'}")
+
+        self.last_confirmation_results = results
+        self.new_order_rows = failed_rows
+
+        if failed_rows:
+            failed_ranges = [a1 for a1, ok in results.items() if not ok]
+            raise SpreadsheetError(
+                f"{len(failed_rows)} rows in {len(failed_ranges)} ranges were not confirmed: "
+                f"{', '.join(failed_ranges)}"
+            )
+
+        self.logger.info(f"{len(confirmed_rows)}개 행 업데이트 완료")
+        self._release_quarantine(confirmed_rows)
+        # 격리 행만 '확인'한 경우 워터마크가 뒤로 가지 않도록 전진할 때만 저장
+        watermark = self._load_watermark()
+        if not watermark or watermark < max(confirmed_rows):
+            self._save_watermark(max(confirmed_rows))
+        # 직접 수정했으므로 스냅샷은 더 이상 유효하지 않음
+        self.invalidate_snapshot()
+        return results
+
     @staticmethod
-    def _parse_korean_timestamp(timestamp_str: str) -> datetime:
-        try:
-            am_pm = 'AM' if '오전' in timestamp_str else 'PM'
-            timestamp_str = timestamp_str.replace('오전', 'AM').replace('오후', 'PM')
+    def _coalesce_rows(rows: List[int]) -> List[Tuple[int, int]]:
+        """행 번호 목록을 연속 구간 (시작 행, 끝 행) 목록으로 병합"""
+        ranges = []
+        for row in sorted(set(rows)):
+            if ranges and row == ranges[-1][1] + 1:
+                ranges[-1] = (ranges[-1][0], row)
+            else:
+                ranges.append((row, row))
+        return ranges
 
-            parts = timestamp_str.replace('.', '').strip().split()
-            year = parts[0]
-            month = parts[1].zfill(2)
-            day = parts[2].zfill(2)
-            time = parts[4]
+    @staticmethod
+    def _parse_korean_timestamps(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """'2024. 12. 5. 오후 3:45:23' 형식의 컬럼 전체를 한 번에 datetime으로 변환
 
-            formatted_str = f"{year}-{month}-{day} {am_pm} {time}"
-            return pd.to_datetime(formatted_str, format='%Y-%m-%d %p %H:%M:%S')
-        except Exception as e:
-            raise DataParsingError(f"Failed to parse timestamp '{timestamp_str}': {str(e)}")
+        정규식 하나로 연/월/일/오전·오후/시각을 뽑아 to_datetime을 한 번만 호출한다.
+        Arrow 문자열 컬럼은 정규식 추출이 Arrow compute 커널(extract_regex)로 실행된다.
+        (변환 결과, 변환 실패 행 마스크)를 반환하며 실패한 행의 값은 NaT다.
+        """
+        parts = as_text(values).str.extract(KOREAN_TIMESTAMP_PATTERN)
+        fields = parts[['year', 'month', 'day', 'hour', 'minute', 'second']].astype(float)
+
+        # 12시간제 → 24시간제 (오전 12시 = 0시, 오후 3시 = 15시). 오전/오후가 없으면 24시간제로 간주
+        meridiem = parts['meridiem']
+        afternoon = (meridiem == '오후').fillna(False).astype(bool)
+        fields['hour'] = fields['hour'].where(
+            meridiem.isna(), fields['hour'] % 12 + afternoon * 12
+        )
+
+        parsed = pd.to_datetime(fields, errors='coerce')
+        return parsed, parsed.isna()
+
+    @staticmethod
+    def _parse_korean_timestamp(timestamp_str: str) -> datetime:
+        parsed, invalid = GoogleSheetHandler._parse_korean_timestamps(pd.Series([timestamp_str]))
+        if invalid.iloc[0]:
+            raise DataParsingError(f"Failed to parse timestamp '{timestamp_str}'")
+        return parsed.iloc[0]
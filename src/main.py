@@ -1,28 +1,125 @@
 from config.config import Config
 from handlers.sheet_handler import GoogleSheetHandler
+from handlers.async_sheet_handler import AsyncGoogleSheetHandler
 from handlers.order_processor import OrderProcessor
+from handlers.request_scheduler import RequestScheduler
+from handlers.sheet_backend import SheetBackend
+from handlers.fake_sheet_backend import FakeSheetBackend
 from formatters.label_formatter import LabelFormatter
 from exceptions.exceptions import OrderProcessingError, SpreadsheetError, DataParsingError
 from utils.logger import setup_logger, get_logger
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+import argparse
 import sys
+from typing import Callable, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+import pandas as pd
 
 class OrderManagementSystem:
-    def __init__(self):
+    def __init__(self, sheet_handler: Optional[str] = None, backend: Optional[SheetBackend] = None,
+                 output: Optional[str] = None):
         self.config = Config()
         self.logger = get_logger(__name__)
-        self.sheet_handler = GoogleSheetHandler(self.config)
+        self.output = output  # 라벨을 기록할 파일 경로 (없으면 표준 출력)
+
+        # 주문서별 핸들러 (쿼터는 서비스 계정 단위이므로 스케줄러는 공유)
+        kind = sheet_handler or self.config.SHEET_HANDLER
+        self.scheduler = RequestScheduler(
+            read_per_minute=self.config.SHEETS_READ_QUOTA_PER_MINUTE,
+            write_per_minute=self.config.SHEETS_WRITE_QUOTA_PER_MINUTE,
+            max_retries=self.config.SHEETS_MAX_RETRIES,
+        )
+        self.sheet_handlers = {
+            name: self._create_sheet_handler(kind, self.config.for_source(name), backend)
+            for name in self.config.SPREADSHEET_SOURCES
+        }
+        self.sheet_handler = next(iter(self.sheet_handlers.values()))
         self.label_formatter = LabelFormatter(self.config)
         self.order_processor = OrderProcessor(self.config)
 
+    def _create_sheet_handler(self, kind: str, config: Config,
+                              backend: Optional[SheetBackend] = None) -> GoogleSheetHandler:
+        """'sync' | 'async' 중 선택한 시트 핸들러 생성 (backend는 sync 핸들러에서만 사용)"""
+        if kind == 'async':
+            if backend is not None:
+                raise ValueError("async 핸들러는 Sheets REST API를 직접 호출하므로 backend를 지정할 수 없습니다")
+            return AsyncGoogleSheetHandler(config, self.scheduler)
+        if kind != 'sync':
+            raise ValueError(f"알 수 없는 SHEET_HANDLER 값입니다: {kind} (sync 또는 async)")
+        return GoogleSheetHandler(config, self.scheduler, backend)
+
+    def _run_per_source(self, action: Callable[[GoogleSheetHandler], object],
+                        names) -> Tuple[Dict[str, object], Dict[str, Exception]]:
+        """주문서별 작업을 스레드 풀에서 실행 (한 주문서의 오류는 다른 주문서에 영향 없음)"""
+        names = list(names)
+        results, errors = {}, {}
+        if not names:
+            return results, errors
+
+        workers = max(1, min(self.config.MAX_SOURCE_WORKERS, len(names)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sheet') as executor:
+            futures = {name: executor.submit(action, self.sheet_handlers[name]) for name in names}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    self.logger.error(f"[{name}] 처리 실패: {str(e)}", exc_info=True)
+                    errors[name] = e
+        return results, errors
+
+    def _fetch_valid_orders(self, handler: GoogleSheetHandler) -> pd.DataFrame:
+        """새 주문을 조회하고 검증에 실패한 주문은 격리해 라벨/'확인' 대상에서 제외"""
+        return self._drop_invalid_orders(handler, handler.get_new_orders())
+
+    def _drop_invalid_orders(self, handler: GoogleSheetHandler, new_orders: pd.DataFrame) -> pd.DataFrame:
+        valid_orders = handler.quarantine_invalid_orders(new_orders)
+        skipped = len(new_orders) - len(valid_orders)
+        if skipped:
+            print(
+                f"[{handler.config.SPREADSHEET_NAME}] 검증 실패로 제외된 주문 {skipped}개 "
+                f"(사유는 로그 또는 {self.config.STATE_FILE}의 quarantine 참고)",
+                file=sys.stderr,
+            )
+        return valid_orders
+
+    @contextmanager
+    def _label_output(self) -> Iterator[TextIO]:
+        if not self.output:
+            yield sys.stdout
+            return
+        with open(self.output, 'w', encoding='utf-8') as out:
+            yield out
+        print(f"라벨을 {self.output}에 저장했습니다.")
+
+    def _write_labels(self, chunks: Iterable[pd.DataFrame]):
+        """라벨을 만들어지는 대로 출력 (전체 라벨 문자열을 한 번에 만들지 않음)"""
+        with self._label_output() as out:
+            self.label_formatter.write_label_chunks(chunks, out)
+            out.write("\n")
+
+    def _merge_orders(self, orders: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """주문서 설정 순서대로 이어 붙여 실행마다 같은 라벨 순서가 나오도록 병합"""
+        frames = [orders[name] for name in self.sheet_handlers if name in orders and not orders[name].empty]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames)
+
     def process_new_orders(self):
         try:
             self.logger.info("주문 처리 시작")
-            new_orders = self.sheet_handler.get_new_orders()
+            if len(self.sheet_handlers) > 1:
+                self._process_sources()
+                return
+            if self.config.FETCH_MODE == 'stream':
+                self._process_stream()
+                return
+
+            new_orders = self._fetch_valid_orders(self.sheet_handler)
 
             if not new_orders.empty:
                 self.logger.info(f"{len(new_orders)}개의 새로운 주문 처리 중")
-                formatted_labels = self.label_formatter.format_labels(new_orders)
-                print(formatted_labels)
+                self._write_labels([new_orders])
 
                 # 모든 처리가 성공적으로 완료된 후에만 '확인' 표시
                 self.sheet_handler.mark_orders_as_confirmed()
@@ -39,9 +136,82 @@ class OrderManagementSystem:
             self.logger.error(f"예상치 못한 오류 발생: {str(e)}", exc_info=True)
             print(f"예상치 못한 오류: {str(e)}", file=sys.stderr)
             sys.exit(1)
+        finally:
+            self.scheduler.log_metrics()
+
+    def _process_stream(self):
+        """FETCH_MODE=stream: 청크마다 검증하고 라벨을 출력한 뒤 다음 청크를 조회
+
+        새 주문 전체를 모으지 않으므로 메모리 사용량이 STREAM_CHUNK_SIZE에 비례한다.
+        '확인' 표시는 모든 청크의 라벨을 출력한 뒤에 한 번만 한다.
+        """
+        handler = self.sheet_handler
+        chunks = (self._drop_invalid_orders(handler, chunk) for chunk in handler.iter_new_orders())
+        chunks = (chunk for chunk in chunks if not chunk.empty)
+        first = next(chunks, None)
+        if first is None:
+            self.logger.info("새로운 주문이 없습니다")
+            print("새로운 주문이 없습니다.")
+            return
+
+        self.logger.info("새로운 주문을 청크 단위로 처리 중")
+        self._write_labels(chain([first], chunks))
+        handler.mark_orders_as_confirmed()
+        self.logger.info("주문 처리 완료")
+
+    def _process_sources(self):
+        """여러 주문서를 동시에 조회하고, 라벨을 한 번에 출력한 뒤 주문서별로 '확인' 표시"""
+        orders, errors = self._run_per_source(self._fetch_valid_orders, self.sheet_handlers)
+        for name, df in orders.items():
+            self.logger.info(f"[{name}] 새로운 주문 {len(df)}개")
+
+        new_orders = self._merge_orders(orders)
+        if not new_orders.empty:
+            self.logger.info(f"{len(orders)}개 주문서에서 {len(new_orders)}개의 새로운 주문 처리 중")
+            self._write_labels([new_orders])
+
+            to_confirm = [name for name, df in orders.items() if not df.empty]
+            _, confirm_errors = self._run_per_source(
+                lambda handler: handler.mark_orders_as_confirmed(), to_confirm
+            )
+            errors.update(confirm_errors)
+        else:
+            self.logger.info("새로운 주문이 없습니다")
+            print("새로운 주문이 없습니다.")
+
+        if errors:
+            # 성공한 주문서는 처리를 마친 뒤 실패한 주문서만 보고
+            raise SpreadsheetError(
+                "Failed sources: " + ", ".join(f"{name} ({str(e)})" for name, e in errors.items())
+            )
+        self.logger.info("주문 처리 완료")
+
+    def close(self):
+        for handler in self.sheet_handlers.values():
+            handler.close()
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='감귤 주문 배송 라벨 생성')
+    parser.add_argument('--refresh', action='store_true',
+                        help='스냅샷 캐시를 비우고 스프레드시트를 다시 조회')
+    parser.add_argument('--handler', choices=['sync', 'async'],
+                        help='시트 핸들러 선택 (기본: SHEET_HANDLER 환경변수 또는 sync)')
+    parser.add_argument('--fake-csv', metavar='PATH',
+                        help='Google Sheets 대신 CSV 파일을 메모리 시트로 사용 (오프라인 실행)')
+    parser.add_argument('--output', '-o', metavar='PATH',
+                        help='라벨을 표준 출력 대신 파일에 기록')
+    args = parser.parse_args()
+
     # 루트 로거 설정
     setup_logger('root', log_file='logs/tangerine.log')
-    system = OrderManagementSystem()
-    system.process_new_orders()
\ No newline at end of file
+    backend = None
+    if args.fake_csv:
+        backend = FakeSheetBackend.from_csv(args.fake_csv, title=Config().SPREADSHEET_NAME)
+    system = OrderManagementSystem(sheet_handler=args.handler, backend=backend, output=args.output)
+    if args.refresh:
+        for handler in system.sheet_handlers.values():
+            handler.invalidate_snapshot()
+    try:
+        system.process_new_orders()
+    finally:
+        system.close()
@@ -0,0 +1,3 @@
+from .order_summary import OrderSummary, ProductTotal
+
+__all__ = ['OrderSummary', 'ProductTotal']
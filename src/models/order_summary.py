@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+
+@dataclass(frozen=True)
+class ProductTotal:
+    """상품 하나의 주문 합계 (박스 수와 금액)"""
+    name: str
+    quantity: int
+    price: int
+
+    @property
+    def revenue(self) -> int:
+        return self.quantity * self.price
+
+
+@dataclass(frozen=True)
+class OrderSummary:
+    """주문 묶음 하나의 상품별 합계 (카탈로그 순서, 주문이 없는 상품은 0박스)
+
+    생성 후 바뀌지 않는 값 객체라서 라벨 생성기를 여러 스레드가 함께 써도 합계가 섞이지 않는다.
+    """
+    products: Tuple[ProductTotal, ...] = ()
+
+    @property
+    def total_quantity(self) -> int:
+        return sum(product.quantity for product in self.products)
+
+    @property
+    def total_revenue(self) -> int:
+        return sum(product.revenue for product in self.products)
+
+    def __add__(self, other: 'OrderSummary') -> 'OrderSummary':
+        """두 주문 묶음을 합친 합계 (청크별 합계를 누적할 때 사용, 상품 순서는 먼저 나온 순)"""
+        totals = {product.name: product for product in self.products}
+        for product in other.products:
+            current = totals.get(product.name)
+            totals[product.name] = product if current is None else ProductTotal(
+                product.name, current.quantity + product.quantity, current.price
+            )
+        return OrderSummary(tuple(totals.values()))
+
+    def get(self, name: str) -> Optional[ProductTotal]:
+        for product in self.products:
+            if product.name == name:
+                return product
+        return None
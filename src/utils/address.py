@@ -0,0 +1,86 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# 같은 주소가 시즌 내내 반복되므로 정규화 결과를 캐시
+ADDRESS_CACHE_SIZE = 8192
+
+# 광역 시/도 표기 통일 (정규화 키에서는 짧은 이름 사용)
+PROVINCE_ALIASES = {
+    '제주특별자치도': '제주', '제주도': '제주',
+    '서울특별시': '서울', '서울시': '서울',
+    '부산광역시': '부산', '부산시': '부산',
+    '대구광역시': '대구', '대구시': '대구',
+    '인천광역시': '인천', '인천시': '인천',
+    '광주광역시': '광주',
+    '대전광역시': '대전', '대전시': '대전',
+    '울산광역시': '울산', '울산시': '울산',
+    '세종특별자치시': '세종', '세종시': '세종',
+    '경기도': '경기',
+    '강원특별자치도': '강원', '강원도': '강원',
+    '충청북도': '충북', '충청남도': '충남',
+    '전북특별자치도': '전북', '전라북도': '전북', '전라남도': '전남',
+    '경상북도': '경북', '경상남도': '경남',
+}
+
+_PROVINCE_NAMES = set(PROVINCE_ALIASES) | set(PROVINCE_ALIASES.values())
+
+_BRACKETS = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+_PUNCTUATION = re.compile(r'[,.#·~/]')
+_DASH = re.compile(r'(\d)\s*-\s*(\d)')
+# 도로명과 건물번호가 붙은 경우 분리 (예: '중앙로1' → '중앙로 1')
+_ROAD_NUMBER = re.compile(r'(?<=[가-힣])(로|길)(?=\d)')
+# 끝에 붙은 동/호/층 (예: '101동 202호', '3층')
+_TRAILING_UNIT = re.compile(r'(\s+[A-Za-z]?\d+\s*(동|호|층))+$')
+_SPACES = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def normalize_address(address: str) -> str:
+    """같은 주소를 다르게 입력한 경우를 하나로 묶기 위한 비교용 주소 키
+
+    공백/유니코드(NFC)/문장부호를 정리하고, 시/도 이름과 도로명-건물번호 띄어쓰기를 통일한 뒤
+    끝에 붙은 동/호/층을 제거한다. 라벨에 출력하는 값이 아니라 그룹화에만 사용한다.
+    """
+    text = unicodedata.normalize('NFC', address).strip()
+    text = _BRACKETS.sub(' ', text)
+    text = _PUNCTUATION.sub(' ', text)
+    text = _DASH.sub(r'\1-\2', text)
+    text = _ROAD_NUMBER.sub(r'\1 ', text)
+    text = _SPACES.sub(' ', text).strip()
+
+    tokens = text.split(' ')
+    if tokens and tokens[0] in _PROVINCE_NAMES:
+        if len(tokens) > 1 and tokens[1].endswith(('시', '군')):
+            # 시/군 이름으로 지역이 정해지면 시/도는 생략 (예: '제주특별자치도 제주시' = '제주시')
+            tokens = tokens[1:]
+        else:
+            tokens[0] = PROVINCE_ALIASES.get(tokens[0], tokens[0])
+    text = ' '.join(tokens)
+
+    return _TRAILING_UNIT.sub('', text).lower()
+
+
+def normalize_text(value: str) -> str:
+    """이름 등 짧은 문자열의 비교용 키 (NFC, 공백 정리)"""
+    return _SPACES.sub(' ', unicodedata.normalize('NFC', value)).strip()
+
+
+def canonical_keys(values: pd.Series, normalizer=normalize_address) -> pd.Series:
+    """컬럼의 고유값만 정규화해 행 전체의 비교용 키를 만듦 (빈 값은 '')
+
+    category 컬럼은 다시 factorize하지 않고 카테고리만 정규화해 기존 코드로 펼친다.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # 코드 -1(빈 값)은 끝에 붙인 ''를 가리킴
+        keys = np.array(
+            [normalizer(value) for value in values.cat.categories.astype(str)] + [''], dtype=object
+        )
+        return pd.Series(keys[values.cat.codes.to_numpy()], index=values.index, dtype=object)
+
+    codes, uniques = pd.factorize(values.astype(object).where(values.notna(), '').astype(str))
+    keys = np.array([normalizer(value) for value in uniques], dtype=object)
+    return pd.Series(keys[codes] if len(codes) else [], index=values.index, dtype=object)
@@ -0,0 +1,46 @@
+from typing import Any, List
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ModuleNotFoundError:  # pragma: no cover - 선택 의존성
+    pa = None
+
+
+def is_arrow_string(values: pd.Series) -> bool:
+    """Arrow 문자열 dtype(string[pyarrow]) 컬럼인지 여부"""
+    dtype = values.dtype
+    return isinstance(dtype, pd.ArrowDtype) and pa.types.is_string(dtype.pyarrow_dtype)
+
+
+def as_text(values: pd.Series) -> pd.Series:
+    """문자열 연산용 컬럼. Arrow 문자열 컬럼은 그대로 두어 .str 연산이 Arrow compute 커널로 실행되게 한다"""
+    if is_arrow_string(values):
+        return values
+    return values.astype(str)
+
+
+def _string_array(values: List[Any]) -> 'pa.Array':
+    try:
+        return pa.array(values, type=pa.string())
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        # 백엔드가 숫자 셀을 그대로 준 경우 (Sheets API는 항상 표시 문자열을 반환)
+        return pa.array(['' if value is None else str(value) for value in values], type=pa.string())
+
+
+def rows_to_arrow_frame(header: List[str], rows: List[List[Any]], first_row: int) -> pd.DataFrame:
+    """시트 값 목록을 pyarrow Table로 바로 적재해 Arrow 문자열 dtype의 DataFrame으로 반환
+
+    get_all_records처럼 셀마다 숫자 변환(numericise)을 하지 않으므로 모든 셀은 시트에 보이는
+    문자열 그대로이고(빈 셀은 ''), 연락처 앞자리 0도 보존된다. 수량 컬럼의 정수 변환은
+    GoogleSheetHandler._compact_dtypes에서 컬럼 단위로 처리한다.
+    인덱스는 전체 조회와 같도록 (스프레드시트 행 번호 - 2)로 맞춘다.
+    """
+    width = len(header)
+    padded = [row[:width] if len(row) >= width else list(row) + [''] * (width - len(row)) for row in rows]
+    columns = list(zip(*padded)) if padded else [()] * width
+    table = pa.Table.from_arrays([_string_array(list(column)) for column in columns], names=list(header))
+    df = table.to_pandas(types_mapper=pd.ArrowDtype)
+    df.index = pd.RangeIndex(first_row - 2, first_row - 2 + len(padded))
+    return df
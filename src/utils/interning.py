@@ -0,0 +1,63 @@
+import sys
+from typing import Any, Dict
+
+import pandas as pd
+
+
+def holds_str_objects(dtype) -> bool:
+    """컬럼이 셀의 파이썬 str 객체를 그대로 들고 있는지 여부
+
+    object 컬럼과 python 저장소 문자열 dtype만 해당한다. Arrow 기반 문자열 컬럼
+    (pyarrow가 있을 때 pandas 3의 기본 str dtype, ArrowDtype)은 값을 Arrow 버퍼로 복사한다.
+    """
+    return dtype == object or (isinstance(dtype, pd.StringDtype) and dtype.storage == 'python')
+
+
+class StringPool:
+    """같은 값의 셀 문자열을 객체 하나로 공유하는 조회 단위 문자열 풀
+
+    시트 응답은 같은 발송인 이름/주소, 상품명이 셀마다 별도의 str 객체로 만들어진다.
+    str 객체를 그대로 들고 있는 컬럼(숫자와 문자열이 섞인 object 컬럼, pyarrow가 없을 때의
+    문자열 컬럼)은 풀을 거치면 중복 문자열이 먼저 나온 객체 하나를 가리키게 되어
+    스냅샷 캐시나 상주 프로세스처럼 데이터를 오래 들고 있는 경우의 메모리가 줄어든다.
+    Arrow 기반 문자열 컬럼은 공유할 객체가 없으므로 건너뛰고 통계에도 넣지 않는다.
+    sys.intern과 달리 풀을 버리면 함께 해제된다.
+    """
+
+    def __init__(self):
+        self._pool: Dict[str, str] = {}
+        self.shared = 0  # 기존 객체로 대체한 셀 수
+        self.saved_bytes = 0  # 대체되어 해제 가능한 중복 문자열 크기
+
+    @property
+    def unique_count(self) -> int:
+        return len(self._pool)
+
+    def intern(self, value: Any) -> Any:
+        if type(value) is not str:
+            return value
+        shared = self._pool.setdefault(value, value)
+        if shared is not value:
+            self.shared += 1
+            self.saved_bytes += sys.getsizeof(value)
+        return shared
+
+    def intern_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """str 객체를 그대로 들고 있는 컬럼의 문자열을 풀의 객체로 교체 (제자리 변경)"""
+        intern = self.intern
+        for column in df.columns:
+            dtype = df[column].dtype
+            if not holds_str_objects(dtype):
+                continue
+            values = [intern(value) for value in df[column].tolist()]
+            # object 컬럼에 목록을 그대로 넣으면 str dtype으로 다시 추론되므로 dtype을 명시
+            df[column] = pd.Series(
+                values if dtype == object else pd.array(values, dtype=dtype), index=df.index, dtype=dtype
+            )
+        return df
+
+    def summary(self) -> str:
+        return (
+            f"고유 문자열 {self.unique_count:,}개, 중복 셀 {self.shared:,}개 공유 "
+            f"({self.saved_bytes / 1024:,.1f}KB 절약)"
+        )
@@ -0,0 +1,113 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+
+class SnapshotCache:
+    """스프레드시트 id와 리비전(수정 시각)을 키로 하는 디스크 스냅샷 캐시
+
+    스프레드시트마다 가장 최근 리비전의 스냅샷 하나만 유지하며,
+    전체 개수/용량/보관 기간을 넘는 항목은 오래된 순서로 삭제한다.
+    """
+
+    SUFFIX = '.snapshot'
+
+    def __init__(self, cache_dir: str, max_entries: int = 5,
+                 max_bytes: int = 50 * 1024 * 1024, max_age_seconds: int = 7 * 24 * 3600):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.logger = get_logger(__name__)
+
+    def _path(self, spreadsheet_id: str, revision: str) -> str:
+        digest = hashlib.sha1(revision.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{spreadsheet_id}.{digest}{self.SUFFIX}")
+
+    def _entries(self) -> List[Tuple[str, float, int]]:
+        """(경로, 수정 시각, 크기) 목록을 오래된 순으로 반환"""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self.SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return sorted(entries, key=lambda entry: entry[1])
+
+    def _remove(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def get(self, spreadsheet_id: str, revision: str) -> Optional[Any]:
+        path = self._path(spreadsheet_id, revision)
+        if not os.path.exists(path):
+            return None
+
+        if time.time() - os.path.getmtime(path) > self.max_age_seconds:
+            self._remove(path)
+            return None
+
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"스냅샷을 읽을 수 없어 삭제합니다 ({path}): {str(e)}")
+            self._remove(path)
+            return None
+
+        # 최근 사용 시각 갱신 (용량 초과 시 오래 안 쓴 항목부터 삭제)
+        os.utime(path)
+        return value
+
+    def put(self, spreadsheet_id: str, revision: str, value: Any):
+        # 같은 스프레드시트의 이전 리비전은 더 이상 쓸모없으므로 제거
+        self.invalidate(spreadsheet_id)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        path = self._path(spreadsheet_id, revision)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            self._remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def invalidate(self, spreadsheet_id: Optional[str] = None):
+        """스냅샷 삭제 (spreadsheet_id가 없으면 전체 삭제)"""
+        for path, _, _ in self._entries():
+            if spreadsheet_id is None or os.path.basename(path).startswith(f"{spreadsheet_id}."):
+                self._remove(path)
+
+    def evict(self):
+        """보관 기간, 개수, 용량 제한을 넘는 스냅샷 삭제"""
+        now = time.time()
+        entries = []
+        for path, mtime, size in self._entries():
+            if now - mtime > self.max_age_seconds:
+                self._remove(path)
+            else:
+                entries.append((path, mtime, size))
+
+        total_bytes = sum(size for _, _, size in entries)
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            path, _, size = entries.pop(0)
+            self._remove(path)
+            total_bytes -= size
+            self.logger.debug(f"스냅샷 삭제: {path}")
@@ -0,0 +1,88 @@
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+from utils.logger import get_logger
+
+
+# 같은 파일을 쓰는 여러 스레드(주문서별 핸들러)가 서로의 변경을 덮어쓰지 않도록 경로별 잠금 사용
+_locks: Dict[str, threading.RLock] = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(path: str) -> threading.RLock:
+    with _locks_guard:
+        return _locks.setdefault(os.path.abspath(path), threading.RLock())
+
+
+class JsonStateStore:
+    """실행 간에 유지되는 작은 상태값을 JSON 파일에 저장"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = _lock_for(path)
+        self.logger = get_logger(__name__)
+
+    def _load(self) -> Dict[str, Any]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, json.JSONDecodeError) as e:
+            # 손상된 상태 파일은 무시하고 처음부터 다시 시작
+            self.logger.warning(f"상태 파일을 읽을 수 없어 무시합니다 ({self.path}): {str(e)}")
+            return {}
+
+    def _save(self, data: Dict[str, Any]):
+        state_dir = os.path.dirname(self.path)
+        if state_dir and not os.path.exists(state_dir):
+            os.makedirs(state_dir)
+
+        # 임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 파일이 깨지지 않도록 함
+        fd, tmp_path = tempfile.mkstemp(dir=state_dir or None, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        with self.lock:
+            return self._load().get(key, default)
+
+    def set(self, key: str, value: Any):
+        with self.lock:
+            data = self._load()
+            data[key] = value
+            self._save(data)
+
+    def delete(self, key: str):
+        with self.lock:
+            data = self._load()
+            if key in data:
+                del data[key]
+                self._save(data)
+
+    def get_item(self, section: str, name: str, default: Optional[Any] = None) -> Any:
+        """section 딕셔너리 안의 name 값 조회 (예: 'watermarks' 안의 스프레드시트별 값)"""
+        return self.get(section, {}).get(name, default)
+
+    def set_item(self, section: str, name: str, value: Any):
+        with self.lock:
+            data = self._load()
+            data.setdefault(section, {})[name] = value
+            self._save(data)
+
+    def delete_item(self, section: str, name: str):
+        with self.lock:
+            data = self._load()
+            if name in data.get(section, {}):
+                del data[section][name]
+                self._save(data)
@@ -0,0 +1,91 @@
+import os
+import sys
+import types
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Provide a minimal dotenv stub if python-dotenv is missing
+if 'dotenv' not in sys.modules:
+    sys.modules['dotenv'] = types.SimpleNamespace(load_dotenv=lambda: None)
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from formatters.label_formatter import LabelFormatter
+from utils.address import canonical_keys, normalize_address
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "제주시 중앙로 1",
+        "제주시  중앙로1",
+        "제주특별자치도 제주시 중앙로 1",
+        "제주시 중앙로 1, 101동 202호",
+        "제주시 중앙로 1 (이도이동)",
+        "각 제주시 중앙로 1".replace("각 ", ""),
+    ],
+)
+def test_address_variants_share_a_key(address):
+    assert normalize_address(address) == "제주시 중앙로 1"
+
+
+def test_different_addresses_keep_different_keys():
+    keys = {normalize_address(a) for a in ["제주시 중앙로 1", "제주시 중앙로 12", "서귀포시 중앙로 1"]}
+    assert len(keys) == 3
+    assert normalize_address("제주시 중앙로 12 - 3") == "제주시 중앙로 12-3"
+
+
+def test_canonical_keys_normalizes_each_unique_value_once():
+    normalize_address.cache_clear()
+    values = pd.Series(["제주시 중앙로1", None, "제주시 중앙로 1"] * 100)
+
+    keys = canonical_keys(values)
+
+    assert keys.iloc[:3].tolist() == ["제주시 중앙로 1", "", "제주시 중앙로 1"]
+    assert normalize_address.cache_info().misses == 3
+
+
+def test_canonical_keys_reuses_category_codes():
+    values = pd.Series(["제주시 중앙로1", None, "제주시 중앙로 1", "서귀포시 일주로 2"] * 50)
+    categorical = values.astype('category')
+    normalized = []
+
+    def normalizer(value):
+        normalized.append(value)
+        return normalize_address(value)
+
+    keys = canonical_keys(categorical, normalizer)
+
+    # 행이 아닌 카테고리마다 한 번만 정규화하고, 결과는 object 컬럼과 같음
+    assert sorted(normalized) == sorted(categorical.cat.categories)
+    assert keys.tolist() == canonical_keys(values).tolist()
+    assert canonical_keys(categorical.iloc[:0]).tolist() == []
+
+
+def test_same_sender_typed_differently_gets_one_label_block():
+    config = types.SimpleNamespace(
+        PRODUCT_CATALOG=[{'name': '5kg', 'price': 20000}, {'name': '10kg', 'price': 35000}],
+        DEFAULT_SENDER={'address': '기본 주소', 'name': '기본', 'phone': '010-0000-0000'},
+        LABEL_TEMPLATE={},
+    )
+    df = pd.DataFrame({
+        '타임스탬프': pd.to_datetime(['2024-12-05 10:00', '2024-12-05 11:00']),
+        '보내는분 성함': ['홍길동', '홍길동 '],
+        '보내는분 주소 (도로명 주소로 부탁드려요)': ['제주시 중앙로 1', '제주특별자치도 제주시 중앙로1 101호'],
+        '보내는분 연락처 (핸드폰번호)': [1012345678, '010-1234-5678'],
+        '받으실분 성함': ['김철수', '이영희'],
+        '받으실분 주소 (도로명 주소로 부탁드려요)': ['서울시 종로 1', '부산시 중앙대로 2'],
+        '받으실분 연락처 (핸드폰번호)': ['01098765432', '01011112222'],
+        '상품 선택': ['5kg', '10kg'],
+        '5kg 수량': [2, ''],
+        '10kg 수량': ['', 1],
+    })
+
+    labels = LabelFormatter(config).format_labels(df)
+
+    assert labels.count("보내는사람") == 1
+    assert "제주시 중앙로 1 홍길동 010-1234-5678" in labels
+    assert "김철수" in labels and "이영희" in labels
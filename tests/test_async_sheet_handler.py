@@ -0,0 +1,187 @@
+import asyncio
+import json
+import os
+import sys
+import types
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Provide a minimal dotenv stub if python-dotenv is missing
+if 'dotenv' not in sys.modules:
+    sys.modules['dotenv'] = types.SimpleNamespace(load_dotenv=lambda: None)
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('gspread')
+pytest.importorskip('aiohttp')
+rsa = pytest.importorskip('rsa')
+
+from exceptions.exceptions import SpreadsheetError
+from handlers.async_sheet_handler import AsyncGoogleSheetHandler
+from handlers.request_scheduler import RequestScheduler
+
+HEADER = [
+    '타임스탬프', '비고', '보내는분 성함', '보내는분 주소 (도로명 주소로 부탁드려요)',
+    '보내는분 연락처 (핸드폰번호)', '받으실분 성함', '받으실분 주소 (도로명 주소로 부탁드려요)',
+    '받으실분 연락처 (핸드폰번호)', '상품 선택', '5kg 수량', '10kg 수량',
+]
+
+
+def make_row(day, remark=''):
+    return [
+        f'2024. 12. {day}. 오후 3:45:23', remark, '홍길동', '제주시 중앙로 1', '01012345678',
+        '김철수', '서울시 종로 1', '01098765432', '5kg', '2', '',
+    ]
+
+
+class FakeSheetsApi:
+    """_request를 대신해 Sheets/Drive REST 응답을 흉내내는 가짜 API"""
+
+    def __init__(self, rows):
+        self.grid = [HEADER] + [list(row) for row in rows]
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def values(self, a1):
+        a1 = a1.split('!')[-1]
+        if a1 == '1:1':
+            return [self.grid[0]]
+        start, _, end = a1.partition(':')
+        col = ord(start[0]) - ord('A')
+        first = int(start[1:])
+        if not end:
+            return [[self.grid[first - 1][col]]]
+        last = int(end[1:]) if end[1:] else None
+        return [row[col:] if end[0] != start[0] else [row[col]] for row in self.grid[first - 1:last]]
+
+    async def request(self, kind, name, method, url, **kwargs):
+        self.requests.append(name)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        if name == 'batch_get':
+            ranges = [value for key, value in kwargs['params'] if key == 'ranges']
+            return {'valueRanges': [{'values': self.values(a1)} for a1 in ranges]}
+        if name == 'batch_update':
+            for item in kwargs['json']['data']:
+                start, end = item['range'].split('!')[-1].split(':')
+                for row in range(int(start[1:]), int(end[1:]) + 1):
+                    self.grid[row - 1][1] = '확인'
+            return {}
+        if name == 'get_lastUpdateTime':
+            return {'modifiedTime': '2024-12-05T06:45:23.000Z'}
+        raise AssertionError(f'unexpected request {name}')
+
+
+@pytest.fixture(scope='module')
+def credentials_json():
+    """토큰을 발급받지 않는 테스트용 서비스 계정 (개인 키 형식만 유효)"""
+    _, private_key = rsa.newkeys(512)
+    return json.dumps({
+        'type': 'service_account',
+        'client_email': 'tangerine-test@example.iam.gserviceaccount.com',
+        'client_id': '0',
+        'private_key_id': 'test',
+        'private_key': private_key.save_pkcs1().decode('ascii'),
+    })
+
+
+def make_config(tmp_path, credentials_json):
+    return types.SimpleNamespace(
+        CREDENTIALS_JSON=credentials_json,
+        CREDENTIALS_FILE=str(tmp_path / 'credentials.json'),
+        STATE_FILE=str(tmp_path / 'state.json'),
+        SNAPSHOT_CACHE_ENABLED=False,
+        CONFIRM_BATCH_SIZE=1,
+        SPREADSHEET_NAME='감귤 주문서(응답)',
+        SPREADSHEET_ID=None,
+        REQUIRED_COLUMNS=HEADER,
+        PRODUCT_CATALOG=[{'name': '5kg', 'price': 20000}, {'name': '10kg', 'price': 35000}],
+        FETCH_MODE='incremental',
+        PROJECTED_FETCH=True,
+        INGESTION_ENGINE='python',
+        ASYNC_MAX_CONNECTIONS=8,
+    )
+
+
+@pytest.fixture
+def make_handler(tmp_path, credentials_json):
+    """생성자로 만든 핸들러 (HTTP 요청만 가짜 API로 대체)"""
+    def make(api):
+        handler = AsyncGoogleSheetHandler(
+            make_config(tmp_path, credentials_json), RequestScheduler(sleep=lambda seconds: None)
+        )
+        handler.state_store.set_item('spreadsheets', '감귤 주문서(응답)', {
+            'key': 'sheet-id', 'worksheet_id': 0, 'worksheet_title': '시트1',
+        })
+        handler._request = api.request
+        return handler
+    return make
+
+
+def test_async_handler_fetches_and_confirms_new_orders(make_handler):
+    api = FakeSheetsApi([make_row(1, '확인'), make_row(2), make_row(4), make_row(5)])
+    handler = make_handler(api)
+
+    orders = handler.get_new_orders()
+    assert list(orders.index) == [1, 2, 3]
+    assert handler.new_order_rows == [3, 4, 5]
+
+    handler.new_order_rows = [3, 5]
+    assert handler.mark_orders_as_confirmed() == {'B3:B3': True, 'B5:B5': True}
+    # 배치는 행 번호 순서대로 하나씩 전송됨
+    assert api.max_in_flight == 1
+    handler.close()
+
+
+def test_async_handler_reads_header_alongside_watermark_cell(make_handler):
+    api = FakeSheetsApi([make_row(1, '확인'), make_row(2, '확인'), make_row(3)])
+    handler = make_handler(api)
+    handler.get_new_orders()
+    api.requests.clear()
+
+    api.grid.append(make_row(6))
+    orders = handler.get_new_orders()
+
+    # 헤더 + 워터마크 셀 1회, 새 행 범위 1회
+    assert api.requests == ['batch_get', 'batch_get']
+    assert handler.new_order_rows == [4, 5]
+    assert len(orders) == 2
+    handler.close()
+
+
+def test_async_handler_rejects_stream_mode(tmp_path, credentials_json):
+    config = make_config(tmp_path, credentials_json)
+    config.FETCH_MODE = 'stream'
+
+    with pytest.raises(SpreadsheetError, match='stream'):
+        AsyncGoogleSheetHandler(config)
+
+
+def test_async_handler_reads_quarantined_rows_before_watermark(make_handler):
+    rows = [make_row(1, '확인'), make_row(2), make_row(3), make_row(4)]
+    rows[2][7] = ''
+    api = FakeSheetsApi(rows)
+    handler = make_handler(api)
+    handler.config.CONFIRM_BATCH_SIZE = 100
+
+    handler.quarantine_invalid_orders(handler.get_new_orders())
+    handler.mark_orders_as_confirmed()
+    assert [row[1] for row in api.grid[1:]] == ['확인', '확인', '', '확인']
+
+    api.grid[3][7] = '01055556666'  # 4행 수정
+    api.requests.clear()
+    orders = handler.get_new_orders()
+
+    # 워터마크(5행) 이전의 격리 행은 새 행 범위와 같은 요청으로 조회
+    assert api.requests == ['batch_get', 'batch_get']
+    assert handler.new_order_rows == [4]
+    assert orders['validation_error'].isna().all()
+    handler.mark_orders_as_confirmed()
+    assert handler.state_store.get_item('quarantine', '감귤 주문서(응답)') is None
+    handler.close()
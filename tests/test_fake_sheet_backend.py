@@ -0,0 +1,231 @@
+import os
+import sys
+import types
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Provide a minimal dotenv stub if python-dotenv is missing
+if 'dotenv' not in sys.modules:
+    sys.modules['dotenv'] = types.SimpleNamespace(load_dotenv=lambda: None)
+
+import pytest
+
+pytest.importorskip('pandas')
+pytest.importorskip('gspread')
+
+from handlers.fake_sheet_backend import FakeSheetBackend
+
+HEADER = [
+    '타임스탬프', '비고', '보내는분 성함', '보내는분 주소 (도로명 주소로 부탁드려요)',
+    '보내는분 연락처 (핸드폰번호)', '받으실분 성함', '받으실분 주소 (도로명 주소로 부탁드려요)',
+    '받으실분 연락처 (핸드폰번호)', '상품 선택', '5kg 수량', '10kg 수량',
+]
+
+
+def make_row(day, remark=''):
+    return [
+        f'2024. 12. {day}. 오후 3:45:23', remark, '홍길동', '제주시 중앙로 1', '01012345678',
+        f'수령인{day}', '서울시 종로 1', '01098765432', '5kg', '2', '',
+    ]
+
+
+@pytest.fixture
+def system_env(monkeypatch, tmp_path):
+    monkeypatch.setenv('TANGERINE_STATE_DIR', str(tmp_path))
+    monkeypatch.delenv('SPREADSHEET_ID', raising=False)
+    monkeypatch.delenv('SPREADSHEET_SOURCES', raising=False)
+    monkeypatch.setenv('DEFAULT_SENDER_NAME', '기본 발송인')
+    monkeypatch.setenv('DEFAULT_SENDER_ADDRESS', '제주시 기본로 1')
+    monkeypatch.setenv('DEFAULT_SENDER_PHONE', '01000000000')
+
+
+def test_fake_backend_runs_pipeline_through_quota_errors(system_env, capsys):
+    from main import OrderManagementSystem
+
+    backend = FakeSheetBackend()
+    spreadsheet = backend.add_spreadsheet(
+        '감귤 주문서(응답)', [HEADER, make_row(1, '확인'), make_row(2), make_row(3)]
+    )
+    system = OrderManagementSystem(backend=backend)
+    system.scheduler.sleep = lambda seconds: None
+
+    # 처음 두 번의 호출이 429로 실패해도 재시도 후 정상 처리되어야 함
+    backend.fail_next(2)
+    system.process_new_orders()
+
+    output = capsys.readouterr().out
+    assert '수령인2' in output and '수령인3' in output
+    assert '수령인1' not in output
+    assert [row[1] for row in spreadsheet.worksheets[0].values[1:]] == ['확인'] * 3
+    assert sum(m.retries for m in system.scheduler.metrics.values()) == 2
+
+    # 두 번째 실행에서는 새 주문이 없음
+    system.process_new_orders()
+    assert '새로운 주문이 없습니다' in capsys.readouterr().out
+
+
+def test_fake_backend_trims_ranges_like_the_api():
+    backend = FakeSheetBackend()
+    worksheet = backend.add_spreadsheet('주문서', [HEADER, make_row(1), make_row(2, '확인')]).sheet1
+
+    assert worksheet.batch_get(['B2:B10', 'A1:B1']) == [[[], ['확인']], [['타임스탬프', '비고']]]
+    assert backend.call_counts == {'fetch_sheet_metadata': 1, 'batch_get': 1}
+
+
+def test_multiple_sources_merge_in_configured_order_and_report_failed_source(
+        system_env, monkeypatch, capsys):
+    from main import OrderManagementSystem
+    from exceptions.exceptions import SpreadsheetError
+    from utils.state_store import JsonStateStore
+
+    monkeypatch.setenv('SPREADSHEET_SOURCES', '주문서B, 없는 주문서, 주문서A')
+    backend = FakeSheetBackend()
+    worksheets = {}
+    for name, confirmed in (('주문서A', 1), ('주문서B', 2)):
+        rows = [make_row(5, '확인' if i < confirmed else '') for i in range(confirmed + 2)]
+        for i, row in enumerate(rows):
+            row[5] = f'{name[-1]}수령인{i + 2}'  # 스프레드시트 행 번호
+        worksheets[name] = backend.add_spreadsheet(name, [HEADER] + rows).worksheets[0]
+    system = OrderManagementSystem(backend=backend)
+    system.scheduler.sleep = lambda seconds: None
+
+    # 없는 주문서는 실패로 보고하되 나머지 주문서는 끝까지 처리
+    with pytest.raises(SpreadsheetError, match='없는 주문서'):
+        system._process_sources()
+
+    output = capsys.readouterr().out
+    # 같은 날짜/발송인이면 주문서 설정 순서(B → A)대로 라벨이 이어짐
+    positions = [output.index(name) for name in ('B수령인4', 'B수령인5', 'A수령인3', 'A수령인4')]
+    assert positions == sorted(positions)
+    assert 'B수령인3' not in output and 'A수령인2' not in output
+    for worksheet in worksheets.values():
+        assert [row[1] for row in worksheet.values[1:]] == ['확인'] * (len(worksheet.values) - 1)
+    state = JsonStateStore(system.config.STATE_FILE)
+    assert state.get('watermarks') == {'주문서A': 4, '주문서B': 5}
+
+    # 다음 실행은 주문서마다 자기 워터마크 이후만 처리
+    worksheets['주문서A'].values.append(make_row(6))
+    with pytest.raises(SpreadsheetError, match='없는 주문서'):
+        system._process_sources()
+    output = capsys.readouterr().out
+    assert '수령인6' in output and 'B수령인' not in output and 'A수령인' not in output
+    assert state.get('watermarks') == {'주문서A': 5, '주문서B': 5}
+
+
+def test_stream_mode_writes_labels_chunk_by_chunk(system_env, monkeypatch, capsys):
+    from main import OrderManagementSystem
+
+    monkeypatch.setenv('FETCH_MODE', 'stream')
+    monkeypatch.setenv('STREAM_CHUNK_SIZE', '2')
+    backend = FakeSheetBackend()
+    rows = [make_row(1, '확인')] + [make_row(day) for day in range(2, 7)]
+    spreadsheet = backend.add_spreadsheet('감귤 주문서(응답)', [HEADER] + rows)
+    system = OrderManagementSystem(backend=backend)
+    system.sheet_handler.get_new_orders = None  # 새 주문 전체를 모으는 경로를 쓰지 않아야 함
+
+    system.process_new_orders()
+
+    output = capsys.readouterr().out
+    assert all(f'수령인{day}' in output for day in range(2, 7)) and '수령인1' not in output
+    # 요약은 모든 청크의 합계로 한 번만 출력
+    assert output.count('주문 요약') == 1
+    assert '5kg 주문: 10박스 (200,000원)' in output
+    assert [row[1] for row in spreadsheet.worksheets[0].values[1:]] == ['확인'] * 6
+
+    system.process_new_orders()
+    assert '새로운 주문이 없습니다' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("fetch_mode", ['incremental', 'full', 'stream'])
+def test_quarantined_row_is_reprocessed_after_fix(system_env, monkeypatch, capsys, fetch_mode):
+    from main import OrderManagementSystem
+    from utils.state_store import JsonStateStore
+
+    monkeypatch.setenv('FETCH_MODE', fetch_mode)
+    backend = FakeSheetBackend()
+    rows = [make_row(1, '확인'), make_row(2), make_row(3), make_row(4)]
+    rows[2][7] = ''  # 4행: 받으실분 연락처 누락
+    worksheet = backend.add_spreadsheet('감귤 주문서(응답)', [HEADER] + rows).worksheets[0]
+    system = OrderManagementSystem(backend=backend)
+    state = JsonStateStore(system.config.STATE_FILE)
+
+    system.process_new_orders()
+    captured = capsys.readouterr()
+    assert '수령인2' in captured.out and '수령인4' in captured.out and '수령인3' not in captured.out
+    assert '검증 실패로 제외된 주문 1개' in captured.err
+    # 뒤의 5행이 '확인'되어도 4행은 격리 목록에 남음
+    assert [row[1] for row in worksheet.values[1:]] == ['확인', '확인', '', '확인']
+    assert list(state.get_item('quarantine', '감귤 주문서(응답)')) == ['4']
+
+    # 시트에서 고치면 다음 실행에서 4행만 처리하고 격리 해제
+    worksheet.update_cell(4, 8, '01055556666')
+    system.process_new_orders()
+    output = capsys.readouterr().out
+    assert '수령인3' in output and '010-5555-6666' in output
+    assert '수령인2' not in output and '수령인4' not in output
+    assert [row[1] for row in worksheet.values[1:]] == ['확인'] * 4
+    assert state.get_item('quarantine', '감귤 주문서(응답)') is None
+
+    system.process_new_orders()
+    assert '새로운 주문이 없습니다' in capsys.readouterr().out
+
+
+def test_snapshot_orders_are_revalidated_with_current_config(system_env, monkeypatch, tmp_path, capsys, caplog):
+    import json
+    import logging
+    from main import OrderManagementSystem
+    from utils.state_store import JsonStateStore
+
+    backend = FakeSheetBackend()
+    rows = [make_row(1, '확인'), make_row(2)]
+    rows[1][8] = '한라봉'  # 기본 카탈로그(5kg/10kg)에 없는 상품
+    worksheet = backend.add_spreadsheet('감귤 주문서(응답)', [HEADER] + rows).worksheets[0]
+
+    system = OrderManagementSystem(backend=backend)
+    system.process_new_orders()
+    assert '검증 실패로 제외된 주문 1개' in capsys.readouterr().err
+    state = JsonStateStore(system.config.STATE_FILE)
+    assert list(state.get_item('quarantine', '감귤 주문서(응답)')) == ['3']
+
+    # 카탈로그에 한라봉을 추가하면 시트가 그대로여도(스냅샷 사용) 다시 검증해 처리
+    catalog_file = tmp_path / 'catalog.json'
+    catalog_file.write_text(json.dumps([
+        {'name': '한라봉', 'price': 45000, 'patterns': ['한라봉']},
+        {'name': '5kg', 'price': 20000},
+        {'name': '10kg', 'price': 35000},
+    ], ensure_ascii=False), encoding='utf-8')
+    monkeypatch.setenv('PRODUCT_CATALOG_FILE', str(catalog_file))
+    system = OrderManagementSystem(backend=backend)
+    with caplog.at_level(logging.INFO, logger='handlers.sheet_handler'):
+        system.process_new_orders()
+
+    assert '스냅샷에서 새로운 주문 1개 로드' in caplog.text
+    output = capsys.readouterr().out
+    assert '수령인2' in output and '한라봉 주문: 2박스 (90,000원)' in output
+    assert [row[1] for row in worksheet.values[1:]] == ['확인', '확인']
+    assert state.get_item('quarantine', '감귤 주문서(응답)') is None
+
+
+def test_catalog_quantity_columns_are_fetched_and_used_for_totals(system_env, monkeypatch, tmp_path, capsys):
+    import json
+    from main import OrderManagementSystem
+
+    catalog_file = tmp_path / 'catalog.json'
+    catalog_file.write_text(json.dumps([
+        {'name': '한라봉', 'price': 45000, 'patterns': ['한라봉'], 'quantity_columns': ['한라봉 수량']},
+        {'name': '5kg', 'price': 20000},
+        {'name': '10kg', 'price': 35000},
+    ], ensure_ascii=False), encoding='utf-8')
+    monkeypatch.setenv('PRODUCT_CATALOG_FILE', str(catalog_file))
+    backend = FakeSheetBackend()
+    rows = [make_row(1, '확인') + [''], make_row(2) + ['3'], make_row(3) + ['']]
+    rows[1][8], rows[1][9] = '한라봉', ''  # 한라봉 수량 컬럼에만 박스 수 입력
+    backend.add_spreadsheet('감귤 주문서(응답)', [HEADER + ['한라봉 수량']] + rows)
+
+    system = OrderManagementSystem(backend=backend)
+    system.process_new_orders()
+
+    output = capsys.readouterr().out
+    assert '한라봉 주문: 3박스 (135,000원)' in output
+    assert '5kg 주문: 2박스 (40,000원)' in output
@@ -0,0 +1,64 @@
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from utils.interning import StringPool, holds_str_objects
+
+
+def fresh(*parts):
+    # 응답마다 새로 만들어지는 문자열을 흉내 (리터럴은 이미 공유될 수 있으므로 join으로 생성)
+    return ''.join(parts)
+
+
+def test_intern_frame_shares_strings_in_object_columns():
+    # 숫자와 문자열이 섞인 컬럼은 object dtype으로 남아 str 객체를 그대로 들고 있음
+    df = pd.DataFrame({
+        '이름': pd.Series([fresh('홍', '길동') for _ in range(3)], dtype=object),
+        '연락처': [1012345678, fresh('010-', '1234'), fresh('010-', '1234')],
+        '수량': [5, 5, 5],
+    })
+    assert df['연락처'].dtype == object
+
+    pool = StringPool()
+    pool.intern_frame(df)
+
+    assert df['이름'].dtype == object
+    assert df['이름'][0] is df['이름'][1] is df['이름'][2]
+    assert df['연락처'][1] is df['연락처'][2]
+    assert df['연락처'][0] == 1012345678
+    assert pool.unique_count == 2
+    assert pool.shared == 3
+    assert pool.saved_bytes == 2 * sys.getsizeof(df['이름'][0]) + sys.getsizeof(df['연락처'][1])
+
+
+def test_intern_frame_keeps_python_string_dtype():
+    dtype = pd.StringDtype('python')
+    df = pd.DataFrame({'상품': pd.array([fresh('감귤 ', '5kg'), fresh('감귤 ', '5kg')], dtype=dtype)})
+
+    pool = StringPool()
+    pool.intern_frame(df)
+
+    assert df['상품'].dtype == dtype
+    assert df['상품'].array[0] is df['상품'].array[1]
+    assert pool.shared == 1
+
+
+def test_intern_frame_skips_arrow_string_columns():
+    pytest.importorskip('pyarrow')
+    df = pd.DataFrame({'상품': pd.array([fresh('감귤 ', '5kg'), fresh('감귤 ', '5kg')], dtype='string[pyarrow]')})
+    dtype = df['상품'].dtype
+
+    pool = StringPool()
+    pool.intern_frame(df)
+
+    # Arrow 버퍼에는 공유할 str 객체가 없으므로 건드리지 않고 절약량도 0으로 보고
+    assert not holds_str_objects(dtype)
+    assert df['상품'].dtype == dtype
+    assert pool.unique_count == 0
+    assert pool.saved_bytes == 0
@@ -0,0 +1,169 @@
+import io
+import json
+import os
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Provide a minimal dotenv stub if python-dotenv is missing
+if 'dotenv' not in sys.modules:
+    sys.modules['dotenv'] = types.SimpleNamespace(load_dotenv=lambda: None)
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from formatters.label_formatter import LabelFormatter
+from formatters.label_template import LabelTemplate
+
+LABEL_TEMPLATE_EXAMPLE = os.path.join(os.path.dirname(__file__), '..', 'label_template.json.example')
+
+
+def make_config():
+    return types.SimpleNamespace(
+        PRODUCT_CATALOG=[{'name': '5kg', 'price': 20000}, {'name': '10kg', 'price': 35000}],
+        DEFAULT_SENDER={'address': '기본 주소', 'name': '기본', 'phone': '010-0000-0000'},
+        LABEL_TEMPLATE={},
+    )
+
+
+def make_orders():
+    return pd.DataFrame({
+        '타임스탬프': pd.to_datetime(['2024-12-05 11:00', '2024-12-05 10:00', '2024-12-06 09:00']),
+        '보내는분 성함': ['홍길동', '홍길동', ''],
+        '보내는분 주소 (도로명 주소로 부탁드려요)': ['제주시 중앙로 1', '제주시 중앙로 1', ''],
+        '보내는분 연락처 (핸드폰번호)': [1012345678, '010-1234-5678', ''],
+        '받으실분 성함': ['김철수', '이영희', '박민수'],
+        '받으실분 주소 (도로명 주소로 부탁드려요)': ['서울시 종로 1', '부산시 해운대로 2', '대전시 대덕대로 3'],
+        '받으실분 연락처 (핸드폰번호)': ['01098765432', 1011112222, '02-123-4567'],
+        '상품 선택': ['5kg', '10kg', '비상품'],
+        '5kg 수량': [2, '', ''],
+        '10kg 수량': ['', 8.0, ''],
+    }, index=[3, 4, 5])
+
+
+def test_format_labels_renders_groups_and_summary():
+    labels = LabelFormatter(make_config()).format_labels(make_orders())
+
+    assert labels == (
+        "=== 2024-12-05 ===\n"
+        "보내는사람\n"
+        "제주시 중앙로 1 홍길동 010-1234-5678\n\n"
+        "받는사람\n부산시 해운대로 2 이영희 010-1111-2222\n주문상품\n10kg / 8박스\n\n"
+        "받는사람\n서울시 종로 1 김철수 010-9876-5432\n주문상품\n5kg / 2박스\n\n"
+        + "=" * 39 + "\n\n"
+        "=== 2024-12-06 ===\n"
+        "보내는사람\n"
+        "기본 주소 기본 010-0000-0000\n\n"
+        "받는사람\n대전시 대덕대로 3 박민수 02-123-4567\n주문상품\n"
+        + "=" * 39 + "\n\n"
+        + "=" * 50 + "\n"
+        "주문 요약\n"
+        + "-" * 20 + "\n"
+        "5kg 주문: 2박스 (40,000원)\n"
+        "10kg 주문: 8박스 (280,000원)\n"
+        + "-" * 20 + "\n"
+        "총 주문금액: 320,000원\n"
+    )
+
+
+def test_format_labels_iter_yields_group_chunks_and_writer_streams_them():
+    formatter = LabelFormatter(make_config())
+    orders = make_orders()
+
+    chunks = list(formatter.format_labels_iter(orders))
+    out = io.StringIO()
+    written = formatter.write_labels(orders, out)
+
+    # 날짜 머리글, 발송인 그룹, 구분선이 날짜마다 따로 나오고 요약은 마지막
+    assert chunks[0] == "=== 2024-12-05 ===\n"
+    assert chunks[1].startswith("보내는사람\n제주시 중앙로 1 홍길동")
+    assert chunks[-1].startswith("=" * 50 + "\n주문 요약\n")
+    assert len(chunks) == 7
+    assert "".join(chunks) == out.getvalue() == formatter.format_labels(orders)
+    assert written == len(out.getvalue())
+    assert list(formatter.format_labels_iter(orders.iloc[:0])) == ["새로운 주문이 없습니다."]
+
+
+def test_group_spans_sorts_once_by_date_and_sender():
+    timestamps = pd.Series(pd.to_datetime(
+        ['2024-12-06 09:00', '2024-12-05 10:00', None, '2024-12-05 11:00', '2024-12-05 12:00']
+    ))
+    sender_keys = pd.DataFrame({
+        'name': ['b', 'b', 'a', 'a', 'b'],
+        'address': [''] * 5,
+        'phone': [''] * 5,
+    })
+
+    order, spans = LabelFormatter._group_spans(timestamps, sender_keys)
+
+    # 타임스탬프가 없는 행은 제외하고, 같은 그룹 안에서는 입력 순서 유지
+    assert order.tolist() == [3, 1, 4, 0]
+    assert [(str(day), groups) for day, groups in spans] == [
+        ('2024-12-05', [(0, 1), (1, 3)]),
+        ('2024-12-06', [(3, 4)]),
+    ]
+
+
+def test_formatter_keeps_no_per_batch_state_across_threads():
+    formatter = LabelFormatter(make_config())
+    batches = [make_orders(), make_orders().iloc[:1], make_orders().iloc[2:]]
+    expected = [formatter.format_labels(batch) for batch in batches]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(formatter.format_labels, batches * 5))
+
+    assert results == expected * 5
+    assert formatter.summarize(batches[1]).total_revenue == 20000 * 2
+    assert not hasattr(formatter, 'totals')
+
+
+def test_custom_template_replaces_only_given_sections():
+    config = make_config()
+    with open(LABEL_TEMPLATE_EXAMPLE, encoding='utf-8') as f:
+        config.LABEL_TEMPLATE = json.load(f)
+
+    labels = LabelFormatter(config).format_labels(make_orders())
+
+    assert labels.startswith(
+        "[2024-12-05]\n"
+        "보내는분: 홍길동 / 010-1234-5678 / 제주시 중앙로 1\n"
+        "받는분: 이영희 / 010-1111-2222 / 부산시 해운대로 2 / 10kg 8박스\n"
+        "받는분: 김철수 / 010-9876-5432 / 서울시 종로 1 / 5kg 2박스\n"
+        "\n"
+        "[2024-12-06]\n"
+        "보내는분: 기본 / 010-0000-0000 / 기본 주소\n"
+        "받는분: 박민수 / 02-123-4567 / 대전시 대덕대로 3 /  1박스\n"
+    )
+    # 템플릿 파일에 없는 섹션(요약)은 기본 레이아웃 그대로
+    assert labels.endswith("총 주문금액: 320,000원\n")
+
+
+@pytest.mark.parametrize(
+    "layout",
+    [
+        {'sender': "{recipient_name}\n"},
+        {'recipient': "{recipient_name.__class__}\n"},
+        {'summary_line': "{product!r}\n"},
+        {'courier': "{date}\n"},
+    ],
+)
+def test_template_rejects_unknown_sections_and_placeholders(layout):
+    with pytest.raises(ValueError):
+        LabelTemplate(layout)
+
+
+def test_format_chunks_iter_renders_each_chunk_and_one_total_summary():
+    formatter = LabelFormatter(make_config())
+    orders = make_orders()
+
+    labels = "".join(formatter.format_chunks_iter([orders.iloc[:1], orders.iloc[:0], orders.iloc[1:]]))
+
+    # 같은 날짜/발송인이라도 청크가 다르면 날짜 머리글부터 다시 시작
+    assert labels.count("=== 2024-12-05 ===") == 2
+    assert labels.count("주문 요약") == 1
+    assert labels.endswith(formatter.format_summary(formatter.summarize(orders)))
+    assert "".join(formatter.format_chunks_iter([orders.iloc[:0]])) == "새로운 주문이 없습니다."
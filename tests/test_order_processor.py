@@ -51,6 +51,18 @@ import pytest
 def test_format_phone_number(input_phone, expected):
     assert OrderProcessor.format_phone_number(input_phone) == expected
 
+def test_format_phone_numbers_matches_scalar():
+    phones = pd.Series(
+        ["", "1098765432", "01012345678", "010-1234-5678", "0201234567", "hello",
+         1012345678, None, "  ", "010 1234 5678"],
+        index=[5, 3, 9, 1, 0, 2, 4, 8, 6, 7],
+    )
+    expected = phones.map(OrderProcessor.format_phone_number)
+
+    result = OrderProcessor.format_phone_numbers(phones)
+    assert result.index.equals(phones.index)
+    assert result.tolist() == expected.tolist()
+
 @pytest.mark.parametrize(
     "five,ten,expected",
     [
@@ -68,3 +80,32 @@ def test_format_phone_number(input_phone, expected):
 def test_get_quantity(five, ten, expected):
     row = pd.Series({"5kg \uc218\ub7c9": five, "10kg \uc218\ub7c9": ten})
     assert OrderProcessor.get_quantity(row) == expected
+
+def test_get_quantities_matches_get_quantity():
+    df = pd.DataFrame({
+        "5kg \uc218\ub7c9": ["2", "3\ubc15\uc2a4", 4, "", "", "", "", None, None, "\ub9ce\uc774", " ",
+                           "\uff13", "\uff11\uff12\ubc15\uc2a4", ""],
+        "10kg \uc218\ub7c9": ["", "", "", "5", "6\ubc15\uc2a4", 7, "", None, 8, "9", "3", "", "", "\uff15"],
+    }, index=[10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23])
+    expected = [OrderProcessor.get_quantity(row) for _, row in df.iterrows()]
+
+    # 전각 숫자('３', '１２박스')도 get_quantity와 같은 수량
+    assert OrderProcessor.get_quantities(df).tolist() == expected == [2, 3, 4, 5, 6, 7, 1, 1, 8, 1, 3, 3, 12, 5]
+    assert OrderProcessor.get_quantities(df[["10kg \uc218\ub7c9"]]).tolist()[:4] == [1, 1, 1, 5]
+
+def test_order_columns_normalizes_fields_in_row_order():
+    df = pd.DataFrame({
+        "타임스탬프": pd.to_datetime(["2024-12-05 15:45:23", "2024-12-06 09:00:00"]),
+        "보내는분 성함": ["홍길동", "홍길동"],
+        "받으실분 연락처 (핸드폰번호)": [1012345678, "010-9876-5432"],
+        "상품 선택": ["5kg", "10kg"],
+        "5kg 수량": ["3박스", None],
+        "10kg 수량": ["", 2],
+    }, index=[4, 7])
+
+    columns = OrderProcessor.order_columns(df)
+
+    assert columns["recipient_phone"] == ["010-1234-5678", "010-9876-5432"]
+    assert columns["quantity"] == [3, 2]
+    assert columns["recipient_address"] == ["", ""]
+    assert columns["product_type"] == [None, None]
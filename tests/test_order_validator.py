@@ -0,0 +1,76 @@
+import os
+import sys
+import types
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Provide a minimal dotenv stub if python-dotenv is missing
+if 'dotenv' not in sys.modules:
+    sys.modules['dotenv'] = types.SimpleNamespace(load_dotenv=lambda: None)
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from handlers.order_validator import OrderValidator
+
+
+def make_orders(**overrides):
+    columns = {
+        '타임스탬프': pd.Timestamp('2024-12-05 15:45:23'),
+        '보내는분 성함': '홍길동',
+        '보내는분 주소 (도로명 주소로 부탁드려요)': '제주시 중앙로 1',
+        '보내는분 연락처 (핸드폰번호)': 1012345678,
+        '받으실분 성함': '김철수',
+        '받으실분 주소 (도로명 주소로 부탁드려요)': '서울시 종로 1',
+        '받으실분 연락처 (핸드폰번호)': '010-9876-5432',
+        '상품 선택': '5kg',
+        '5kg 수량': 2,
+        '10kg 수량': '',
+    }
+    rows = [dict(columns, **override) for override in overrides.get('rows', [{}])]
+    return pd.DataFrame(rows, index=range(10, 10 + len(rows)))
+
+
+def validate(df):
+    config = types.SimpleNamespace(PRODUCT_CATALOG=[{'name': '5kg', 'price': 20000}, {'name': '10kg', 'price': 35000}])
+    return OrderValidator(config).validate(df).tolist()
+
+
+def test_valid_rows_have_no_error():
+    df = make_orders(rows=[
+        {},
+        {'보내는분 연락처 (핸드폰번호)': ''},  # 기본 발송인 사용
+        {'받으실분 연락처 (핸드폰번호)': '02-123-4567', '상품 선택': '비상품'},
+        {'5kg 수량': '', '10kg 수량': '', '상품 선택': '10kg'},  # 수량 기본값 1
+    ])
+    assert validate(df) == [None, None, None, None]
+
+
+def test_each_rule_reports_its_own_message():
+    df = make_orders(rows=[
+        {'타임스탬프': pd.NaT},
+        {'받으실분 성함': ' '},
+        {'받으실분 연락처 (핸드폰번호)': '12345'},
+        {'보내는분 연락처 (핸드폰번호)': '없음'},
+        {'5kg 수량': '많이'},
+        {'5kg 수량': 0},
+        {'상품 선택': '3kg'},
+    ])
+    assert validate(df) == [
+        '타임스탬프 형식 오류',
+        '받으실분 성함 누락',
+        '받으실분 연락처 (핸드폰번호) 형식 오류: 12345',
+        '보내는분 연락처 (핸드폰번호) 형식 오류: 없음',
+        '수량을 알 수 없음',
+        '수량을 알 수 없음',
+        '유효하지 않은 상품 타입: "3kg"',
+    ]
+
+
+def test_multiple_errors_are_joined():
+    df = make_orders(rows=[{'받으실분 주소 (도로명 주소로 부탁드려요)': '', '상품 선택': '사과'}])
+    assert validate(df) == [
+        '받으실분 주소 (도로명 주소로 부탁드려요) 누락; 유효하지 않은 상품 타입: "사과"'
+    ]
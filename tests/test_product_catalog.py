@@ -0,0 +1,91 @@
+import json
+import os
+import sys
+import types
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Provide a minimal dotenv stub if python-dotenv is missing
+if 'dotenv' not in sys.modules:
+    sys.modules['dotenv'] = types.SimpleNamespace(load_dotenv=lambda: None)
+
+import pytest
+
+pd = pytest.importorskip('pandas')
+
+from config.config import Config
+from handlers.product_catalog import Product, ProductCatalog
+
+EXAMPLE_CATALOG = os.path.join(os.path.dirname(__file__), '..', 'product_catalog.json.example')
+
+
+@pytest.fixture
+def catalog():
+    with open(EXAMPLE_CATALOG, encoding='utf-8') as f:
+        items = json.load(f)
+    return ProductCatalog.from_config(types.SimpleNamespace(PRODUCT_CATALOG=items))
+
+
+def test_classify_uses_catalog_order_as_priority(catalog):
+    selections = pd.Series(
+        ['5kg', '10kg', '한라봉 5kg', '천혜향 3kg', '선물용 3 kg', '13kg', '사과', ''],
+        index=[7, 3, 5, 1, 2, 4, 6, 0],
+    )
+    result = catalog.classify(selections)
+
+    assert list(result.index) == [7, 3, 5, 1, 2, 4, 6, 0]
+    assert result.astype(object).where(result.notna(), None).tolist() == [
+        '5kg', '10kg', '한라봉', '천혜향', '3kg 선물', None, None, None,
+    ]
+    assert [getattr(catalog.match(value), 'name', None) for value in selections] == \
+        result.astype(object).where(result.notna(), None).tolist()
+
+
+def test_totals_cover_every_product():
+    catalog = ProductCatalog([Product('5kg', 20000), Product('10kg', 35000), Product('한라봉', 45000)])
+    product_types = catalog.classify(pd.Series(['5kg', '한라봉', '5kg', '???']))
+    totals = catalog.totals(product_types, pd.Series([2, 1, 3, 9]))
+
+    assert totals['quantity'].tolist() == [5, 0, 1]
+    assert totals['revenue'].tolist() == [100000, 0, 45000]
+    assert list(totals.index) == ['5kg', '10kg', '한라봉']
+
+    summary = catalog.summarize(product_types, pd.Series([2, 1, 3, 9]))
+    assert [(p.name, p.quantity, p.revenue) for p in summary.products] == [
+        ('5kg', 5, 100000), ('10kg', 0, 0), ('한라봉', 1, 45000),
+    ]
+    assert summary.total_revenue == 145000 and summary.get('한라봉').price == 45000
+    with pytest.raises(AttributeError):
+        summary.products = ()
+
+
+def test_extract_quantities_reads_each_products_quantity_columns(catalog):
+    df = pd.DataFrame({
+        '상품 선택': ['한라봉', '5kg', '천혜향', '선물용 3kg', '10kg', '사과', '한라봉'],
+        '5kg 수량': ['9', '2', '9', '9', '', '4', ''],
+        '10kg 수량': ['', '', '', '', '3', '', ''],
+        '한라봉 수량': ['2박스', '', '', '', '', '', '많이'],
+        '천혜향 수량': ['', '', '３', '', '', '', ''],
+        '3kg 수량': ['', '', '', '5', '', '', ''],
+    }, index=[10, 11, 12, 13, 14, 15, 16])
+
+    quantities, unparsed = catalog.extract_quantities(df, catalog.classify(df['상품 선택']))
+
+    # 5kg/10kg와 분류되지 않은 행은 기본 수량 컬럼을 사용
+    assert quantities.tolist() == [2, 2, 3, 5, 3, 4, 1]
+    assert unparsed.tolist() == [False] * 6 + [True]
+    assert list(quantities.index) == list(df.index)
+
+
+def test_config_loads_catalog_file(monkeypatch):
+    monkeypatch.setenv('DEFAULT_SENDER_NAME', '기본 발송인')
+    monkeypatch.setenv('DEFAULT_SENDER_ADDRESS', '제주시 기본로 1')
+    monkeypatch.setenv('DEFAULT_SENDER_PHONE', '01000000000')
+    monkeypatch.setenv('PRODUCT_CATALOG_FILE', os.path.abspath(EXAMPLE_CATALOG))
+
+    config = Config()
+    assert [item['name'] for item in config.PRODUCT_CATALOG][:2] == ['한라봉', '천혜향']
+    assert config.PRODUCT_PRICES['10kg'] == 35000
+    # 상품별 수량 컬럼은 필수 컬럼에 추가되어 PROJECTED_FETCH에서도 조회됨
+    assert config.REQUIRED_COLUMNS[-3:] == ['한라봉 수량', '천혜향 수량', '3kg 수량']
@@ -0,0 +1,75 @@
+import json
+import os
+import sys
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+
+requests = pytest.importorskip('requests')
+gspread = pytest.importorskip('gspread')
+
+from handlers.request_scheduler import RequestScheduler, TokenBucket
+
+
+def api_error(status):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(
+        {'error': {'code': status, 'message': 'error', 'status': 'ERROR'}}
+    ).encode()
+    return gspread.exceptions.APIError(response)
+
+
+class FlakyCall:
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+
+def test_retries_quota_and_server_errors():
+    sleeps = []
+    scheduler = RequestScheduler(sleep=sleeps.append)
+    call = FlakyCall([api_error(429), api_error(503)])
+
+    assert scheduler.call('read', 'batch_get', call) == 'ok'
+    assert call.calls == 3
+    assert len(sleeps) == 2
+    assert scheduler.metrics['batch_get'].retries == 2
+    assert scheduler.metrics['batch_get'].failures == 0
+
+
+def test_non_retryable_error_is_raised_immediately():
+    scheduler = RequestScheduler(sleep=lambda seconds: None)
+    call = FlakyCall([api_error(404)])
+
+    with pytest.raises(gspread.exceptions.APIError):
+        scheduler.call('read', 'open', call)
+    assert call.calls == 1
+    assert scheduler.metrics['open'].failures == 1
+
+
+def test_gives_up_after_max_retries():
+    scheduler = RequestScheduler(max_retries=2, sleep=lambda seconds: None)
+    call = FlakyCall([api_error(429)] * 5)
+
+    with pytest.raises(gspread.exceptions.APIError):
+        scheduler.call('write', 'batch_update', call)
+    assert call.calls == 3
+
+
+def test_token_bucket_throttles_after_burst():
+    now = [0.0]
+    bucket = TokenBucket(per_minute=60, clock=lambda: now[0])
+
+    assert all(bucket.reserve() == 0 for _ in range(60))
+    assert bucket.reserve() == pytest.approx(1.0)
+    now[0] += 2.0
+    assert bucket.reserve() == 0
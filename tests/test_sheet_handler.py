@@ -0,0 +1,432 @@
+import os
+import sys
+import types
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Provide a minimal dotenv stub if python-dotenv is missing
+if 'dotenv' not in sys.modules:
+    sys.modules['dotenv'] = types.SimpleNamespace(load_dotenv=lambda: None)
+
+import pytest
+
+pytest.importorskip('pandas')
+gspread = pytest.importorskip('gspread')
+
+from gspread.utils import a1_to_rowcol, numericise_all
+import pandas as pd
+
+from handlers.order_processor import OrderProcessor
+from handlers.request_scheduler import RequestScheduler
+from handlers.sheet_handler import GoogleSheetHandler
+from exceptions.exceptions import DataParsingError, SpreadsheetError
+from utils.snapshot_cache import SnapshotCache
+
+HEADER = [
+    '타임스탬프', '비고', '보내는분 성함', '보내는분 주소 (도로명 주소로 부탁드려요)',
+    '보내는분 연락처 (핸드폰번호)', '받으실분 성함', '받으실분 주소 (도로명 주소로 부탁드려요)',
+    '받으실분 연락처 (핸드폰번호)', '상품 선택', '5kg 수량', '10kg 수량',
+]
+
+
+def make_row(day, remark=''):
+    return [
+        f'2024. 12. {day}. 오후 3:45:23', remark, '홍길동', '제주시 중앙로 1', '01012345678',
+        '김철수', '서울시 종로 1', '01098765432', '5kg', '2', '',
+    ]
+
+
+class FakeWorksheet:
+    def __init__(self, header, rows=(), fail_ranges=()):
+        self.header = header
+        self.rows = [list(row) for row in rows]
+        self.fail_ranges = set(fail_ranges)
+        self.batch_calls = []
+        self.full_reads = 0
+        self.batch_get_calls = []
+        self.id = 0
+        self.title = '설문지 응답 시트1'
+        self.revision = '2024-12-05T06:45:23.000Z'
+
+    @property
+    def row_count(self):
+        return len(self.rows) + 1
+
+    def row_values(self, row):
+        return self.header if row == 1 else self.rows[row - 2]
+
+    def get_all_records(self):
+        self.full_reads += 1
+        return [dict(zip(self.header, numericise_all(row))) for row in self.rows]
+
+    def get_all_values(self):
+        self.full_reads += 1
+        return [list(self.header)] + [list(row) for row in self.rows]
+
+    def get_range(self, a1):
+        """'1:1', 'B3', 'A3:K', 'C2:C' 형태의 범위를 Sheets API처럼 잘라서 반환"""
+        grid = [self.header] + self.rows
+        start, _, end = a1.partition(':')
+        end = end or start
+
+        def parse(ref):
+            letters = ''.join(c for c in ref if c.isalpha())
+            digits = ''.join(c for c in ref if c.isdigit())
+            col = a1_to_rowcol(f'{letters}1')[1] if letters else None
+            return (int(digits) if digits else None), col
+
+        start_row, start_col = parse(start)
+        end_row, end_col = parse(end)
+        values = []
+        for row in grid[(start_row or 1) - 1:end_row or len(grid)]:
+            cells = list(row[(start_col or 1) - 1:end_col or len(row)])
+            while cells and cells[-1] == '':
+                cells.pop()
+            values.append(cells)
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+    def batch_get(self, ranges):
+        self.batch_get_calls.append(list(ranges))
+        return [self.get_range(a1) for a1 in ranges]
+
+    def batch_update(self, data):
+        self.batch_calls.append(data)
+        if any(item['range'] in self.fail_ranges for item in data):
+            raise RuntimeError('quota exceeded')
+
+
+class FakeSpreadsheet:
+    def __init__(self, sheet, key='sheet-id', title='감귤 주문서(응답)'):
+        self.id = key
+        self.title = title
+        self.sheet1 = sheet
+
+    def get_lastUpdateTime(self):
+        return self.sheet1.revision
+
+    def get_worksheet_by_id(self, worksheet_id):
+        if worksheet_id != self.sheet1.id:
+            raise gspread.exceptions.WorksheetNotFound(worksheet_id)
+        return self.sheet1
+
+
+class FakeClient:
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+        self.calls = []
+
+    def open(self, title):
+        self.calls.append(('open', title))
+        return self.spreadsheet
+
+    def open_by_key(self, key):
+        self.calls.append(('open_by_key', key))
+        if key != self.spreadsheet.id:
+            raise gspread.exceptions.SpreadsheetNotFound(key)
+        return self.spreadsheet
+
+
+def make_handler(sheet, state_file, rows=(), batch_size=100):
+    """FakeClient를 백엔드로 생성자를 거쳐 만든 핸들러"""
+    config = types.SimpleNamespace(
+        STATE_FILE=str(state_file),
+        SNAPSHOT_CACHE_ENABLED=False,
+        CONFIRM_BATCH_SIZE=batch_size,
+        SPREADSHEET_NAME='감귤 주문서(응답)',
+        SPREADSHEET_ID=None,
+        REQUIRED_COLUMNS=HEADER,
+        PRODUCT_CATALOG=[{'name': '5kg', 'price': 20000}, {'name': '10kg', 'price': 35000}],
+        FETCH_MODE='incremental',
+        PROJECTED_FETCH=False,
+        INGESTION_ENGINE='python',
+        STREAM_CHUNK_SIZE=1000,
+    )
+    handler = GoogleSheetHandler(
+        config, RequestScheduler(sleep=lambda seconds: None), backend=FakeClient(FakeSpreadsheet(sheet))
+    )
+    handler.sheet = sheet
+    handler.new_order_rows = list(rows)
+    return handler
+
+
+@pytest.mark.parametrize(
+    "rows,expected",
+    [
+        ([], []),
+        ([5], [(5, 5)]),
+        ([2, 3, 4], [(2, 4)]),
+        ([7, 2, 3, 9, 10, 3], [(2, 3), (7, 7), (9, 10)]),
+    ],
+)
+def test_coalesce_rows(rows, expected):
+    assert GoogleSheetHandler._coalesce_rows(rows) == expected
+
+
+def test_mark_orders_as_confirmed_single_batch(tmp_path):
+    sheet = FakeWorksheet(['타임스탬프', '비고'])
+    handler = make_handler(sheet, tmp_path / 'state.json', [2, 3, 4, 8])
+
+    results = handler.mark_orders_as_confirmed()
+
+    assert results == {'B2:B4': True, 'B8:B8': True}
+    assert len(sheet.batch_calls) == 1
+    assert sheet.batch_calls[0][0]['values'] == [['확인']] * 3
+    assert handler.new_order_rows == []
+
+
+def test_mark_orders_as_confirmed_keeps_failed_rows_for_retry(tmp_path):
+    sheet = FakeWorksheet(['타임스탬프', '비고'], fail_ranges={'B8:B9'})
+    handler = make_handler(sheet, tmp_path / 'state.json', [2, 3, 8, 9], batch_size=1)
+
+    with pytest.raises(SpreadsheetError):
+        handler.mark_orders_as_confirmed()
+
+    assert handler.last_confirmation_results == {'B2:B3': True, 'B8:B9': False}
+    assert handler.new_order_rows == [8, 9]
+
+    sheet.fail_ranges.clear()
+    assert handler.mark_orders_as_confirmed() == {'B8:B9': True}
+
+
+def test_mark_orders_as_confirmed_stops_at_first_failed_batch(tmp_path):
+    sheet = FakeWorksheet(['타임스탬프', '비고'], fail_ranges={'B3:B3'})
+    handler = make_handler(sheet, tmp_path / 'state.json', [3, 5], batch_size=1)
+
+    with pytest.raises(SpreadsheetError):
+        handler.mark_orders_as_confirmed()
+
+    # 실패한 범위 뒤의 범위는 보내지 않아야 다음 실행에서 3행이 다시 조회됨
+    assert len(sheet.batch_calls) == 1
+    assert handler.last_confirmation_results == {'B3:B3': False, 'B5:B5': False}
+    assert handler.new_order_rows == [3, 5]
+
+
+def test_parse_korean_timestamps_converts_column_and_masks_bad_rows():
+    values = pd.Series(
+        ['2024. 12. 5. 오후 3:45:23', '2024. 1. 2. 오전 12:00:01', '2024. 12. 5. 오후 12:10:00',
+         '잘못된 값', '2024. 2. 30. 오전 1:00:00', None],
+        index=[3, 4, 5, 6, 7, 8],
+    )
+    parsed, invalid = GoogleSheetHandler._parse_korean_timestamps(values)
+
+    assert list(parsed.index) == [3, 4, 5, 6, 7, 8]
+    assert list(parsed[:3]) == [
+        pd.Timestamp('2024-12-05 15:45:23'),
+        pd.Timestamp('2024-01-02 00:00:01'),
+        pd.Timestamp('2024-12-05 12:10:00'),
+    ]
+    assert list(invalid) == [False, False, False, True, True, True]
+    assert GoogleSheetHandler._parse_korean_timestamp('2024. 12. 5. 오후 3:45:23') == parsed[3]
+    with pytest.raises(DataParsingError):
+        GoogleSheetHandler._parse_korean_timestamp('잘못된 값')
+
+
+def test_invalid_rows_are_flagged_and_quarantined(tmp_path):
+    rows = [make_row(1), make_row(2), make_row(3), make_row(4)]
+    rows[0][0] = 'oops'
+    rows[2][7] = ''
+    rows[3][8] = '3kg'
+    handler = make_handler(FakeWorksheet(HEADER, rows), tmp_path / 'state.json')
+
+    # 잘못된 행이 있어도 중단하지 않고 행별 오류만 기록
+    orders = handler.get_new_orders()
+    assert orders['validation_error'].tolist() == [
+        '타임스탬프 형식 오류',
+        None,
+        '받으실분 연락처 (핸드폰번호) 누락',
+        '유효하지 않은 상품 타입: "3kg"',
+    ]
+
+    valid = handler.quarantine_invalid_orders(orders)
+    assert list(valid.index) == [1]
+    assert handler.new_order_rows == [3]
+    assert sorted(handler.state_store.get_item('quarantine', '감귤 주문서(응답)')) == ['2', '4', '5']
+
+
+def test_compact_dtypes_keeps_values(tmp_path):
+    rows = [make_row(day, '확인' if day == 1 else '') for day in range(1, 7)]
+    rows[2][9] = ''
+    rows[3][10] = '3박스'
+    handler = make_handler(FakeWorksheet(HEADER, rows), tmp_path / 'state.json')
+    df = handler.get_new_orders()
+
+    assert isinstance(df['보내는분 성함'].dtype, pd.CategoricalDtype)
+    assert isinstance(df['비고'].dtype, pd.CategoricalDtype)
+    assert str(df['5kg 수량'].dtype) == 'Int64'
+    assert df['5kg 수량'].isna().sum() == 1
+    # 숫자가 아닌 값이 있는 컬럼은 원래 값 유지
+    assert str(df['10kg 수량'].dtype) != 'Int64' and '3박스' in df['10kg 수량'].tolist()
+    assert handler.new_order_rows == [3, 4, 5, 6, 7]
+
+
+@pytest.mark.parametrize("projected", [False, True])
+def test_incremental_fetch_reads_only_rows_after_watermark(tmp_path, projected):
+    rows = [make_row(1, '확인'), make_row(2, '확인'), make_row(3), make_row(4)]
+    sheet = FakeWorksheet(HEADER, rows)
+    handler = make_handler(sheet, tmp_path / 'state.json')
+    handler.config.PROJECTED_FETCH = projected
+
+    # 첫 실행은 워터마크가 없으므로 전체 조회
+    first = handler.get_new_orders()
+    assert sheet.full_reads == (0 if projected else 1)
+    assert handler.new_order_rows == [4, 5]
+    handler.mark_orders_as_confirmed()
+    for row in sheet.rows:
+        row[1] = '확인'
+
+    sheet.rows.append(make_row(5))
+    second = handler.get_new_orders()
+    assert sheet.full_reads == (0 if projected else 1)
+    assert all(a1[1:].startswith('6:') for a1 in sheet.batch_get_calls[-1][2:])
+    assert handler.new_order_rows == [6]
+    assert list(second.columns) == list(first.columns)
+    assert second.iloc[0]['5kg 수량'] == first.iloc[0]['5kg 수량'] == 2
+
+
+def test_incremental_fetch_falls_back_when_watermark_row_edited(tmp_path):
+    rows = [make_row(1, '확인'), make_row(2, '확인'), make_row(3)]
+    sheet = FakeWorksheet(HEADER, rows)
+    handler = make_handler(sheet, tmp_path / 'state.json')
+    handler.get_new_orders()
+
+    # 누군가 '확인'을 지움
+    sheet.rows[1][1] = ''
+    handler.get_new_orders()
+
+    assert sheet.full_reads == 2
+    assert handler.new_order_rows == [3, 4]
+
+
+@pytest.mark.parametrize("projected", [False, True])
+def test_streaming_fetch_yields_bounded_chunks(tmp_path, projected):
+    rows = [make_row(day, '확인' if day <= 3 else '') for day in range(1, 12)]
+    sheet = FakeWorksheet(HEADER, rows)
+    handler = make_handler(sheet, tmp_path / 'state.json')
+    handler.config.PROJECTED_FETCH = projected
+    expected = handler.get_new_orders()
+    handler.state_store.delete('watermarks')
+
+    chunks = list(handler.iter_new_orders(chunk_size=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 3, 2]
+    assert handler.new_order_rows == list(range(5, 13))
+    pd.testing.assert_frame_equal(
+        handler._compact_dtypes(pd.concat(chunks)), expected, check_categorical=False
+    )
+    # '비고' 컬럼 조회 이후에는 chunk_size 행을 넘는 범위를 읽지 않음
+    for ranges in sheet.batch_get_calls[-3:]:
+        for a1 in ranges:
+            start, end = (a1_to_rowcol(cell)[0] for cell in a1.split(':'))
+            assert end - start + 1 <= 3
+    assert handler._load_watermark() == 4
+
+
+@pytest.mark.parametrize("blank", [[4], [4, 5]])
+def test_streaming_fetch_reads_past_blank_rows(tmp_path, blank):
+    rows = [make_row(day, '확인' if day == 1 else '') for day in range(1, 7)]
+    for row in blank:
+        rows[row - 2] = [''] * len(HEADER)
+    handler = make_handler(FakeWorksheet(HEADER, rows), tmp_path / 'state.json')
+    handler.config.FETCH_MODE = 'full'
+    handler.get_new_orders()
+    expected = handler.new_order_rows
+    handler.state_store.delete('watermarks')
+
+    # 청크 끝의 빈 행은 API가 잘라 반환하므로 짧은 청크가 나와도 시트 끝까지 읽어야 함
+    chunks = list(handler.iter_new_orders(chunk_size=2))
+
+    assert handler.new_order_rows == expected == [3, 4, 5, 6, 7]
+    assert [idx + 2 for chunk in chunks for idx in chunk.index] == expected
+
+
+def test_unchanged_revision_is_served_from_snapshot(tmp_path):
+    sheet = FakeWorksheet(HEADER, [make_row(1, '확인'), make_row(2)])
+    handler = make_handler(sheet, tmp_path / 'state.json')
+    handler.config.FETCH_MODE = 'full'
+    handler.snapshot_cache = SnapshotCache(str(tmp_path / 'snapshots'))
+
+    first = handler.get_new_orders()
+    second = handler.get_new_orders()
+    assert sheet.full_reads == 1
+    assert second.equals(first)
+    assert handler.new_order_rows == [3]
+
+    sheet.revision = '2024-12-06T00:00:00.000Z'
+    handler.get_new_orders()
+    assert sheet.full_reads == 2
+
+    handler.invalidate_snapshot()
+    handler.get_new_orders()
+    assert sheet.full_reads == 3
+
+
+def test_projected_fetch_matches_full_fetch(tmp_path):
+    header = HEADER[:2] + ['이메일'] + HEADER[2:] + ['설문']
+    rows = []
+    for day in range(1, 5):
+        row = make_row(day, '확인' if day < 3 else '')
+        rows.append(row[:2] + [f'user{day}@example.com'] + row[2:] + ['좋아요'])
+    rows[-1][9] = ''  # 중간 빈 셀
+
+    full_sheet = FakeWorksheet(header, rows)
+    full = make_handler(full_sheet, tmp_path / 'full.json')
+    full.config.FETCH_MODE = 'full'
+    expected = full.get_new_orders()
+
+    projected_sheet = FakeWorksheet(header, rows)
+    projected = make_handler(projected_sheet, tmp_path / 'projected.json')
+    projected.config.FETCH_MODE = 'full'
+    projected.config.PROJECTED_FETCH = True
+    result = projected.get_new_orders()
+
+    assert len(projected_sheet.batch_get_calls) == 1
+    assert len(projected_sheet.batch_get_calls[0]) == 1 + len(HEADER)
+    pd.testing.assert_frame_equal(result, expected[HEADER + ['validation_error']])
+    assert projected.new_order_rows == full.new_order_rows == [4, 5]
+
+
+@pytest.mark.parametrize("projected", [False, True])
+def test_arrow_ingestion_matches_python_ingestion(tmp_path, projected):
+    pytest.importorskip('pyarrow')
+    rows = [make_row(day, '확인' if day == 1 else '') for day in range(1, 7)]
+    rows[2][4] = ''
+    rows[3][7] = '064-123-4567'
+    rows[4][10] = '3박스'
+    rows[5][0] = '잘못된 날짜'
+
+    results = {}
+    for engine in ('python', 'arrow'):
+        handler = make_handler(FakeWorksheet(HEADER, rows), tmp_path / f'{engine}.json')
+        handler.config.PROJECTED_FETCH = projected
+        handler.config.INGESTION_ENGINE = engine
+        results[engine] = (handler.get_new_orders(), handler.new_order_rows)
+
+    (expected, expected_rows), (result, result_rows) = results['python'], results['arrow']
+    assert result_rows == expected_rows == [3, 4, 5, 6, 7]
+    assert isinstance(result['받으실분 성함'].dtype, pd.ArrowDtype)
+    assert result['validation_error'].tolist() == expected['validation_error'].tolist()
+    pd.testing.assert_series_equal(result['타임스탬프'], expected['타임스탬프'])
+    pd.testing.assert_series_equal(result['5kg 수량'], expected['5kg 수량'])
+    for column in ('보내는분 연락처 (핸드폰번호)', '받으실분 연락처 (핸드폰번호)'):
+        assert (OrderProcessor.format_phone_numbers(result[column]).astype(str).tolist()
+                == OrderProcessor.format_phone_numbers(expected[column]).astype(str).tolist())
+
+
+def test_spreadsheet_key_is_cached_and_refreshed_when_stale(tmp_path):
+    sheet = FakeWorksheet(HEADER, [make_row(1)])
+    handler = make_handler(sheet, tmp_path / 'state.json')
+
+    handler.get_new_orders()
+    handler.get_new_orders()
+    assert handler.client.calls == [('open', '감귤 주문서(응답)'), ('open_by_key', 'sheet-id')]
+
+    # 시트가 새로 만들어져 키가 바뀐 경우 제목 검색으로 복구
+    handler.client.spreadsheet.id = 'new-id'
+    handler.get_new_orders()
+    handler.get_new_orders()
+    assert handler.client.calls[2:] == [
+        ('open_by_key', 'sheet-id'), ('open', '감귤 주문서(응답)'), ('open_by_key', 'new-id'),
+    ]
@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from utils.snapshot_cache import SnapshotCache
+
+
+def test_put_replaces_previous_revision(tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    cache.put('sheet', 'rev-1', {'rows': [1]})
+    cache.put('sheet', 'rev-2', {'rows': [2]})
+
+    assert cache.get('sheet', 'rev-1') is None
+    assert cache.get('sheet', 'rev-2') == {'rows': [2]}
+
+
+def test_evicts_least_recently_used_over_max_entries(tmp_path):
+    cache = SnapshotCache(str(tmp_path), max_entries=2)
+    cache.put('a', 'rev', 'A')
+    cache.put('b', 'rev', 'B')
+    past = time.time() - 60
+    os.utime(cache._path('a', 'rev'), (past, past))
+    cache.put('c', 'rev', 'C')
+
+    assert cache.get('a', 'rev') is None
+    assert cache.get('b', 'rev') == 'B'
+    assert cache.get('c', 'rev') == 'C'
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    cache = SnapshotCache(str(tmp_path), max_age_seconds=10)
+    cache.put('sheet', 'rev', 'value')
+    past = time.time() - 60
+    os.utime(cache._path('sheet', 'rev'), (past, past))
+
+    assert cache.get('sheet', 'rev') is None
+    assert not os.listdir(tmp_path)
+
+
+def test_invalidate_only_matching_spreadsheet(tmp_path):
+    cache = SnapshotCache(str(tmp_path))
+    cache.put('a', 'rev', 'A')
+    cache.put('b', 'rev', 'B')
+    cache.invalidate('a')
+
+    assert cache.get('a', 'rev') is None
+    assert cache.get('b', 'rev') == 'B'